@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Dataset Load Benchmark
+Compares cold-load time and peak memory of decoding the JSON data files against
+their binary MessagePack snapshots. Every measurement runs in a fresh
+interpreter so nothing is reused between loads.
+
+Usage:
+    python benchmarks/bench_dataset_load.py [--runs N]
+"""
+
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(PROJECT_ROOT, "utils"))
+
+from snapshot import read_snapshot, write_snapshot, snapshot_path
+
+
+def dataset_files():
+    """Pokemon, games, abilities and per-generation move files (no backups)"""
+    files = sorted(glob.glob(os.path.join(PROJECT_ROOT, "data", "*.json")))
+    return [
+        f
+        for f in files
+        if not f.endswith("_backup.json") and not f.endswith(".idx.json")
+    ]
+
+
+def _load(fmt: str, path: str):
+    if fmt == "json":
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    data = read_snapshot(path)
+    if data is None:
+        raise RuntimeError(f"No usable snapshot for {path}")
+    return data
+
+
+def worker(fmt: str, path: str, measure: str):
+    """Run a single cold load and print the measurement as JSON"""
+    if measure == "memory":
+        tracemalloc.start()
+        _load(fmt, path)
+        _, peak = tracemalloc.get_traced_memory()
+        print(json.dumps({"peak_bytes": peak}))
+    else:
+        start = time.perf_counter()
+        _load(fmt, path)
+        print(json.dumps({"seconds": time.perf_counter() - start}))
+
+
+def measure(fmt: str, path: str, measure_kind: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", fmt, path, measure_kind],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = 5
+    if "--runs" in sys.argv:
+        runs = int(sys.argv[sys.argv.index("--runs") + 1])
+
+    files = dataset_files()
+    for path in files:
+        if read_snapshot(path) is None:
+            with open(path, "r", encoding="utf-8") as f:
+                write_snapshot(json.load(f), path)
+
+    print("=== Dataset Load Benchmark ===")
+    print(f"Median of {runs} cold loads per file, fresh interpreter each")
+    print()
+    print(
+        f"{'File':<28} {'JSON size':>10} {'Snap size':>10} "
+        f"{'JSON ms':>9} {'Snap ms':>9} {'Speedup':>8} "
+        f"{'JSON peak':>10} {'Snap peak':>10}"
+    )
+
+    total_json = total_snap = 0.0
+    for path in files:
+        timings = {}
+        peaks = {}
+        for fmt in ("json", "snapshot"):
+            timings[fmt] = statistics.median(
+                measure(fmt, path, "time")["seconds"] for _ in range(runs)
+            )
+            peaks[fmt] = measure(fmt, path, "memory")["peak_bytes"]
+
+        total_json += timings["json"]
+        total_snap += timings["snapshot"]
+        print(
+            f"{os.path.basename(path):<28} "
+            f"{os.path.getsize(path) / 1024:>8.0f}KB "
+            f"{os.path.getsize(snapshot_path(path)) / 1024:>8.0f}KB "
+            f"{timings['json'] * 1000:>9.2f} {timings['snapshot'] * 1000:>9.2f} "
+            f"{timings['json'] / timings['snapshot']:>7.2f}x "
+            f"{peaks['json'] / 1024 / 1024:>8.1f}MB "
+            f"{peaks['snapshot'] / 1024 / 1024:>8.1f}MB"
+        )
+
+    print()
+    print(
+        f"Total: JSON {total_json * 1000:.1f} ms, snapshot {total_snap * 1000:.1f} ms "
+        f"({total_json / total_snap:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        worker(sys.argv[2], sys.argv[3], sys.argv[4])
+    else:
+        main()
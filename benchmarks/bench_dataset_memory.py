@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Dataset Memory Benchmark
+Loads every dataset at once (Pokemon, games, abilities and all generations of
+moves) and reports resident memory with and without string interning. Each
+variant runs in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_dataset_memory.py
+"""
+
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(PROJECT_ROOT, "utils"))
+
+from snapshot import read_snapshot
+from interning import intern_strings
+
+
+def dataset_files():
+    """Pokemon, games, abilities and per-generation move files (no backups)"""
+    files = sorted(glob.glob(os.path.join(PROJECT_ROOT, "data", "*.json")))
+    return [
+        f
+        for f in files
+        if not f.endswith("_backup.json") and not f.endswith(".idx.json")
+    ]
+
+
+def resident_bytes() -> int:
+    """Current resident set size of this process"""
+    with open("/proc/self/statm", "r") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def worker(variant: str):
+    """Load all datasets, keep them alive and print RSS growth as JSON"""
+    import gc
+
+    gc.collect()
+    before = resident_bytes()
+    start = time.perf_counter()
+
+    loaded = []
+    for path in dataset_files():
+        data = read_snapshot(path)
+        if data is None:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        if variant == "interned":
+            data = intern_strings(data)
+        loaded.append(data)
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    print(
+        json.dumps(
+            {
+                "rss_bytes": resident_bytes() - before,
+                "seconds": elapsed,
+                "files": len(loaded),
+            }
+        )
+    )
+
+
+def main():
+    print("=== Dataset Memory Benchmark ===")
+    print("Loading all datasets at once, fresh interpreter per variant")
+    print()
+
+    results = {}
+    for variant in ("plain", "interned"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--worker", variant],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results[variant] = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{variant:<9} {results[variant]['files']} files  "
+            f"RSS +{results[variant]['rss_bytes'] / 1024 / 1024:.1f} MB  "
+            f"load {results[variant]['seconds'] * 1000:.0f} ms"
+        )
+
+    saved = results["plain"]["rss_bytes"] - results["interned"]["rss_bytes"]
+    print()
+    print(
+        f"Interning saves {saved / 1024 / 1024:.1f} MB "
+        f"({saved / results['plain']['rss_bytes'] * 100:.0f}% of resident data)"
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        worker(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+HTTP Service Load Test
+Starts utils/http_service.py in a separate process on a free localhost port
+and drives it from several client threads over keep-alive connections.
+Reports requests/sec and latency percentiles for full responses and for
+ETag revalidations (If-None-Match -> 304).
+
+Usage:
+    python benchmarks/bench_http_service.py [--clients N] [--seconds S]
+"""
+
+import argparse
+import http.client
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE = os.path.join(PROJECT_ROOT, "utils", "http_service.py")
+
+# A mix of point lookups, listings and index queries
+REQUEST_MIX = [
+    "/pokemon/1",
+    "/pokemon/Bulbasaur",
+    "/pokemon/Pikachu/availability",
+    "/games",
+    "/games/Scarlet/pokemon",
+    "/query?type=Water&stat=speed%3E80",
+    "/moves/Thunderbolt?generation=3",
+    "/search?q=pikachu&limit=5",
+]
+
+
+def start_service():
+    """Launch the service on port 0 and return (process, port)"""
+    process = subprocess.Popen(
+        [sys.executable, "-u", SERVICE, "--port", "0", "--quiet"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    for line in process.stdout:
+        match = re.search(r"http://[^:]+:(\d+)/", line)
+        if match:
+            return process, int(match.group(1))
+    raise RuntimeError("Service exited before it started listening")
+
+
+def client(port, deadline, revalidate, latencies, errors):
+    """One keep-alive connection issuing the request mix until the deadline"""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    etags = {}
+    i = 0
+    while time.perf_counter() < deadline:
+        path = REQUEST_MIX[i % len(REQUEST_MIX)]
+        i += 1
+        headers = {"Accept-Encoding": "gzip"}
+        if revalidate and path in etags:
+            headers["If-None-Match"] = etags[path]
+
+        start = time.perf_counter()
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+
+        # Every path in the mix exists: anything but 2xx/304 is a failure
+        if not (200 <= response.status < 300 or response.status == 304):
+            errors.append((path, response.status))
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    connection.close()
+
+
+def run(port, clients, seconds, revalidate):
+    latencies = []
+    errors = []
+    deadline = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(
+            target=client, args=(port, deadline, revalidate, latencies, errors)
+        )
+        for _ in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    percentile = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+    label = "revalidate (304)" if revalidate else "full responses"
+    print(
+        f"{label:<17} {len(latencies) / elapsed:>8.0f} req/s   "
+        f"p50 {percentile(0.50) * 1000:.2f} ms   "
+        f"p95 {percentile(0.95) * 1000:.2f} ms   "
+        f"p99 {percentile(0.99) * 1000:.2f} ms   "
+        f"max {latencies[-1] * 1000:.2f} ms   "
+        f"mean {statistics.mean(latencies) * 1000:.2f} ms"
+        + (f"   failures {len(errors)} {sorted(set(errors))}" if errors else "")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print("=== HTTP Service Load Test ===")
+    process, port = start_service()
+    try:
+        print(f"Service on port {port}, {args.clients} keep-alive clients")
+        print()
+        run(port, args.clients, 1.0, False)  # warm-up
+        run(port, args.clients, args.seconds, False)
+        run(port, args.clients, args.seconds, True)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
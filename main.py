@@ -13,6 +13,7 @@ Project Structure:
 import os
 import sys
 import json
+import argparse
 from typing import Dict, Any
 
 # Add project paths
@@ -212,7 +213,8 @@ class PokemonDataOrchestrator:
         print()
         print("Tools & Management:")
         print("10. Data management tools - [BACKUP/VALIDATION TOOLS]")
-        print("11. Exit")
+        print("11. Interactive query shell - [READ ONLY]")
+        print("12. Exit")
         print()
 
     def data_management_menu(self):
@@ -225,9 +227,11 @@ class PokemonDataOrchestrator:
             print("4. Check Excel file status")
             print("5. Clean up duplicate entries")
             print("6. Reset specific dataset")
-            print("7. Return to main menu")
+            print("7. Restore data from backup")
+            print("8. Export static JSON API")
+            print("9. Return to main menu")
 
-            choice = input("Choose option (1-7): ").strip()
+            choice = input("Choose option (1-9): ").strip()
 
             if choice == "1":
                 self.backup_data()
@@ -242,27 +246,74 @@ class PokemonDataOrchestrator:
             elif choice == "6":
                 self.reset_dataset()
             elif choice == "7":
+                self.restore_backup()
+            elif choice == "8":
+                self.export_static_api()
+            elif choice == "9":
                 break
             else:
                 print("Invalid choice.")
             print()
 
     def backup_data(self):
-        """Create backup of all data files"""
-        import shutil
-        from datetime import datetime
+        """Snapshot all data files into the content-addressed backup store"""
+        from utils.backup_store import BackupStore, data_files_to_backup
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_dir = f"data/backups/backup_{timestamp}"
-        os.makedirs(backup_dir, exist_ok=True)
+        store = BackupStore()
+        file_paths = data_files_to_backup()
+        file_paths.extend(p for p in DATA_FILES.values() if p not in file_paths)
 
-        for data_type, file_path in DATA_FILES.items():
-            if os.path.exists(file_path):
-                backup_path = os.path.join(backup_dir, os.path.basename(file_path))
-                shutil.copy2(file_path, backup_path)
-                print(f"  Backed up {data_type} to {backup_path}")
+        result = store.snapshot(file_paths)
+
+        if result["created"]:
+            print(
+                f"  Stored {result['new_objects']} new blobs "
+                f"({result['bytes_written']:,} bytes compressed)"
+            )
+            print(
+                f"Backup completed: {result['snapshot_id']} ({result['files']} files)"
+            )
+        else:
+            print(f"No changes since {result['snapshot_id']} - nothing to back up")
+        print(f"  Backup store size: {store.store_size():,} bytes")
+
+    def restore_backup(self):
+        """Restore data files from a backup snapshot"""
+        from utils.backup_store import BackupStore
+
+        store = BackupStore()
+        snapshots = store.list_snapshots()
+        if not snapshots:
+            print("No backups found")
+            return
+
+        print("Available backups:")
+        for i, snapshot_id in enumerate(snapshots, 1):
+            manifest = store.load_manifest(snapshot_id) or {}
+            print(f"{i}. {snapshot_id} ({len(manifest.get('files', {}))} files)")
 
-        print(f"Backup completed in {backup_dir}")
+        choice = input("Choose backup to restore (number or 'cancel'): ").strip()
+        if choice.lower() == "cancel":
+            return
+
+        try:
+            snapshot_id = snapshots[int(choice) - 1]
+        except (ValueError, IndexError):
+            print("Invalid choice")
+            return
+
+        confirm = (
+            input(f"Restore {snapshot_id} over current data files? (y/n): ")
+            .strip()
+            .lower()
+        )
+        if confirm != "y":
+            return
+
+        restored = store.restore(snapshot_id)
+        for file_path in restored:
+            print(f"  Restored {file_path}")
+        print(f"Restore completed: {len(restored)} files changed")
 
     def validate_data(self):
         """Validate data integrity"""
@@ -319,6 +370,21 @@ class PokemonDataOrchestrator:
         print(f"Summary exported to {summary_file}")
         print(json.dumps(summary, indent=2))
 
+    def export_static_api(self):
+        """Export the datasets as a static, precompressed JSON file tree"""
+        from utils.static_export import export_static_api
+
+        try:
+            summary = export_static_api()
+        except FileNotFoundError as e:
+            print(f"Cannot export: {e}")
+            return
+        print(f"Exported {summary['shards']} files to {summary['out_dir']}")
+        print(
+            f"{summary['written']} written, {summary['unchanged']} unchanged, "
+            f"{summary['removed']} removed"
+        )
+
     def check_excel_status(self):
         """Check Excel file status and information"""
         excel_file = "Master_Pokedex_Database.xlsx"
@@ -405,11 +471,17 @@ class PokemonDataOrchestrator:
         except (ValueError, IndexError):
             print("Invalid choice")
 
+    def run_shell(self):
+        """Interactive query shell over the warm in-memory datasets"""
+        from utils.repl import run_shell
+
+        run_shell()
+
     def run(self):
         """Main program loop"""
         while True:
             self.show_menu()
-            choice = input("Choose option (1-11): ").strip()
+            choice = input("Choose option (1-12): ").strip()
 
             if choice == "1":
                 self.show_project_status()
@@ -450,6 +522,8 @@ class PokemonDataOrchestrator:
             elif choice == "10":
                 self.data_management_menu()
             elif choice == "11":
+                self.run_shell()
+            elif choice == "12":
                 print("Goodbye!")
                 break
             else:
@@ -460,8 +534,18 @@ class PokemonDataOrchestrator:
 
 def main():
     """Entry point"""
+    parser = argparse.ArgumentParser(description="Pokemon Data Collection System")
+    subcommands = parser.add_subparsers(dest="command")
+    subcommands.add_parser(
+        "shell", help="interactive query shell with the datasets loaded once"
+    )
+    args = parser.parse_args()
+
     orchestrator = PokemonDataOrchestrator()
-    orchestrator.run()
+    if args.command == "shell":
+        orchestrator.run_shell()
+    else:
+        orchestrator.run()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 from bs4 import BeautifulSoup
 import requests
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+from data_version import stamp_dataset_version
 
 url_base = "https://www.serebii.net/abilitydex/"
 ability_list = []
@@ -234,6 +239,7 @@ def export_to_json(abilities_data, filename="../data/abilities_data.json"):
     # Write JSON file
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(json_data, f, ensure_ascii=False, indent=2)
+    stamp_dataset_version(filename)
 
     print(f"JSON data exported to {filename}")
 
@@ -15,6 +15,8 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
 from grab_info import pk_names, get_all_games
+from views import refresh_views_after_save
+from data_version import stamp_dataset_version
 
 
 def parse_dex_info(text):
@@ -217,6 +219,8 @@ def scrape_game_dex_data(limit=None):
     print("Saving updated Pokemon data...")
     with open("../data/pokemon_data.json", "w") as f:
         json.dump(pokemon_data, f, indent=2)
+    refresh_views_after_save("../data/pokemon_data.json", pokemon_data)
+    stamp_dataset_version("../data/pokemon_data.json")
 
     print("Game dex data scraping completed!")
 
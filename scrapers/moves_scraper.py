@@ -9,12 +9,17 @@ import os
 import json
 import time
 import re
+import hashlib
 from typing import Dict, List, Any, Optional
 
 # Add project paths
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
 
 from config import PokeDataUtils, DATA_FILES, BASE_URLS
+from move_index import build_move_index
+from backup_store import BackupStore
+from learnset_index import update_learnset_index
+from data_version import stamp_dataset_version
 
 
 class MovesDataScraper:
@@ -1020,6 +1025,12 @@ class MovesDataScraper:
             )
         return moves_data
 
+    @staticmethod
+    def _move_hash(move: Dict[str, Any]) -> str:
+        """Content hash of a move record, independent of key order"""
+        payload = json.dumps(move, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
     def save_moves_data(self, moves_data: List[Dict[str, Any]]):
         """Save moves data to JSON file with smart merging"""
         # Use generation-specific filename with absolute path to project root
@@ -1042,33 +1053,44 @@ class MovesDataScraper:
             except Exception as e:
                 print(f"Warning: Could not read existing file: {e}")
 
-        # Merge new moves, avoiding duplicates
+        # Merge new moves by key in one pass, tracking which records really changed
         merged_moves = list(existing_moves.values())
-        new_move_count = 0
-        updated_move_count = 0
+        positions = {name: i for i, name in enumerate(existing_moves)}
+        added_moves = []
+        updated_moves = []
+        unchanged_move_count = 0
 
         for move in moves_data:
             move_name = move.get("name", "").lower()
-            if move_name in existing_moves:
-                # Update existing move
-                idx = next(
-                    i
-                    for i, m in enumerate(merged_moves)
-                    if m.get("name", "").lower() == move_name
-                )
-                merged_moves[idx] = move
-                updated_move_count += 1
-            else:
+            idx = positions.get(move_name)
+            if idx is None:
                 # Add new move
+                positions[move_name] = len(merged_moves)
                 merged_moves.append(move)
-                new_move_count += 1
+                added_moves.append(move.get("name", ""))
+            elif self._move_hash(merged_moves[idx]) != self._move_hash(move):
+                # Update existing move whose content changed
+                merged_moves[idx] = move
+                updated_moves.append(move.get("name", ""))
+            else:
+                unchanged_move_count += 1
+
+        new_move_count = len(added_moves)
+        updated_move_count = len(updated_moves)
 
-        # Create backup before saving if file exists
+        if os.path.exists(output_file) and not added_moves and not updated_moves:
+            print(
+                f"\n✅ No changes in {len(moves_data)} scraped moves - "
+                f"{output_file} left untouched"
+            )
+            return
+
+        # Back up the previous version into the content-addressed store
         if os.path.exists(output_file):
-            backup_file = output_file.replace(".json", "_backup.json")
             try:
-                os.rename(output_file, backup_file)
-                print(f"Created backup: {backup_file}")
+                store = BackupStore(os.path.join(project_root, "data", "backups"))
+                result = store.snapshot([output_file])
+                print(f"Created backup: {result['snapshot_id']}")
             except Exception as e:
                 print(f"Warning: Could not create backup: {e}")
 
@@ -1083,15 +1105,35 @@ class MovesDataScraper:
                 "merge_info": {
                     "new_moves": new_move_count,
                     "updated_moves": updated_move_count,
+                    "unchanged_moves": unchanged_move_count,
                     "total_after_merge": len(merged_moves),
+                    "added": added_moves,
+                    "updated": updated_moves,
                 },
             },
             "moves": merged_moves,
         }
 
-        # Save merged data
-        self.utils.save_json_data(structured_data, output_file)
+        # Save merged data (the version is stamped below, once the indexes match)
+        self.utils.save_json_data(structured_data, output_file, stamp_version=False)
         print(f"\n✅ Saved {len(merged_moves)} moves to {output_file}")
+
+        # Rebuild the move name -> byte offset index for random-access lookups
+        try:
+            build_move_index(output_file)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not build move index: {e}")
+
+        # Refresh this generation's slice of the Pokemon -> moves learnset index
+        try:
+            update_learnset_index(
+                os.path.dirname(output_file), self.generation, merged_moves
+            )
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not update learnset index: {e}")
+
+        # Stamp once, now that the derived indexes match the new file
+        stamp_dataset_version(output_file)
         if new_move_count > 0 or updated_move_count > 0:
             print(f"   - {new_move_count} new moves added")
             if updated_move_count > 0:
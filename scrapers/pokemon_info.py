@@ -3,6 +3,11 @@ import requests
 import json
 from typing import List, Dict
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+from views import refresh_views_after_save
+from data_version import stamp_dataset_version
 
 url_base = "https://www.serebii.net/pokemon"
 
@@ -185,4 +190,6 @@ if __name__ == "__main__":
 
     with open(output_path, "w") as f:
         json.dump(pokemons, f, indent=2)
+    refresh_views_after_save(output_path, pokemons)
+    stamp_dataset_version(output_path)
     print(f"Saved to {output_path}")
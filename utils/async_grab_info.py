@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - asyncio Query API
+Async variants of the grab_info query functions that never block the event
+loop on disk I/O or JSON decoding.
+
+All datasets and indexes are loaded once, in a worker thread, by preload()
+(called automatically by the first query). Queries then run directly on the
+loop against the shared in-memory data, without per-call file checks. A
+background task polls the data files and, when one changes, reloads it and
+rebuilds its indexes in the worker thread; queries keep using the previous
+version until the new one is swapped in.
+
+    import async_grab_info as grab
+
+    pokemon = await grab.get_pokemon_by_name("Garchomp")
+    dragons = await grab.query_all(grab.query().type("Dragon").in_game("Scarlet"))
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+try:
+    from . import grab_info
+    from .dataset_cache import assume_fresh
+except ImportError:
+    import grab_info
+    from dataset_cache import assume_fresh
+
+# How often the background task checks the data files for changes (seconds)
+DEFAULT_POLL_INTERVAL = 2.0
+
+# One thread for loads and rebuilds, so refreshes never overlap
+_reload_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="grab-info-reload"
+)
+
+# Per event loop: the preload task and the file watcher task
+_preloads: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+    weakref.WeakKeyDictionary()
+)
+_watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _watch(poll_interval: float):
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(poll_interval)
+        try:
+            await loop.run_in_executor(_reload_executor, grab_info.refresh_datasets)
+        except Exception as e:
+            print(f"Warning: Background dataset refresh failed: {e}")
+
+
+async def preload(poll_interval: Optional[float] = DEFAULT_POLL_INTERVAL) -> List[str]:
+    """
+    Load every dataset and index off the event loop and start watching the
+    files for changes (poll_interval=None disables watching). Returns the
+    datasets that were (re)loaded.
+    """
+    loop = asyncio.get_running_loop()
+    changed = await loop.run_in_executor(_reload_executor, grab_info.refresh_datasets)
+    watcher = _watchers.get(loop)
+    if poll_interval and (watcher is None or watcher.done()):
+        _watchers[loop] = loop.create_task(_watch(poll_interval))
+    return changed
+
+
+async def _ensure_ready():
+    loop = asyncio.get_running_loop()
+    task = _preloads.get(loop)
+    if task is None or (task.done() and task.exception() is not None):
+        task = _preloads[loop] = loop.create_task(preload())
+    if not task.done():
+        await task
+
+
+async def reload() -> List[str]:
+    """Check the data files now instead of waiting for the next poll"""
+    await _ensure_ready()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_reload_executor, grab_info.refresh_datasets)
+
+
+async def close():
+    """Stop watching the data files (for the running event loop)"""
+    loop = asyncio.get_running_loop()
+    _preloads.pop(loop, None)
+    watcher = _watchers.pop(loop, None)
+    if watcher is not None:
+        watcher.cancel()
+        try:
+            await watcher
+        except asyncio.CancelledError:
+            pass
+
+
+def _in_memory(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Async variant of a grab_info function that only touches loaded data"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        await _ensure_ready()
+        with assume_fresh():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _in_executor(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Async variant of a grab_info function that reads files per call"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        await _ensure_ready()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
+
+    return wrapper
+
+
+# Lookups and listings
+pk_names = _in_memory(grab_info.pk_names)
+pk_nat_numbers = _in_memory(grab_info.pk_nat_numbers)
+pk_abilities = _in_memory(grab_info.pk_abilities)
+pk_types = _in_memory(grab_info.pk_types)
+pk_base_stats = _in_memory(grab_info.pk_base_stats)
+get_pokemon_by_name = _in_memory(grab_info.get_pokemon_by_name)
+get_pokemon_by_number = _in_memory(grab_info.get_pokemon_by_number)
+get_pokemon_by_ref_id = _in_memory(grab_info.get_pokemon_by_ref_id)
+get_many = _in_memory(grab_info.get_many)
+
+# Attribute filters and stats
+pokemon_ids = _in_memory(grab_info.pokemon_ids)
+pokemon_from_ids = _in_memory(grab_info.pokemon_from_ids)
+get_pokemon_by_type = _in_memory(grab_info.get_pokemon_by_type)
+get_pokemon_by_ability = _in_memory(grab_info.get_pokemon_by_ability)
+get_pokemon_by_egg_group = _in_memory(grab_info.get_pokemon_by_egg_group)
+get_pokemon_by_growth_rate = _in_memory(grab_info.get_pokemon_by_growth_rate)
+get_top_pokemon = _in_memory(grab_info.get_top_pokemon)
+
+# Games and availability
+get_all_games = _in_memory(grab_info.get_all_games)
+get_games_by_generation = _in_memory(grab_info.get_games_by_generation)
+get_games_by_region = _in_memory(grab_info.get_games_by_region)
+get_generation_info = _in_memory(grab_info.get_generation_info)
+get_games_by_platform = _in_memory(grab_info.get_games_by_platform)
+get_pokemon_in_game = _in_memory(grab_info.get_pokemon_in_game)
+pokemon_ids_in_game = _in_memory(grab_info.pokemon_ids_in_game)
+is_pokemon_in_game = _in_memory(grab_info.is_pokemon_in_game)
+get_pokemon_game_availability = _in_memory(grab_info.get_pokemon_game_availability)
+count_pokemon_in_game = _in_memory(grab_info.count_pokemon_in_game)
+
+# Moves, learnsets, abilities and search
+get_move = _in_executor(grab_info.get_move)
+get_ability = _in_executor(grab_info.get_ability)
+get_pokemon_learnset = _in_memory(grab_info.get_pokemon_learnset)
+search_names = _in_memory(grab_info.search_names)
+cache_stats = _in_memory(grab_info.cache_stats)
+
+# Paginated listings
+page_pokemon = _in_memory(grab_info.page_pokemon)
+page_pokemon_in_game = _in_memory(grab_info.page_pokemon_in_game)
+page_query = _in_memory(grab_info.page_query)
+
+
+async def stream(page_function, *args, cursor=None, **kwargs):
+    """Async iterator over every item of a page_* listing, one page per await, e.g.
+
+    async for pokemon in stream(page_pokemon_in_game, "Scarlet"): ...
+    """
+    while True:
+        page = await page_function(*args, cursor=cursor, **kwargs)
+        for item in page["items"]:
+            yield item
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return
+
+
+# Query builder: build with query() (no I/O), run with query_all / query_count
+query = grab_info.query
+
+
+@_in_memory
+def query_all(built_query, fields=None) -> List[Any]:
+    """Matching Pokemon records of a query() built with the query builder."""
+    return built_query.all(fields)
+
+
+@_in_memory
+def query_count(built_query) -> int:
+    """Number of Pokemon matching a query() built with the query builder."""
+    return built_query.count()
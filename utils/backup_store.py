@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Content-Addressed Backup Store
+Saves each unique data file blob once (zlib-compressed) and records every
+snapshot as a small manifest mapping file paths to blob hashes.
+
+Layout:
+    data/backups/objects/ab/abcdef....z   - compressed blobs keyed by SHA-256
+    data/backups/snapshots/<id>.json      - per-snapshot manifests
+    data/backups/stat_cache.json          - size/mtime -> hash cache so unchanged
+                                            files are never re-read
+"""
+
+import glob
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+try:
+    from .data_version import is_source_dataset, stamp_dataset_version
+except ImportError:
+    from data_version import is_source_dataset, stamp_dataset_version
+
+BACKUP_ROOT = "data/backups"
+COMPRESSION_LEVEL = 6
+CHUNK_SIZE = 1024 * 1024
+
+
+class BackupStore:
+    """Content-addressed snapshot store for the data directory"""
+
+    def __init__(self, root: str = BACKUP_ROOT):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.snapshots_dir = os.path.join(root, "snapshots")
+        self.stat_cache_file = os.path.join(root, "stat_cache.json")
+        self._stat_cache = None
+
+    # ------------------------------------------------------------------
+    # Hashing helpers
+    # ------------------------------------------------------------------
+
+    def _load_stat_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._stat_cache is None:
+            try:
+                with open(self.stat_cache_file, "r", encoding="utf-8") as f:
+                    self._stat_cache = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._stat_cache = {}
+        return self._stat_cache
+
+    def _save_stat_cache(self):
+        if self._stat_cache is not None:
+            self._write_atomic(
+                self.stat_cache_file,
+                json.dumps(self._stat_cache, indent=2).encode("utf-8"),
+            )
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def file_digest(self, file_path: str) -> str:
+        """Return the SHA-256 of a file, reusing the cached hash if size/mtime match"""
+        stat = os.stat(file_path)
+        cache = self._load_stat_cache()
+        key = os.path.normpath(file_path)
+        cached = cache.get(key)
+        if (
+            cached
+            and cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return cached["sha256"]
+
+        sha = self._hash_file(file_path)
+        cache[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha,
+        }
+        return sha
+
+    def _object_path(self, sha: str) -> str:
+        return os.path.join(self.objects_dir, sha[:2], f"{sha}.z")
+
+    @staticmethod
+    def _write_atomic(path: str, payload: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def _store_object(self, file_path: str, sha: str) -> int:
+        """Store a blob if missing. Returns the number of compressed bytes written."""
+        object_path = self._object_path(sha)
+        if os.path.exists(object_path):
+            return 0
+
+        compressor = zlib.compressobj(COMPRESSION_LEVEL)
+        chunks = []
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                chunks.append(compressor.compress(chunk))
+        chunks.append(compressor.flush())
+        payload = b"".join(chunks)
+        self._write_atomic(object_path, payload)
+        return len(payload)
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def list_snapshots(self) -> List[str]:
+        """Return snapshot ids, oldest first"""
+        pattern = os.path.join(self.snapshots_dir, "*.json")
+        return sorted(
+            os.path.splitext(os.path.basename(p))[0] for p in glob.glob(pattern)
+        )
+
+    def load_manifest(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """Load a snapshot manifest by id"""
+        manifest_path = os.path.join(self.snapshots_dir, f"{snapshot_id}.json")
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def snapshot(self, file_paths: List[str]) -> Dict[str, Any]:
+        """
+        Snapshot the given files. Unchanged files cost one stat() call; new
+        content is compressed and stored once. If nothing changed since the
+        latest snapshot of the same set of files, no new manifest is written
+        and that snapshot is reused.
+        """
+        files = {}
+        new_objects = 0
+        bytes_written = 0
+
+        for file_path in sorted(set(file_paths)):
+            if not os.path.isfile(file_path):
+                continue
+            sha = self.file_digest(file_path)
+            written = self._store_object(file_path, sha)
+            if written:
+                new_objects += 1
+                bytes_written += written
+            files[os.path.normpath(file_path)] = {
+                "sha256": sha,
+                "size": os.path.getsize(file_path),
+            }
+
+        self._save_stat_cache()
+
+        # Compare with the latest snapshot of the same files: single-file
+        # snapshots (e.g. before a moves save) must not hide an unchanged full one
+        for previous_id in reversed(self.list_snapshots()):
+            previous = self.load_manifest(previous_id)
+            if not previous or previous.get("files", {}).keys() != files.keys():
+                continue
+            if previous["files"] == files:
+                return {
+                    "snapshot_id": previous_id,
+                    "created": False,
+                    "files": len(files),
+                    "new_objects": 0,
+                    "bytes_written": 0,
+                }
+            break
+
+        base_id = datetime.now().strftime("backup_%Y%m%d_%H%M%S")
+        snapshot_id = base_id
+        suffix = 1
+        while os.path.exists(os.path.join(self.snapshots_dir, f"{snapshot_id}.json")):
+            snapshot_id = f"{base_id}-{suffix}"
+            suffix += 1
+
+        manifest = {
+            "snapshot_id": snapshot_id,
+            "created_at": datetime.now().isoformat(),
+            "files": files,
+        }
+        self._write_atomic(
+            os.path.join(self.snapshots_dir, f"{snapshot_id}.json"),
+            json.dumps(manifest, indent=2).encode("utf-8"),
+        )
+
+        return {
+            "snapshot_id": snapshot_id,
+            "created": True,
+            "files": len(files),
+            "new_objects": new_objects,
+            "bytes_written": bytes_written,
+        }
+
+    def restore(
+        self,
+        snapshot_id: str,
+        file_paths: Optional[List[str]] = None,
+        target_dir: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Restore files from a snapshot. Files whose current content already
+        matches the snapshot are left untouched. If target_dir is given, files
+        are written there (keeping their base names) instead of in place.
+        Without file_paths only source datasets are restored, so derived files
+        in older snapshots (e.g. the dataset version manifest) are never rolled
+        back. Restoring in place bumps the dataset version once, after every
+        file is written, which tells running readers to reload. Returns the
+        list of paths that were written.
+        """
+        manifest = self.load_manifest(snapshot_id)
+        if manifest is None:
+            raise ValueError(f"Snapshot not found: {snapshot_id}")
+
+        wanted = None
+        if file_paths is not None:
+            wanted = {os.path.normpath(p) for p in file_paths}
+
+        restored = []
+        for file_path, entry in manifest["files"].items():
+            if wanted is not None and file_path not in wanted:
+                continue
+            if wanted is None and not is_source_dataset(file_path):
+                continue
+
+            destination = file_path
+            if target_dir:
+                destination = os.path.join(target_dir, os.path.basename(file_path))
+
+            if (
+                os.path.isfile(destination)
+                and self.file_digest(destination) == entry["sha256"]
+            ):
+                continue
+
+            with open(self._object_path(entry["sha256"]), "rb") as f:
+                payload = zlib.decompress(f.read())
+            if hashlib.sha256(payload).hexdigest() != entry["sha256"]:
+                raise ValueError(f"Corrupt backup object for {file_path}")
+
+            self._write_atomic(destination, payload)
+            restored.append(destination)
+
+        if restored and not target_dir:
+            # One stamp per data directory once every file is back, so hot
+            # reload never swaps in a mix of old and restored datasets
+            by_dir: Dict[str, List[str]] = {}
+            for path in restored:
+                by_dir.setdefault(os.path.dirname(os.path.abspath(path)), []).append(
+                    path
+                )
+            for paths in by_dir.values():
+                stamp_dataset_version(*paths)
+
+        self._save_stat_cache()
+        return restored
+
+    def store_size(self) -> int:
+        """Total bytes used by stored objects"""
+        total = 0
+        for dirpath, _, filenames in os.walk(self.objects_dir):
+            for filename in filenames:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+        return total
+
+
+def data_files_to_backup(data_dir: str = "data") -> List[str]:
+    """The source datasets present in the data directory"""
+    return sorted(
+        path
+        for path in glob.glob(os.path.join(data_dir, "*.json"))
+        if is_source_dataset(path)
+    )
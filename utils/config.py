@@ -5,11 +5,23 @@ Central configuration and shared utilities for all scrapers
 """
 
 import json
+import os
 import time
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any, Optional
 
+try:
+    from .snapshot import load_dataset, write_snapshot
+    from .fuzzy_search import normalize_name
+    from .views import refresh_views_after_save
+    from .data_version import is_source_dataset, stamp_dataset_version
+except ImportError:
+    from snapshot import load_dataset, write_snapshot
+    from fuzzy_search import normalize_name
+    from views import refresh_views_after_save
+    from data_version import is_source_dataset, stamp_dataset_version
+
 # Configuration
 BASE_URLS = {
     "serebii_pokemon": "https://www.serebii.net/pokemon/",
@@ -37,10 +49,9 @@ class PokeDataUtils:
 
     @staticmethod
     def load_json_data(file_path: str) -> List[Dict] | Dict:
-        """Load JSON data from file"""
+        """Load JSON data from file (via its binary snapshot when up to date)"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_dataset(file_path)
         except FileNotFoundError:
             return []
         except json.JSONDecodeError as e:
@@ -48,24 +59,32 @@ class PokeDataUtils:
             return []
 
     @staticmethod
-    def save_json_data(data: List[Dict] | Dict, file_path: str):
-        """Save data to JSON file"""
+    def save_json_data(
+        data: List[Dict] | Dict, file_path: str, stamp_version: bool = True
+    ):
+        """
+        Save data to JSON file and refresh its snapshot and views. Saving a
+        source dataset also bumps the dataset version, unless stamp_version
+        is False (the caller stamps once its derived indexes are written).
+        The file is replaced atomically, so readers that memory-mapped the
+        previous version keep a valid mapping.
+        """
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
+            tmp_path = f"{file_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, file_path)
+            write_snapshot(data, file_path)
+            refresh_views_after_save(file_path, data)
+            if stamp_version and is_source_dataset(file_path):
+                stamp_dataset_version(file_path)
         except Exception as e:
             print(f"Error saving {file_path}: {e}")
 
     @staticmethod
     def format_pokemon_name_for_url(name: str) -> str:
         """Format Pokemon name for URL usage"""
-        return (
-            name.lower()
-            .replace(" ", "")
-            .replace(".", "")
-            .replace("'", "")
-            .replace("-", "")
-        )
+        return normalize_name(name)
 
     @staticmethod
     def safe_request(url: str, delay: float = REQUEST_DELAY) -> Optional[BeautifulSoup]:
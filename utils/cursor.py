@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Cursor Pagination
+Page-at-a-time access to large result sets with opaque, resumable cursor
+tokens.
+
+Results are ordered by a stable key derived from the records themselves
+(e.g. national number, then ref_id), not by their position in the dataset
+file. A cursor holds the key of the last item returned, so paging resumes
+correctly even if the data was reloaded between pages: new items after
+that key show up, removed items are skipped, nothing repeats.
+
+Cursors are bound to the listing they came from (a scope such as
+"game:Scarlet"); passing one to a different listing raises ValueError.
+"""
+
+import base64
+import json
+from array import array
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .indexes import normalize_number
+except ImportError:
+    from indexes import normalize_number
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+Key = Tuple[Any, ...]
+
+# Sorts after every real dex number
+_LAST = 1 << 30
+
+
+class KeyOrder:
+    """Pokemon ids sorted by a stable key, with resume-after-key lookups"""
+
+    def __init__(self, keyed_ids: Iterable[Tuple[Key, int]]):
+        pairs = sorted(keyed_ids)
+        self.keys: List[Key] = [key for key, _ in pairs]
+        self.ids = array("I", (pokemon_id for _, pokemon_id in pairs))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def position_after(self, key: Optional[Key]) -> int:
+        """Index of the first entry ordered after key (0 for no key)"""
+        if key is None:
+            return 0
+        return bisect_right(self.keys, key)
+
+
+def encode_cursor(scope: str, key: Key) -> str:
+    """Opaque token for resuming a listing after key"""
+    payload = json.dumps({"s": scope, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    token: Optional[str], scope: str, key_types: Optional[Tuple[type, ...]] = None
+) -> Optional[Key]:
+    """
+    Key stored in a cursor token (None for no token). key_types, when
+    given, is the type of each key element; a key of another shape raises
+    ValueError instead of failing later when it is compared.
+    """
+    if token is None:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        token_scope, key = payload["s"], tuple(payload["k"])
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor") from None
+    if token_scope != scope:
+        raise ValueError("Cursor belongs to a different listing")
+    if key_types is not None and tuple(type(part) for part in key) != key_types:
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def paginate(
+    order: KeyOrder,
+    scope: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    bits: Optional[int] = None,
+    item: Callable[[int], Any] = lambda pokemon_id: pokemon_id,
+) -> Dict[str, Any]:
+    """
+    One page of a key-ordered listing: {"items": [...], "next_cursor": token
+    or None when this is the last page}. bits restricts the listing to a
+    Pokemon id bitmap; item turns each id into the returned item.
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
+    # Every key of a listing has the same shape: check the cursor against it
+    key_types = tuple(type(part) for part in order.keys[0]) if order.keys else None
+    position = order.position_after(decode_cursor(cursor, scope, key_types))
+    ids = order.ids
+    items = []
+    last = None
+    while position < len(ids):
+        pokemon_id = ids[position]
+        if bits is None or bits >> pokemon_id & 1:
+            if len(items) == page_size:
+                # Another match exists: this page is not the last one
+                return {"items": items, "next_cursor": encode_cursor(scope, last)}
+            items.append(item(pokemon_id))
+            last = order.keys[position]
+        position += 1
+    return {"items": items, "next_cursor": None}
+
+
+def pokemon_key(pokemon: Any) -> Key:
+    """Stable order for Pokemon: national number, then ref_id, name and form"""
+    number = normalize_number(pokemon.get("number"))
+    return (
+        number if number is not None else _LAST,
+        pokemon.get("ref_id") or "",
+        pokemon.get("name") or "",
+        pokemon.get("form") or "",
+    )
+
+
+def game_listing_key(pokemon: Any, game: str) -> Key:
+    """Stable order within a game: regional dex number, then pokemon_key()"""
+    game_data = (pokemon.get("game_appearances") or {}).get(game) or {}
+    dex_number = game_data.get("dex_number")
+    return (dex_number if isinstance(dex_number, int) and dex_number else _LAST,) + (
+        pokemon_key(pokemon)
+    )
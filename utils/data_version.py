@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Dataset Version Manifest
+Every save path stamps a monotonically increasing dataset version into a
+tiny manifest next to the data files, so long-running readers can notice
+new scrape results with a single stat() per poll instead of checking (or
+re-reading) every data file on every call.
+
+    data/dataset_version.json
+    {
+      "version": 42,
+      "updated_at": "2026-01-01T12:00:00",
+      "files": {"pokemon_data.json": {"version": 42, "size": ..., "mtime_ns": ...}}
+    }
+
+VersionWatcher polls the manifest in a background thread and calls back
+when the version moves; grab_info.start_hot_reload() uses it to rebuild the
+datasets and indexes off to the side and swap them in atomically.
+"""
+
+import contextlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: stamps from concurrent processes are not serialized
+    fcntl = None
+
+VERSION_FILENAME = "dataset_version.json"
+LOCK_FILENAME = ".dataset_version.lock"
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Source datasets besides the moves_data_genN.json files. Everything else in
+# data/ (old *_backup.json copies, sidecar indexes, the learnset index, this
+# manifest, summaries) is derived or bookkeeping and never bumps the version.
+SOURCE_DATASETS = (
+    "pokemon_data.json",
+    "pokemon_games.json",
+    "abilities_data.json",
+    "items_data.json",
+)
+_MOVES_DATASET = re.compile(r"^moves_data_gen\d+\.json$")
+
+
+def is_source_dataset(file_path: str) -> bool:
+    """True for a scraped source dataset (not a backup, index or manifest)"""
+    filename = os.path.basename(file_path)
+    return filename in SOURCE_DATASETS or bool(_MOVES_DATASET.match(filename))
+
+
+def version_manifest_path(data_dir: str) -> str:
+    return os.path.join(data_dir, VERSION_FILENAME)
+
+
+def read_version_manifest(data_dir: str) -> Optional[Dict[str, Any]]:
+    """The version manifest, or None if nothing has been stamped yet"""
+    try:
+        with open(version_manifest_path(data_dir), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def read_dataset_version(data_dir: str) -> int:
+    """Current dataset version (0 if nothing has been stamped yet)"""
+    manifest = read_version_manifest(data_dir)
+    return int(manifest.get("version", 0)) if manifest else 0
+
+
+@contextlib.contextmanager
+def _locked(data_dir: str) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(data_dir, LOCK_FILENAME), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def stamp_dataset_version(file_path: str, *more_paths: str) -> Optional[int]:
+    """
+    Save hook: record that file_path (and any more_paths in the same data
+    directory) was just written and bump the dataset version once, so
+    readers swap in the whole set together. Returns the new version (None
+    if the manifest could not be written - the save itself has already
+    succeeded).
+    """
+    data_dir = os.path.dirname(os.path.abspath(file_path))
+    try:
+        with _locked(data_dir):
+            manifest = read_version_manifest(data_dir) or {}
+            version = int(manifest.get("version", 0)) + 1
+            files = manifest.get("files") or {}
+            for path in (file_path,) + more_paths:
+                entry: Dict[str, Any] = {"version": version}
+                try:
+                    stat = os.stat(path)
+                    entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                except FileNotFoundError:
+                    pass
+                files[os.path.basename(path)] = entry
+
+            payload = {
+                "version": version,
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+                "files": files,
+            }
+            path = version_manifest_path(data_dir)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp_path, path)
+            return version
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Warning: Could not stamp dataset version: {e}")
+        return None
+
+
+class VersionWatcher:
+    """
+    Polls the version manifest from a daemon thread - one stat() per poll,
+    the file is only re-read when it changed - and calls on_change(version)
+    whenever the stamped version moves.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        on_change: Callable[[int], Any],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.data_dir = data_dir
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.version = read_dataset_version(data_dir)
+        self.checks = 0
+        self.changes = 0
+        self._signature: Any = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """Poll once; returns True if the version moved (on_change was called)"""
+        self.checks += 1
+        try:
+            stat = os.stat(version_manifest_path(self.data_dir))
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        version = read_dataset_version(self.data_dir)
+        if version == self.version:
+            return False
+        self.version = version
+        self.changes += 1
+        self.on_change(version)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Warning: Dataset reload failed: {e}")
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="dataset-version-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - In-Process Dataset Cache
+Keeps a decoded data file in memory and reloads it only when the file's
+mtime or size changes. Safe to share between threads.
+
+Inside assume_fresh() (e.g. on an asyncio event loop), or while a
+background watcher owns the dataset (watched), loaded data is served
+without the file check, and refresh() reloads in a background thread while
+readers keep using the previous version until the new one is fully built.
+"""
+
+import contextlib
+import contextvars
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    from .snapshot import load_dataset
+except ImportError:
+    from snapshot import load_dataset
+
+_assume_fresh = contextvars.ContextVar("assume_fresh", default=False)
+
+
+@contextlib.contextmanager
+def assume_fresh() -> Iterator[None]:
+    """
+    Serve already-loaded data without checking the file for changes (no
+    stat calls). Data that was never loaded is still loaded normally.
+    Context-local: applies to the current thread or asyncio task only.
+    """
+    token = _assume_fresh.set(True)
+    try:
+        yield
+    finally:
+        _assume_fresh.reset(token)
+
+
+class CachedDataset:
+    """Thread-safe cached loader for a single data file"""
+
+    def __init__(
+        self,
+        path: str,
+        loader: Callable[[str], Any] = load_dataset,
+        signature: Optional[Callable[[], Any]] = None,
+    ):
+        self.path = path
+        self.loader = loader
+        self.signature = signature
+        self.hits = 0
+        self.reloads = 0
+        # Bumped by invalidate(), so version() changes before the next load
+        self.invalidations = 0
+        # Set while a background watcher refreshes this dataset: get() then
+        # serves loaded data without checking the file (like assume_fresh())
+        self.watched = False
+        self._lock = threading.RLock()
+        self._data = None
+        self._signature: Any = None
+        self._derived: Dict[str, Tuple[Any, Any]] = {}
+        self._builders: Dict[str, Callable[[Any], Any]] = {}
+
+    def _stat_signature(self) -> Any:
+        # A custom signature lets derived files (e.g. an index built from several
+        # sources) be invalidated by changes to their inputs
+        if self.signature is not None:
+            return self.signature()
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self) -> Any:
+        """Return the cached data, reloading it first if the file changed"""
+        data = self._data
+        if data is not None and (self.watched or _assume_fresh.get()):
+            self.hits += 1
+            return data
+
+        signature = self._stat_signature()
+        with self._lock:
+            if self._data is not None and signature == self._signature:
+                self.hits += 1
+                return self._data
+
+            self._data = self.loader(self.path)
+            self._signature = signature
+            self._derived.clear()
+            self.reloads += 1
+            return self._data
+
+    def derived(self, name: str, builder: Callable[[Any], Any]) -> Any:
+        """
+        Return builder(data) for the current dataset version. The result (an
+        index, a view, ...) is built once and dropped when the file reloads.
+        """
+        data = self.get()
+        entry = self._derived.get(name)
+        if entry is not None and entry[0] is data:
+            return entry[1]
+        with self._lock:
+            self._builders[name] = builder
+            entry = self._derived.get(name)
+            if entry is not None and entry[0] is data:
+                return entry[1]
+            value = builder(data)
+            self._derived[name] = (data, value)
+            return value
+
+    def refresh(self) -> bool:
+        """
+        Reload now if the file changed, also rebuilding every derived
+        structure requested so far, then swap the new version in at once.
+        Readers are not blocked meanwhile and see the old version until the
+        swap. Returns True if a new version was loaded.
+        """
+        signature = self._stat_signature()
+        if self._data is not None and signature == self._signature:
+            return False
+
+        data = self.loader(self.path)
+        builders = dict(self._builders)
+        derived = {name: (data, builder(data)) for name, builder in builders.items()}
+        with self._lock:
+            self._data = data
+            self._signature = signature
+            self._derived = derived
+            self.reloads += 1
+        return True
+
+    def version(self) -> Any:
+        """
+        Token that changes whenever the data get() would serve changes: the
+        file signature plus the load and invalidation counters. Never loads
+        the data; inside assume_fresh() it does not stat the file either.
+        """
+        if self._data is not None and (self.watched or _assume_fresh.get()):
+            return (self.reloads, self.invalidations)
+        try:
+            return (self._stat_signature(), self.reloads, self.invalidations)
+        except FileNotFoundError:
+            return (None, self.reloads, self.invalidations)
+
+    def invalidate(self):
+        """Drop the cached data so the next get() reloads from disk"""
+        with self._lock:
+            self.invalidations += 1
+            self._data = None
+            self._signature = None
+            self._derived.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring"""
+        with self._lock:
+            return {
+                "path": self.path,
+                "hits": self.hits,
+                "reloads": self.reloads,
+                "loaded": self._data is not None,
+                "derived": sorted(self._derived),
+            }
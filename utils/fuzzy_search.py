@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Fuzzy Name Search
+Trigram index over Pokemon, move, ability and item names so lookups like
+"Farfetchd", "mr mime" or "thunder bolt" still find the right entry.
+
+Names are compared after normalize_name(), the same normalization
+PokeDataUtils.format_pokemon_name_for_url uses, plus accent folding.
+Results are ranked by the Dice coefficient of the two trigram sets.
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase and drop spaces, periods, apostrophes and hyphens"""
+    return (
+        name.lower().replace(" ", "").replace(".", "").replace("'", "").replace("-", "")
+    )
+
+
+def search_key(name: str) -> str:
+    """normalize_name() with accents and typographic apostrophes folded away"""
+    decomposed = unicodedata.normalize("NFKD", name.replace("’", "'"))
+    folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return normalize_name(folded)
+
+
+def trigrams(key: str) -> set:
+    """Trigrams of a search key, padded so short names still produce some"""
+    padded = f"$${key}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyNameIndex:
+    """
+    Trigram index over (name, kind) pairs, e.g. ("Mr. Mime", "pokemon").
+    Names that normalize to the same key within a kind ("Solar Beam",
+    "SolarBeam") are indexed once, keeping the first spelling seen.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        self.names: List[str] = []
+        self.kinds: List[str] = []
+        self.gram_counts: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+
+        seen = set()
+        for name, kind in entries:
+            if not name:
+                continue
+            key = search_key(name)
+            if (key, kind) in seen:
+                continue
+            seen.add((key, kind))
+
+            entry_id = len(self.names)
+            grams = trigrams(key)
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.gram_counts.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(entry_id)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        kinds: Optional[Iterable[str]] = None,
+        min_score: float = 0.3,
+    ) -> List[Dict[str, object]]:
+        """Best matches for query as [{"name", "kind", "score"}], best first"""
+        query_grams = trigrams(search_key(query))
+        if not query_grams:
+            return []
+
+        allowed = set(kinds) if kinds is not None else None
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for entry_id in self.postings.get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+
+        query_size = len(query_grams)
+        matches = []
+        for entry_id, common in shared.items():
+            if allowed is not None and self.kinds[entry_id] not in allowed:
+                continue
+            score = 2.0 * common / (query_size + self.gram_counts[entry_id])
+            if score >= min_score:
+                matches.append((score, entry_id))
+
+        matches.sort(key=lambda match: (-match[0], self.names[match[1]]))
+        return [
+            {
+                "name": self.names[entry_id],
+                "kind": self.kinds[entry_id],
+                "score": round(score, 3),
+            }
+            for score, entry_id in matches[:limit]
+        ]
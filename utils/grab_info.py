@@ -1,26 +1,373 @@
-import json
+import functools
+import hashlib
+import os
+import threading
+
+try:
+    from .cursor import KeyOrder, game_listing_key, paginate, pokemon_key
+    from .data_version import VersionWatcher, read_dataset_version
+    from .dataset_cache import CachedDataset
+    from .fuzzy_search import FuzzyNameIndex
+    from .indexes import GameAvailabilityIndex, InvertedIndex, PokemonLookupIndex
+    from .learnset_index import (
+        MoveLearnerIndex,
+        learnset_for,
+        learnset_key,
+        load_learnset_index,
+        moves_files,
+        moves_files_signature,
+    )
+    from .snapshot import load_dataset
+    from .move_index import MoveIndexReader
+    from .projection import project
+    from .query import Query, QuerySources
+    from .records import PokemonRecord, compact_records, memory_report
+    from .result_cache import ResultCache
+    from .section_store import LazyRecord, load_lazy_dataset
+    from .views import VIEWS_DIRNAME, MaterializedViews, build_views, views_are_current
+except ImportError:
+    from cursor import KeyOrder, game_listing_key, paginate, pokemon_key
+    from data_version import VersionWatcher, read_dataset_version
+    from dataset_cache import CachedDataset
+    from fuzzy_search import FuzzyNameIndex
+    from indexes import GameAvailabilityIndex, InvertedIndex, PokemonLookupIndex
+    from learnset_index import (
+        MoveLearnerIndex,
+        learnset_for,
+        learnset_key,
+        load_learnset_index,
+        moves_files,
+        moves_files_signature,
+    )
+    from snapshot import load_dataset
+    from move_index import MoveIndexReader
+    from projection import project
+    from query import Query, QuerySources
+    from records import PokemonRecord, compact_records, memory_report
+    from result_cache import ResultCache
+    from section_store import LazyRecord, load_lazy_dataset
+    from views import VIEWS_DIRNAME, MaterializedViews, build_views, views_are_current
+
+try:
+    from .stat_matrix import StatMatrix
+except ImportError:
+    try:
+        from stat_matrix import StatMatrix
+    except ImportError:  # numpy is optional for the plain lookup functions
+        StatMatrix = None
+
+_DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+# Shared caches: data is decoded once and reloaded only when the file changes.
+# Returned records are shared between callers and must be treated as read-only.
+_pokemon_cache = CachedDataset(os.path.join(_DATA_DIR, "pokemon_data.json"))
+_games_cache = CachedDataset(os.path.join(_DATA_DIR, "pokemon_games.json"))
+_abilities_cache = CachedDataset(os.path.join(_DATA_DIR, "abilities_data.json"))
+
+_learnset_cache = CachedDataset(
+    os.path.join(_DATA_DIR, "learnset_index.json"),
+    loader=lambda path: load_learnset_index(_DATA_DIR),
+    signature=lambda: moves_files_signature(_DATA_DIR),
+)
+
+# Files whose names feed the fuzzy search index: kind -> (path, list key).
+# Missing files are skipped.
+_NAME_SOURCES = {
+    "pokemon": (os.path.join(_DATA_DIR, "pokemon_data.json"), None),
+    "ability": (os.path.join(_DATA_DIR, "abilities_data.json"), "abilities"),
+    "item": (os.path.join(_DATA_DIR, "items_data.json"), "items"),
+}
+
+
+def _names_signature():
+    signature = [moves_files_signature(_DATA_DIR)]
+    for path, _ in _NAME_SOURCES.values():
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _records(data, key):
+    """Records of a dataset stored either as a list or as {key: [...]}."""
+    if isinstance(data, dict):
+        return data.get(key) or []
+    return data if isinstance(data, list) else []
+
+
+def _build_name_index(_path):
+    entries = []
+    for kind, (path, list_key) in _NAME_SOURCES.items():
+        if os.path.exists(path):
+            records = _records(load_dataset(path), list_key)
+            entries.extend((record.get("name"), kind) for record in records)
+    # Newest generation first so current move spellings win ("Solar Beam")
+    for _, path in sorted(moves_files(_DATA_DIR).items(), reverse=True):
+        records = _records(load_dataset(path), "moves")
+        entries.extend((record.get("name"), "move") for record in records)
+    return FuzzyNameIndex(entries)
+
+
+_names_cache = CachedDataset(
+    _DATA_DIR, loader=_build_name_index, signature=_names_signature
+)
+
+
+def _load_views(_path):
+    views = MaterializedViews.load(_DATA_DIR)
+    if views is None:
+        # Stale or missing on disk: compute them in memory, queries never write views
+        games_data = _load_games_data() if os.path.exists(_games_cache.path) else []
+        views = MaterializedViews.from_data(_load_pokemon_data(), games_data)
+    return views
+
+
+# Per-game listings and generation/region rollups materialized at save time,
+# loaded once per version of the two source datasets
+_views_cache = CachedDataset(
+    os.path.join(_DATA_DIR, VIEWS_DIRNAME),
+    loader=_load_views,
+    signature=lambda: (_pokemon_cache.version(), _games_cache.version()),
+)
+
+# Every shared cache, by name (for stats and background refreshes)
+_SHARED_CACHES = {
+    "pokemon": _pokemon_cache,
+    "games": _games_cache,
+    "abilities": _abilities_cache,
+    "learnsets": _learnset_cache,
+    "names": _names_cache,
+    # Last: refresh_datasets() writes and loads views after their sources
+    "views": _views_cache,
+}
+
+# Background reloader started by start_hot_reload()
+_hot_reload = None
+_hot_reload_lock = threading.Lock()
+
+# Results of repeated queries, keyed by the versions of the datasets they read
+_results = ResultCache()
+
+_move_readers = {}
+_move_readers_lock = threading.Lock()
+
+# Move -> learner bitmaps depend on both the Pokemon dataset (ids) and the
+# learnset index: (pokemon data, learnset index, MoveLearnerIndex)
+_move_learners = (None, None, None)
+_move_learners_lock = threading.Lock()
+
+
+def _projectable(func):
+    """Adds a fields=[...] keyword that projects the returned record(s).
+
+    Dotted paths select nested fields, e.g. fields=["name", "base_stats.speed"];
+    only those keys are read, nothing is deep-copied.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, fields=None, **kwargs):
+        return project(func(*args, **kwargs), fields)
+
+    return wrapper
 
 
 def _load_pokemon_data():
     """Helper function to load Pokemon data once and reuse it."""
-    import os
-
-    data_path = os.path.join(
-        os.path.dirname(__file__), "..", "data", "pokemon_data.json"
-    )
-    with open(data_path, "r") as file:
-        return json.load(file)
+    return _pokemon_cache.get()
 
 
 def _load_games_data():
     """Helper function to load Pokemon games data once and reuse it."""
-    import os
-
-    data_path = os.path.join(
-        os.path.dirname(__file__), "..", "data", "pokemon_games.json"
+    return _games_cache.get()
+
+
+def set_record_model(model):
+    """Chooses how Pokemon records are held and returned.
+
+    'dict' (default) returns the JSON dicts. 'compact' returns slotted PokemonRecords:
+    read-only Mappings with attribute access (record.base_stats.speed) that use far
+    less memory. 'lazy' returns LazyRecords whose dex_entries, game_appearances and
+    evolution_info are decoded from a side store on first access, for fast startup
+    when only names, types and stats are needed. record.to_dict() gives back the
+    JSON dict. Takes effect on next access.
+    """
+    if model == "dict":
+        _pokemon_cache.loader = load_dataset
+    elif model == "compact":
+        _pokemon_cache.loader = lambda path: compact_records(load_dataset(path))
+    elif model == "lazy":
+        _pokemon_cache.loader = load_lazy_dataset
+    else:
+        raise ValueError(
+            f"Unknown record model '{model}'. Use 'dict', 'compact' or 'lazy'"
+        )
+    _pokemon_cache.invalidate()
+
+
+def pokemon_memory_report():
+    """Returns bytes per Pokemon record as JSON dicts and as compact records."""
+    data = _load_pokemon_data()
+    return memory_report(
+        [p.to_dict() if isinstance(p, (PokemonRecord, LazyRecord)) else p for p in data]
     )
-    with open(data_path, "r") as file:
-        return json.load(file)
+
+
+def _lookup_index():
+    """Name/number/ref_id hash indexes for the current Pokemon dataset."""
+    return _pokemon_cache.derived("lookup", PokemonLookupIndex)
+
+
+def _inverted_index():
+    """Type/ability/egg group/growth rate inverted indexes for the current dataset."""
+    return _pokemon_cache.derived("inverted", InvertedIndex)
+
+
+def _game_index():
+    """Pokemon x game availability bitmaps for the current dataset."""
+    return _pokemon_cache.derived("games", GameAvailabilityIndex)
+
+
+def _move_learner_index():
+    """Move -> Pokemon id bitmaps for the current Pokemon and learnset data."""
+    global _move_learners
+    data = _load_pokemon_data()
+    learnsets = _learnset_cache.get()
+    cached_data, cached_learnsets, index = _move_learners
+    if cached_data is data and cached_learnsets is learnsets:
+        return index
+    with _move_learners_lock:
+        cached_data, cached_learnsets, index = _move_learners
+        if cached_data is data and cached_learnsets is learnsets:
+            return index
+        pokemon_ids = {}
+        for pokemon_id, pokemon in enumerate(data):
+            if pokemon.get("name"):
+                key = learnset_key(pokemon["name"], pokemon.get("form"))
+                pokemon_ids.setdefault(key, pokemon_id)
+        index = MoveLearnerIndex(learnsets, pokemon_ids)
+        _move_learners = (data, learnsets, index)
+        return index
+
+
+def dataset_version():
+    """Returns a short hash that changes whenever any data file changes."""
+    signature = list(_names_signature())
+    try:
+        stat = os.stat(_games_cache.path)
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    except FileNotFoundError:
+        signature.append(None)
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:16]
+
+
+def loaded_version():
+    """Returns a short hash that changes whenever the data served by the shared caches changes.
+
+    Cheaper than dataset_version(): it never lists the data directory, and while
+    hot reload runs (or inside assume_fresh()) it touches no files at all.
+    """
+    versions = tuple(cache.version() for cache in _SHARED_CACHES.values())
+    return hashlib.sha1(repr(versions).encode("utf-8")).hexdigest()[:16]
+
+
+def _save_views_if_stale():
+    """Writes data/views again if it was not built from the current source files."""
+    if views_are_current(_DATA_DIR):
+        return
+    try:
+        build_views(_DATA_DIR, _load_pokemon_data(), _load_games_data())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not build materialized views: {e}")
+
+
+def cache_stats():
+    """Returns hit and reload counters for the shared datasets and the result cache."""
+    stats = {name: cache.stats() for name, cache in _SHARED_CACHES.items()}
+    stats["results"] = _results.stats()
+    return stats
+
+
+def refresh_datasets():
+    """Reloads changed data files and rebuilds the common indexes, swapping each in atomically.
+
+    Also writes the materialized views if they are stale. Readers keep the
+    previous version until the swap. Returns the names of the datasets that
+    were (re)loaded.
+    """
+    changed = []
+    for name, cache in _SHARED_CACHES.items():
+        if cache is _views_cache:
+            _save_views_if_stale()
+        try:
+            if cache.refresh():
+                changed.append(name)
+        except FileNotFoundError:
+            continue
+
+    # refresh() rebuilds indexes that were already requested; build the rest now.
+    # The game bitmap reads every record's game_appearances, so with lazy
+    # records it is left to its first use instead of decoding every record.
+    try:
+        _lookup_index()
+        _inverted_index()
+        if _pokemon_cache.loader is not load_lazy_dataset:
+            _game_index()
+        _move_learner_index()
+        if StatMatrix is not None:
+            stat_matrix()
+    except FileNotFoundError:
+        pass
+    return changed
+
+
+def start_hot_reload(poll_interval=1.0):
+    """Loads everything now, then reloads in the background whenever a save stamps a new version.
+
+    Only the small dataset version manifest is polled. While hot reload runs,
+    queries use the loaded data without checking the data files per call, so
+    files edited by hand (not through a save path) are picked up only after
+    the next stamp.
+    """
+    global _hot_reload
+    with _hot_reload_lock:
+        if _hot_reload is not None:
+            return _hot_reload.version
+        refresh_datasets()
+        for cache in _SHARED_CACHES.values():
+            cache.watched = True
+        _hot_reload = VersionWatcher(
+            _DATA_DIR, lambda version: refresh_datasets(), poll_interval
+        )
+        _hot_reload.start()
+        return _hot_reload.version
+
+
+def stop_hot_reload():
+    """Stops background reloading; queries check the data files per call again."""
+    global _hot_reload
+    with _hot_reload_lock:
+        if _hot_reload is None:
+            return
+        _hot_reload.stop()
+        _hot_reload = None
+        for cache in _SHARED_CACHES.values():
+            cache.watched = False
+
+
+def stamped_version():
+    """Returns the dataset version last stamped by a save (0 if none yet)."""
+    return read_dataset_version(_DATA_DIR)
+
+
+def clear_result_cache(maxsize=None):
+    """Drops every cached query result; optionally sets a new capacity (0 disables)."""
+    _results.clear()
+    if maxsize is not None:
+        _results.resize(maxsize)
 
 
 def pk_names():
@@ -47,34 +394,154 @@ def pk_types():
     return [pokemon["types"] for pokemon in data]
 
 
+@_projectable
 def pk_base_stats():
     """Returns a list of all Pokemon base stats (each item is a dict with hp, attack, etc.)."""
     data = _load_pokemon_data()
     return [pokemon["base_stats"] for pokemon in data]
 
 
-def get_pokemon_by_name(name):
-    """Returns the complete data for a specific Pokemon by name."""
-    data = _load_pokemon_data()
-    for pokemon in data:
-        if pokemon["name"].lower() == name.lower():
-            return pokemon
-    return None
+@_projectable
+def get_pokemon_by_name(name, form=None):
+    """Returns the complete data for a specific Pokemon by name (optionally a specific form)."""
+    return _lookup_index().get_by_name(name, form)
 
 
+@_projectable
 def get_pokemon_by_number(number):
-    """Returns the complete data for a specific Pokemon by number (e.g., '#0001' or '1')."""
+    """Returns the complete data for a specific Pokemon by number (e.g., '#0001', '1' or 1)."""
+    return _lookup_index().get_by_number(number)
+
+
+@_projectable
+def get_pokemon_by_ref_id(ref_id):
+    """Returns the complete data for a specific Pokemon form by ref_id (e.g., '0001-00')."""
+    return _lookup_index().get_by_ref_id(ref_id)
+
+
+@_projectable
+def get_many(keys):
+    """Returns Pokemon data for several names, numbers or ref_ids (None where not found)."""
+    return _lookup_index().get_many(keys)
+
+
+# Attribute Filter Functions
+def pokemon_ids(attribute, value):
+    """Returns the id set of Pokemon with an attribute value.
+
+    attribute is 'type', 'ability', 'egg_group' or 'growth_rate'. Id sets combine
+    with & (and), | (or), - (and not) and ~ (not), e.g.
+    pokemon_ids("type", "Water") & pokemon_ids("type", "Ground").
+    """
+    return _inverted_index().lookup(attribute, value)
+
+
+@_projectable
+def pokemon_from_ids(ids):
+    """Returns the Pokemon records for an id set, in dataset order."""
+    return _inverted_index().records_for(ids)
+
+
+@_projectable
+@_results.cached(_pokemon_cache)
+def get_pokemon_by_type(*type_names):
+    """Returns all Pokemon that have every given type (e.g., 'Water', 'Ground')."""
+    index = _inverted_index()
+    ids = index.all()
+    for type_name in type_names:
+        ids &= index.lookup("type", type_name)
+    return index.records_for(ids)
+
+
+@_projectable
+@_results.cached(_pokemon_cache)
+def get_pokemon_by_ability(ability_name):
+    """Returns all Pokemon that can have a specific ability."""
+    index = _inverted_index()
+    return index.records_for(index.ids("ability", ability_name))
+
+
+@_projectable
+@_results.cached(_pokemon_cache)
+def get_pokemon_by_egg_group(egg_group):
+    """Returns all Pokemon in a specific egg group."""
+    index = _inverted_index()
+    return index.records_for(index.ids("egg_group", egg_group))
+
+
+@_projectable
+@_results.cached(_pokemon_cache)
+def get_pokemon_by_growth_rate(growth_rate):
+    """Returns all Pokemon with a specific growth rate (e.g., 'Medium Slow')."""
+    index = _inverted_index()
+    return index.records_for(index.ids("growth_rate", growth_rate))
+
+
+# Base Stat Analytics Functions (require numpy)
+def stat_matrix():
+    """Returns the NumPy base-stat matrix (StatMatrix) for the current dataset."""
+    if StatMatrix is None:
+        raise ImportError("numpy is required for stat analytics: pip install numpy")
+    return _pokemon_cache.derived("stats", StatMatrix)
+
+
+@_projectable
+@_results.cached(_pokemon_cache)
+def get_top_pokemon(weights, k=10, type_name=None, generation=None, **stat_ranges):
+    """Returns the k Pokemon with the highest weighted stat score, best first.
+
+    weights is a dict such as {"attack": 1, "speed": 1}. Optionally restrict to a
+    type, a generation, and stat ranges given as stat=(min, max), e.g. speed=(100, None).
+    """
+    matrix = stat_matrix()
+    mask = matrix.valid.copy()
+    if type_name is not None:
+        mask &= matrix.type_mask(type_name)
+    if generation is not None:
+        mask &= matrix.generation_mask(generation)
+    for stat, (minimum, maximum) in stat_ranges.items():
+        mask &= matrix.range_mask(stat, minimum, maximum)
+
     data = _load_pokemon_data()
-    # Handle both '#0001' and '1' formats
-    if isinstance(number, int):
-        number = f"#{number:04d}"
-    elif not number.startswith("#"):
-        number = f"#{int(number):04d}"
-
-    for pokemon in data:
-        if pokemon["number"] == number:
-            return pokemon
-    return None
+    return [data[i] for i in matrix.top_k(matrix.score(weights), k, mask=mask)]
+
+
+# Dataset Accessors (whole datasets and indexes, shared: treat as read-only)
+def data_dir():
+    """Returns the directory the datasets are read from."""
+    return _DATA_DIR
+
+
+def get_all_pokemon():
+    """Returns every Pokemon record, in dataset order."""
+    return _load_pokemon_data()
+
+
+def get_all_generations():
+    """Returns the games dataset: one entry per generation with region, platform and games."""
+    data = _load_games_data()
+    return data if isinstance(data, list) else []
+
+
+def game_availability_index():
+    """Returns the Pokemon x game availability bitmaps (GameAvailabilityIndex)."""
+    return _game_index()
+
+
+def learnset_index():
+    """Returns the Pokemon -> moves learnset index across generations."""
+    return _learnset_cache.get()
+
+
+def get_move_generations():
+    """Returns the generations that have a moves file, ascending."""
+    return sorted(moves_files(_DATA_DIR))
+
+
+def get_all_moves(generation):
+    """Returns every move record of a generation ([] if it has no moves file)."""
+    path = moves_files(_DATA_DIR).get(generation)
+    return _records(load_dataset(path), "moves") if path else []
 
 
 # Pokemon Games Functions
@@ -105,6 +572,7 @@ def get_games_by_region(region_name):
     return None
 
 
+@_projectable
 def get_generation_info(gen_number):
     """Returns complete information for a specific generation."""
     data = _load_games_data()
@@ -125,45 +593,242 @@ def get_games_by_platform(platform_name):
 
 
 # Game Appearance Functions
+@_projectable
+@_results.cached(_pokemon_cache, _games_cache)
 def get_pokemon_in_game(game_name):
     """Returns all Pokemon available in a specific game with their dex numbers."""
-    data = _load_pokemon_data()
-    pokemon_in_game = []
-
-    for pokemon in data:
-        if "game_appearances" in pokemon and game_name in pokemon["game_appearances"]:
-            game_data = pokemon["game_appearances"][game_name]
-            if game_data["available"]:
-                pokemon_in_game.append(
-                    {
-                        "name": pokemon["name"],
-                        "national_number": pokemon["number"],
-                        "game_dex_number": game_data["dex_number"],
-                    }
-                )
-
-    return sorted(
-        pokemon_in_game,
-        key=lambda x: x["game_dex_number"] if x["game_dex_number"] else 9999,
-    )
+    return _views_cache.get().listing(game_name)
 
 
-def get_pokemon_game_availability(pokemon_name):
-    """Returns all games where a specific Pokemon appears with dex numbers."""
-    data = _load_pokemon_data()
+def pokemon_ids_in_game(game_name):
+    """Returns the id set of Pokemon available in a game.
+
+    Combine with other id sets, e.g. "in Scarlet but not Sword":
+    pokemon_ids_in_game("Scarlet") - pokemon_ids_in_game("Sword").
+    """
+    return _game_index().in_game(game_name)
+
+
+def is_pokemon_in_game(pokemon_name, game_name):
+    """Returns True if a specific Pokemon is available in a specific game."""
+    pokemon = _lookup_index().get_by_name(pokemon_name)
+    if pokemon is None:
+        return False
+    game_data = (pokemon.get("game_appearances") or {}).get(game_name)
+    return bool(game_data and game_data.get("available"))
 
-    for pokemon in data:
-        if pokemon["name"].lower() == pokemon_name.lower():
-            if "game_appearances" in pokemon:
-                return pokemon["game_appearances"]
 
+@_projectable
+def get_pokemon_game_availability(pokemon_name):
+    """Returns all games where a specific Pokemon appears with dex numbers."""
+    pokemon = _lookup_index().get_by_name(pokemon_name)
+    if pokemon and "game_appearances" in pokemon:
+        return pokemon["game_appearances"]
     return None
 
 
+@_results.cached(_pokemon_cache, _games_cache)
 def count_pokemon_in_game(game_name):
     """Returns the total number of Pokemon available in a specific game."""
-    pokemon_in_game = get_pokemon_in_game(game_name)
-    return len(pokemon_in_game)
+    return _views_cache.get().count(game_name)
+
+
+@_projectable
+@_results.cached(_pokemon_cache, _games_cache)
+def get_generation_summary(gen_number):
+    """Returns a generation's region, platform and games with Pokemon counts per game."""
+    for generation in _views_cache.get().generations():
+        if generation["generation"] == gen_number:
+            return generation
+    return None
+
+
+@_projectable
+@_results.cached(_pokemon_cache, _games_cache)
+def get_region_summary(region_name):
+    """Returns a region's generations, games, platforms and distinct Pokemon available."""
+    for region, summary in _views_cache.get().regions().items():
+        if region.lower() == region_name.lower():
+            return summary
+    return None
+
+
+# Move Functions
+@_projectable
+def get_move(move_name, generation=None):
+    """Returns the data for a single move in a generation (decodes only that move).
+
+    Without a generation, the newest generation that has a moves file is used.
+    """
+    files = moves_files(_DATA_DIR)
+    if generation is None and files:
+        generation = max(files)
+    data_path = files.get(generation)
+    if data_path is None:
+        return None
+
+    with _move_readers_lock:
+        reader = _move_readers.get(data_path)
+        if reader is None or reader.is_stale():
+            # A replaced reader is not closed: other threads may still be
+            # decoding from it; its mapping is released with the last reference
+            reader = MoveIndexReader(data_path)
+            _move_readers[data_path] = reader
+    return reader.get(move_name)
+
+
+@_results.cached(_learnset_cache)
+def _learnsets(pokemon_name, generation, form):
+    learnsets = learnset_for(_learnset_cache.get(), pokemon_name, form, generation)
+    if generation is not None:
+        return learnsets.get(generation, [])
+    return learnsets
+
+
+def get_pokemon_learnset(pokemon_name, generation=None, form="Normal", fields=None):
+    """Returns the moves a Pokemon can learn with method and level.
+
+    With a generation, returns a list of {"move", "method", "level"} dicts (empty if
+    the Pokemon learns nothing there); without one, returns {generation: list}.
+    fields (e.g. ["move", "level"]) projects every move entry.
+    """
+    learnsets = _learnsets(pokemon_name, generation, form)
+    if fields is None or generation is not None:
+        return project(learnsets, fields)
+    return {gen: project(moves, fields) for gen, moves in learnsets.items()}
+
+
+# Ability Functions
+@_projectable
+def get_ability(ability_name):
+    """Returns the data for a single ability (descriptions, interactions), or None."""
+    if not os.path.exists(_abilities_cache.path):
+        return None
+    by_name = _abilities_cache.derived(
+        "by_name",
+        lambda data: {
+            ability["name"].casefold(): ability
+            for ability in _records(data, "abilities")
+            if ability.get("name")
+        },
+    )
+    return by_name.get(ability_name.casefold())
+
+
+# Search Functions
+def search_names(query, limit=10, kinds=None):
+    """Returns ranked fuzzy matches for a Pokemon, move, ability or item name.
+
+    Each result is {"name", "kind", "score"}; kind is 'pokemon', 'move', 'ability'
+    or 'item'. Pass kinds (e.g. ["pokemon"]) to restrict the search.
+    """
+    return _names_cache.get().search(query, limit=limit, kinds=kinds)
+
+
+# Paginated Listings
+def _pokemon_order():
+    return _pokemon_cache.derived(
+        "pokemon_order",
+        lambda data: KeyOrder(
+            (pokemon_key(pokemon), pokemon_id)
+            for pokemon_id, pokemon in enumerate(data)
+        ),
+    )
+
+
+def _game_order(game_name):
+    data = _load_pokemon_data()
+    index = _game_index()
+    orders = _pokemon_cache.derived("game_orders", lambda _data: {})
+    order = orders.get(game_name)
+    if order is None:
+        order = orders[game_name] = KeyOrder(
+            (game_listing_key(data[pokemon_id], game_name), pokemon_id)
+            for pokemon_id in index.dex_order.get(game_name, ())
+        )
+    return order
+
+
+def page_pokemon(page_size=100, cursor=None, fields=None):
+    """Returns one page of all Pokemon, ordered by national number then ref_id.
+
+    The result is {"items": [...], "next_cursor": token}; pass next_cursor back as
+    cursor for the following page (None means this was the last one).
+    """
+    data = _load_pokemon_data()
+    return paginate(
+        _pokemon_order(),
+        "pokemon",
+        page_size,
+        cursor,
+        item=lambda pokemon_id: project(data[pokemon_id], fields),
+    )
+
+
+def page_pokemon_in_game(game_name, page_size=100, cursor=None, fields=None):
+    """Returns one page of a game's regional dex listing (see page_pokemon)."""
+    data = _load_pokemon_data()
+
+    def entry(pokemon_id):
+        pokemon = data[pokemon_id]
+        game_data = pokemon["game_appearances"][game_name]
+        return project(
+            {
+                "name": pokemon["name"],
+                "national_number": pokemon["number"],
+                "game_dex_number": game_data.get("dex_number"),
+            },
+            fields,
+        )
+
+    return paginate(
+        _game_order(game_name), f"game:{game_name}", page_size, cursor, item=entry
+    )
+
+
+def page_query(built_query, page_size=100, cursor=None, fields=None):
+    """Returns one page of a query() result, ordered like page_pokemon."""
+    data = _load_pokemon_data()
+    return paginate(
+        _pokemon_order(),
+        f"query:{built_query!r}",
+        page_size,
+        cursor,
+        bits=built_query.ids().bits,
+        item=lambda pokemon_id: project(data[pokemon_id], fields),
+    )
+
+
+def stream(page_function, *args, cursor=None, **kwargs):
+    """Yields every item of a page_* listing, fetching one page at a time, e.g.
+
+    for pokemon in stream(page_pokemon_in_game, "Scarlet", fields=["name"]): ...
+    """
+    while True:
+        page = page_function(*args, cursor=cursor, **kwargs)
+        yield from page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return
+
+
+# Query Builder
+_query_sources = QuerySources(
+    inverted=_inverted_index,
+    games=_game_index,
+    learners=_move_learner_index,
+    matrix=stat_matrix if StatMatrix is not None else None,
+)
+
+
+def query():
+    """Starts a composable Pokemon query, e.g.
+
+    query().type("Dragon").in_game("Scarlet").stat("speed", ">", 100).learns("Dragon Dance").all()
+
+    Filters run most selective first against the indexes; call .explain() to see the plan.
+    """
+    return Query(_query_sources)
 
 
 # Example usage (uncomment to test)
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Local HTTP Query Service
+Read-only HTTP/JSON front end for grab_info, so several tools can share one
+resident copy of the datasets and indexes instead of each loading its own.
+
+Endpoints (GET only):
+    /pokemon                          all Pokemon names
+    /pokemon/{name|number|ref_id}     one Pokemon (?form=Alolan for a form)
+    /pokemon/{name}/availability      games the Pokemon appears in
+    /pokemon/{name}/learnset          ?generation=N&form=Normal
+    /query                            ?type=&ability=&egg_group=&growth_rate=
+                                      &in_game=&learns=&stat=speed>100&limit=
+    /games                            ?generation=N | ?region= | ?platform=
+    /games/{game}/pokemon             regional dex listing
+    /moves/{move}                     ?generation=N (default: newest)
+    /abilities/{ability}              ability details
+    /abilities/{ability}/pokemon      Pokemon that can have the ability
+    /search                           ?q=&kind=pokemon&limit=10
+    /stats                            cache counters
+
+Endpoints that return records also take ?fields=name,types,base_stats.speed
+to send only those fields.
+/pokemon, /query and /games/{game}/pokemon page with ?page_size=N; each page
+is {"items", "next_cursor"} and ?cursor=<next_cursor> fetches the next one.
+
+Responses carry an ETag derived from the loaded dataset versions and the
+request, so If-None-Match revalidation costs no query work (/stats is sent
+with Cache-Control: no-store instead); bodies over 1 KB are gzipped when the
+client accepts it. Connections are HTTP/1.1 keep-alive. The service reloads
+the datasets in the background whenever a save stamps a new dataset version,
+so requests do not check the data files.
+
+Usage:
+    python utils/http_service.py [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+try:
+    from . import grab_info
+    from .projection import json_default, normalize_fields, project
+    from .query import STAT_CONDITION
+except ImportError:
+    import grab_info
+    from projection import json_default, normalize_fields, project
+    from query import STAT_CONDITION
+
+GZIP_MIN_BYTES = 1024
+
+
+class _NotFound(Exception):
+    pass
+
+
+class _BadRequest(Exception):
+    pass
+
+
+def _param(params: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = params.get(name)
+    return values[-1] if values else None
+
+
+def _int_param(params: Dict[str, List[str]], name: str) -> Optional[int]:
+    value = _param(params, name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise _BadRequest(f"'{name}' must be an integer") from None
+
+
+def _positive_int_param(
+    params: Dict[str, List[str]], name: str, default: Optional[int] = None
+) -> Optional[int]:
+    value = _int_param(params, name)
+    if value is None:
+        return default
+    if value < 1:
+        raise _BadRequest(f"'{name}' must be a positive integer")
+    return value
+
+
+def _fields(params: Dict[str, List[str]]) -> Optional[List[str]]:
+    """?fields=name,types,base_stats.speed (repeatable) as a field list"""
+    values = params.get("fields")
+    if not values:
+        return None
+    try:
+        return list(normalize_fields(",".join(values)))
+    except ValueError as e:
+        raise _BadRequest(str(e)) from None
+
+
+def _found(value: Any, what: str) -> Any:
+    if value is None:
+        raise _NotFound(f"{what} not found")
+    return value
+
+
+# Route handlers: (path captures, query params) -> JSON-serializable result
+def _paged(params: Dict[str, List[str]]) -> bool:
+    return "page_size" in params or "cursor" in params
+
+
+def _page(page_function, *args, params):
+    """One page of a grab_info page_* listing, from ?page_size=&cursor="""
+    try:
+        return page_function(
+            *args,
+            page_size=_positive_int_param(params, "page_size", 100),
+            cursor=_param(params, "cursor"),
+            fields=_fields(params),
+        )
+    except ValueError as e:
+        raise _BadRequest(str(e)) from None
+
+
+def _pokemon_list(_, params):
+    if _paged(params):
+        return _page(grab_info.page_pokemon, params=params)
+    return grab_info.pk_names()
+
+
+def _pokemon_detail(match, params):
+    key = match.group(1)
+    form = _param(params, "form")
+    fields = _fields(params)
+    if form is not None:
+        return _found(
+            grab_info.get_pokemon_by_name(key, form, fields=fields), f"Pokemon '{key}'"
+        )
+    return _found(grab_info.get_many([key], fields=fields)[0], f"Pokemon '{key}'")
+
+
+def _pokemon_availability(match, params):
+    name = match.group(1)
+    return _found(
+        grab_info.get_pokemon_game_availability(name, fields=_fields(params)),
+        f"Pokemon '{name}'",
+    )
+
+
+def _pokemon_learnset(match, params):
+    return grab_info.get_pokemon_learnset(
+        match.group(1),
+        generation=_int_param(params, "generation"),
+        form=_param(params, "form") or "Normal",
+        fields=_fields(params),
+    )
+
+
+def _query(_, params):
+    query = grab_info.query()
+    for attribute in ("type", "ability", "egg_group", "growth_rate", "in_game"):
+        for value in params.get(attribute, []):
+            query = getattr(query, attribute)(value)
+    generation = _int_param(params, "generation")
+    for move in params.get("learns", []):
+        query = query.learns(move, generation)
+    for condition in params.get("stat", []):
+        match = STAT_CONDITION.match(condition.strip())
+        if not match:
+            raise _BadRequest(f"Invalid stat condition '{condition}'")
+        try:
+            query = query.stat(match.group(1), match.group(2), int(match.group(3)))
+        except ValueError as e:
+            raise _BadRequest(str(e)) from None
+
+    if _paged(params):
+        return _page(grab_info.page_query, query, params=params)
+    fields = _fields(params)
+    try:
+        records = query.all()
+    except ValueError as e:
+        raise _BadRequest(str(e)) from None
+    limit = _positive_int_param(params, "limit")
+    return project(records[:limit] if limit is not None else records, fields)
+
+
+def _games(_, params):
+    generation = _int_param(params, "generation")
+    if generation is not None:
+        return _found(
+            grab_info.get_games_by_generation(generation), f"Generation {generation}"
+        )
+    region = _param(params, "region")
+    if region is not None:
+        return _found(grab_info.get_games_by_region(region), f"Region '{region}'")
+    platform = _param(params, "platform")
+    if platform is not None:
+        return grab_info.get_games_by_platform(platform)
+    return grab_info.get_all_games()
+
+
+def _game_pokemon(match, params):
+    if _paged(params):
+        return _page(grab_info.page_pokemon_in_game, match.group(1), params=params)
+    return grab_info.get_pokemon_in_game(match.group(1), fields=_fields(params))
+
+
+def _move(match, params):
+    generation = _int_param(params, "generation")
+    name = match.group(1)
+    scope = f" in generation {generation}" if generation is not None else ""
+    return _found(
+        grab_info.get_move(name, generation, fields=_fields(params)),
+        f"Move '{name}'{scope}",
+    )
+
+
+def _ability(match, params):
+    name = match.group(1)
+    return _found(
+        grab_info.get_ability(name, fields=_fields(params)), f"Ability '{name}'"
+    )
+
+
+def _ability_pokemon(match, params):
+    return grab_info.get_pokemon_by_ability(match.group(1), fields=_fields(params))
+
+
+def _search(_, params):
+    query = _param(params, "q")
+    if not query:
+        raise _BadRequest("'q' is required")
+    kinds = params.get("kind") or None
+    return grab_info.search_names(
+        query, limit=_positive_int_param(params, "limit", 10), kinds=kinds
+    )
+
+
+def _stats(_, params):
+    return grab_info.cache_stats()
+
+
+ROUTES: List[Tuple[re.Pattern, Callable[[re.Match, Dict[str, List[str]]], Any]]] = [
+    (re.compile(r"^/pokemon/?$"), _pokemon_list),
+    (re.compile(r"^/pokemon/([^/]+)/availability$"), _pokemon_availability),
+    (re.compile(r"^/pokemon/([^/]+)/learnset$"), _pokemon_learnset),
+    (re.compile(r"^/pokemon/([^/]+)$"), _pokemon_detail),
+    (re.compile(r"^/query$"), _query),
+    (re.compile(r"^/games/?$"), _games),
+    (re.compile(r"^/games/([^/]+)/pokemon$"), _game_pokemon),
+    (re.compile(r"^/moves/([^/]+)$"), _move),
+    (re.compile(r"^/abilities/([^/]+)/pokemon$"), _ability_pokemon),
+    (re.compile(r"^/abilities/([^/]+)$"), _ability),
+    (re.compile(r"^/search$"), _search),
+    (re.compile(r"^/stats$"), _stats),
+]
+
+# Handlers whose response changes without a data change (no ETag, never cached)
+_UNCACHEABLE = {_stats}
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """Serves grab_info queries as JSON"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, keep-alive
+    # clients stall ~40 ms on delayed ACKs
+    disable_nagle_algorithm = True
+    server_version = "PokeDataService/1.0"
+    quiet = False
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _not_allowed(self):
+        self.close_connection = True  # any request body is left unread
+        self._send_json(
+            405,
+            {"error": "read-only service"},
+            True,
+            {"Allow": "GET, HEAD", "Connection": "close"},
+        )
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _not_allowed
+
+    def _respond(self, send_body: bool):
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        params = parse_qs(url.query)
+
+        for pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match:
+                break
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint '{path}'"}, send_body)
+            return
+
+        if handler in _UNCACHEABLE:
+            self._dispatch(
+                handler, match, params, send_body, {"Cache-Control": "no-store"}
+            )
+            return
+
+        # The response is a pure function of the data and the request
+        etag = '"{}"'.format(
+            hashlib.sha1(
+                f"{grab_info.loaded_version()}|{self.path}".encode("utf-8")
+            ).hexdigest()[:20]
+        )
+        if_none_match = self.headers.get("If-None-Match") or ""
+        if etag in if_none_match or if_none_match.strip() == "*":
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._dispatch(handler, match, params, send_body, {"ETag": etag})
+
+    def _dispatch(
+        self, handler, match, params, send_body: bool, headers: Dict[str, str]
+    ):
+        try:
+            result = handler(match, params)
+        except _NotFound as e:
+            self._send_json(404, {"error": str(e)}, send_body)
+            return
+        except _BadRequest as e:
+            self._send_json(400, {"error": str(e)}, send_body)
+            return
+        except Exception as e:
+            # Keep the connection answering: an unexpected error is a 500, not a drop
+            self.log_error("Error handling %s: %r", self.path, e)
+            self._send_json(500, {"error": "Internal server error"}, send_body)
+            return
+        self._send_json(200, result, send_body, headers)
+
+    def _send_json(
+        self,
+        status: int,
+        payload: Any,
+        send_body: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        body = json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":"), default=json_default
+        ).encode("utf-8")
+        compressed = len(body) >= GZIP_MIN_BYTES and "gzip" in (
+            self.headers.get("Accept-Encoding") or ""
+        )
+        if compressed:
+            body = gzip.compress(body, compresslevel=5)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def warm_up():
+    """
+    Load the datasets and build the common indexes before serving, then
+    reload them in the background whenever a save stamps a new version
+    """
+    start = time.perf_counter()
+    grab_info.start_hot_reload()
+    return time.perf_counter() - start
+
+
+def make_server(
+    host: str = "127.0.0.1", port: int = 8765, quiet: bool = False
+) -> ThreadingHTTPServer:
+    """Create (but do not start) the service; port 0 picks a free port"""
+    handler = type("Handler", (QueryRequestHandler,), {"quiet": quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local read-only Pokemon data API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--quiet", action="store_true", help="no per-request log")
+    args = parser.parse_args()
+
+    print(f"Loading datasets... ({warm_up() * 1000:.0f} ms)")
+    server = make_server(args.host, args.port, args.quiet)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Dataset Indexes
+Lookup structures built once per dataset version (see CachedDataset.derived)
+so grab_info queries do not have to scan the full Pokemon list.
+"""
+
+import re
+from array import array
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_REF_ID_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+
+def normalize_number(number: Any) -> Optional[int]:
+    """Convert 1, '1', '0001' or '#0001' to the national dex number as an int"""
+    if isinstance(number, bool):
+        return None
+    if isinstance(number, int):
+        return number
+    if isinstance(number, str):
+        digits = number.strip().lstrip("#")
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+class PokemonLookupIndex:
+    """Hash indexes over the Pokemon list: name, national number, ref_id and form"""
+
+    def __init__(self, pokemon_data: List[Dict[str, Any]]):
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_number: Dict[int, Dict[str, Any]] = {}
+        self.by_ref_id: Dict[str, Dict[str, Any]] = {}
+        self.by_name_form: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # setdefault keeps the first record in file order, matching the
+        # behaviour of the original linear scans (base forms come first)
+        for pokemon in pokemon_data:
+            name = pokemon.get("name")
+            if name:
+                self.by_name.setdefault(name.casefold(), pokemon)
+                form = pokemon.get("form") or "Normal"
+                self.by_name_form.setdefault(
+                    (name.casefold(), form.casefold()), pokemon
+                )
+
+            number = normalize_number(pokemon.get("number"))
+            if number is not None:
+                self.by_number.setdefault(number, pokemon)
+
+            ref_id = pokemon.get("ref_id")
+            if ref_id:
+                self.by_ref_id.setdefault(ref_id, pokemon)
+
+    def get_by_name(
+        self, name: str, form: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Case-insensitive name lookup, optionally for a specific form"""
+        if form is None:
+            return self.by_name.get(name.casefold())
+        return self.by_name_form.get((name.casefold(), form.casefold()))
+
+    def get_by_number(self, number: Any) -> Optional[Dict[str, Any]]:
+        """Lookup by national number in any accepted format"""
+        normalized = normalize_number(number)
+        if normalized is None:
+            return None
+        return self.by_number.get(normalized)
+
+    def get_by_ref_id(self, ref_id: str) -> Optional[Dict[str, Any]]:
+        """Lookup by ref_id, e.g. '0001-00'"""
+        return self.by_ref_id.get(ref_id)
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Resolve a name, national number or ref_id to a Pokemon record"""
+        if isinstance(key, str) and _REF_ID_PATTERN.match(key):
+            return self.by_ref_id.get(key)
+        if normalize_number(key) is not None:
+            return self.get_by_number(key)
+        if isinstance(key, str):
+            return self.get_by_name(key)
+        return None
+
+    def get_many(self, keys: Iterable[Any]) -> List[Optional[Dict[str, Any]]]:
+        """Resolve several keys at once; the result lines up with the input"""
+        return [self.get(key) for key in keys]
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits of a bitmap, lowest first"""
+    position = 0
+    while bits:
+        chunk = bits & 0xFFFFFFFFFFFFFFFF
+        while chunk:
+            low = chunk & -chunk
+            yield position + low.bit_length() - 1
+            chunk ^= low
+        bits >>= 64
+        position += 64
+
+
+class IdSet:
+    """
+    Immutable set of Pokemon ids (positions in the dataset) stored as a
+    bitmap. Supports & (AND), | (OR), - (AND NOT) and ~ (NOT); iterating
+    yields ids in ascending order.
+    """
+
+    __slots__ = ("bits", "universe")
+
+    def __init__(self, bits: int = 0, universe: int = 0):
+        self.bits = bits
+        self.universe = universe
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int], universe: int) -> "IdSet":
+        bits = 0
+        for pokemon_id in ids:
+            bits |= 1 << pokemon_id
+        return cls(bits & universe, universe)
+
+    def __and__(self, other: "IdSet") -> "IdSet":
+        return IdSet(self.bits & other.bits, self.universe)
+
+    def __or__(self, other: "IdSet") -> "IdSet":
+        return IdSet(self.bits | other.bits, self.universe)
+
+    def __sub__(self, other: "IdSet") -> "IdSet":
+        return IdSet(self.bits & ~other.bits, self.universe)
+
+    def __invert__(self) -> "IdSet":
+        return IdSet(self.universe & ~self.bits, self.universe)
+
+    def __contains__(self, pokemon_id: int) -> bool:
+        return pokemon_id >= 0 and bool(self.bits >> pokemon_id & 1)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __iter__(self) -> Iterator[int]:
+        return _iter_bits(self.bits)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IdSet) and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return f"IdSet({len(self)} ids)"
+
+    def to_array(self) -> array:
+        """Sorted id array"""
+        return array("I", self)
+
+
+def _ability_names(pokemon: Dict[str, Any]) -> List[str]:
+    # Scraped data stores a list; the Excel import stores {"regular": [...], "hidden": "..."}
+    abilities = pokemon.get("abilities") or []
+    if isinstance(abilities, dict):
+        names = list(abilities.get("regular") or [])
+        if abilities.get("hidden"):
+            names.append(abilities["hidden"])
+        return names
+    return list(abilities)
+
+
+def _growth_rate(pokemon: Dict[str, Any]) -> List[str]:
+    rate = (pokemon.get("game_mechanics") or {}).get("growth_rate") or (
+        pokemon.get("breeding_info") or {}
+    ).get("growth_rate")
+    return [rate] if rate else []
+
+
+# Attribute name -> function returning the values a Pokemon has for it
+INVERTED_ATTRIBUTES: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "type": lambda pokemon: pokemon.get("types") or [],
+    "ability": _ability_names,
+    "egg_group": lambda pokemon: (pokemon.get("breeding_info") or {}).get("egg_groups")
+    or [],
+    "growth_rate": _growth_rate,
+}
+
+
+class InvertedIndex:
+    """
+    Attribute value -> Pokemon ids for types, abilities, egg groups and growth
+    rates. Values are matched case-insensitively. Posting lists are kept both
+    as sorted id arrays and as bitmaps for fast AND/OR/NOT.
+    """
+
+    def __init__(self, pokemon_data: List[Dict[str, Any]]):
+        self.records = pokemon_data
+        self.universe = (1 << len(pokemon_data)) - 1
+        self.postings: Dict[str, Dict[str, array]] = {}
+        self._bitmaps: Dict[str, Dict[str, int]] = {}
+        self._labels: Dict[str, Dict[str, str]] = {}
+
+        for attribute, extract in INVERTED_ATTRIBUTES.items():
+            postings: Dict[str, List[int]] = {}
+            labels: Dict[str, str] = {}
+            for pokemon_id, pokemon in enumerate(pokemon_data):
+                for value in extract(pokemon):
+                    if not isinstance(value, str) or not value:
+                        continue
+                    key = value.casefold()
+                    labels.setdefault(key, value)
+                    ids = postings.setdefault(key, [])
+                    if not ids or ids[-1] != pokemon_id:
+                        ids.append(pokemon_id)
+
+            self.postings[attribute] = {
+                key: array("I", ids) for key, ids in postings.items()
+            }
+            self._bitmaps[attribute] = {
+                key: IdSet.from_ids(ids, self.universe).bits
+                for key, ids in postings.items()
+            }
+            self._labels[attribute] = labels
+
+    def _check_attribute(self, attribute: str):
+        if attribute not in self.postings:
+            raise ValueError(
+                f"Unknown attribute '{attribute}'. "
+                f"Supported attributes: {list(self.postings)}"
+            )
+
+    def all(self) -> IdSet:
+        """Every Pokemon id"""
+        return IdSet(self.universe, self.universe)
+
+    def lookup(self, attribute: str, value: str) -> IdSet:
+        """Ids of Pokemon whose attribute contains value"""
+        self._check_attribute(attribute)
+        bits = self._bitmaps[attribute].get(value.casefold(), 0)
+        return IdSet(bits, self.universe)
+
+    def ids(self, attribute: str, value: str) -> array:
+        """Sorted id array for one attribute value"""
+        self._check_attribute(attribute)
+        return self.postings[attribute].get(value.casefold(), array("I"))
+
+    def count(self, attribute: str, value: str) -> int:
+        """Number of Pokemon with an attribute value"""
+        return len(self.ids(attribute, value))
+
+    def values(self, attribute: str) -> List[str]:
+        """All distinct values of an attribute (original spelling), sorted"""
+        self._check_attribute(attribute)
+        return sorted(self._labels[attribute].values())
+
+    def records_for(self, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Pokemon records for ids, in the order given"""
+        records = self.records
+        return [records[pokemon_id] for pokemon_id in ids]
+
+
+class GameAvailabilityIndex:
+    """
+    Pokemon x game availability bitmap plus each game's Pokemon ids in
+    regional dex order, built from the game_appearances sections.
+    """
+
+    def __init__(self, pokemon_data: List[Dict[str, Any]]):
+        self.records = pokemon_data
+        self.universe = (1 << len(pokemon_data)) - 1
+        self._bitmaps: Dict[str, int] = {}
+        self._dex_numbers: Dict[str, List[Tuple[int, int, Optional[int]]]] = {}
+
+        for pokemon_id, pokemon in enumerate(pokemon_data):
+            for game, game_data in (pokemon.get("game_appearances") or {}).items():
+                if not isinstance(game_data, Mapping) or not game_data.get("available"):
+                    continue
+                self._bitmaps[game] = self._bitmaps.get(game, 0) | (1 << pokemon_id)
+                dex_number = game_data.get("dex_number")
+                sort_key = dex_number if dex_number else 9999
+                self._dex_numbers.setdefault(game, []).append(
+                    (sort_key, pokemon_id, dex_number)
+                )
+
+        # Stable sort by regional dex number (missing numbers last), then dataset order
+        self.dex_order: Dict[str, array] = {}
+        self._listings: Dict[str, List[Dict[str, Any]]] = {}
+        for game, entries in self._dex_numbers.items():
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            self.dex_order[game] = array("I", (entry[1] for entry in entries))
+            self._listings[game] = [
+                {
+                    "name": pokemon_data[pokemon_id]["name"],
+                    "national_number": pokemon_data[pokemon_id]["number"],
+                    "game_dex_number": dex_number,
+                }
+                for _, pokemon_id, dex_number in entries
+            ]
+
+    def games(self) -> List[str]:
+        """Every game that has at least one available Pokemon"""
+        return list(self._bitmaps)
+
+    def in_game(self, game: str) -> IdSet:
+        """Ids of Pokemon available in a game"""
+        return IdSet(self._bitmaps.get(game, 0), self.universe)
+
+    def count(self, game: str) -> int:
+        """Number of Pokemon available in a game"""
+        return self._bitmaps.get(game, 0).bit_count()
+
+    def is_available(self, pokemon_id: int, game: str) -> bool:
+        """True if the Pokemon with this id is available in the game"""
+        return bool(self._bitmaps.get(game, 0) >> pokemon_id & 1)
+
+    def games_for(self, pokemon_id: int) -> List[str]:
+        """Games in which the Pokemon with this id is available"""
+        return [game for game, bits in self._bitmaps.items() if bits >> pokemon_id & 1]
+
+    def listing(self, game: str) -> List[Dict[str, Any]]:
+        """Regional dex listing for a game (name, national and game dex number)"""
+        return list(self._listings.get(game, []))
+
+    def ordered_ids(self, game: str, ids: Optional[IdSet] = None) -> List[int]:
+        """Ids available in a game in regional dex order, optionally restricted to ids"""
+        order = self.dex_order.get(game, array("I"))
+        if ids is None:
+            return list(order)
+        bits = ids.bits
+        return [pokemon_id for pokemon_id in order if bits >> pokemon_id & 1]
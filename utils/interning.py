@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - String Interning
+Deduplicates the short categorical strings that repeat throughout the loaded
+datasets (type names, learn methods, forms, Pokemon names inside every
+``learned_by`` list, game names used as ``game_appearances`` keys, ...), so
+each distinct value is held in memory once.
+"""
+
+import sys
+from typing import Any
+
+# Fields whose string values (or lists of strings) are categorical
+CATEGORICAL_FIELDS = frozenset(
+    {
+        "name",
+        "number",
+        "dex_number",
+        "ref_id",
+        "form",
+        "method",
+        "types",
+        "abilities",
+        "battle_type",
+        "category",
+        "egg_groups",
+        "growth_rate",
+        "gender_ratio",
+        "ev_yield",
+        "species",
+        "location",
+        "region",
+        "platform",
+        "games",
+        "contest_type",
+    }
+)
+
+_intern = sys.intern
+
+
+def intern_strings(obj: Any, fields: frozenset = CATEGORICAL_FIELDS) -> Any:
+    """
+    Intern every string value (or list of strings) stored under a categorical
+    field, in place, and return obj. Long free-text fields are left untouched.
+    Dict keys need no work here: both the JSON decoder and msgpack already
+    share repeated keys.
+    """
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                value_type = type(value)
+                if key in fields:
+                    if value_type is str:
+                        node[key] = _intern(value)
+                        continue
+                    if value_type is list:
+                        for i, item in enumerate(value):
+                            if type(item) is str:
+                                value[i] = _intern(item)
+                            elif isinstance(item, (dict, list)):
+                                stack.append(item)
+                        continue
+                if value_type is dict or value_type is list:
+                    stack.append(value)
+        elif isinstance(node, list):
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    stack.append(item)
+    return obj
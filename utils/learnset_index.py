@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Reverse Learnset Index
+The moves files are stored move-first (move -> learned_by). This index flips
+them into (Pokemon, form, generation) -> moves with learn method and level,
+persisted as data/learnset_index.json.
+
+Each generation slice records the size/mtime of the moves file it was built
+from; stale or missing slices are rebuilt on load, and save_moves_data
+refreshes its generation directly after writing.
+
+Layout:
+    {
+      "format": 1,
+      "sources": {"3": {"size": 2914301, "mtime_ns": ...}},
+      "learnsets": {
+        "3": {
+          "bulbasaur|normal": {
+            "name": "Bulbasaur", "form": "Normal", "dex_number": "0001",
+            "moves": [["Absorb", "Level Up", 1], ["Cut", "TM", null], ...]
+          }
+        }
+      }
+    }
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .fuzzy_search import normalize_name
+    from .snapshot import load_dataset
+except ImportError:
+    from fuzzy_search import normalize_name
+    from snapshot import load_dataset
+
+LEARNSET_INDEX_FORMAT = 1
+LEARNSET_INDEX_FILENAME = "learnset_index.json"
+
+_MOVES_FILE_PATTERN = re.compile(r"^moves_data_gen(\d+)\.json$")
+
+
+def learnset_key(name: str, form: Optional[str] = "Normal") -> str:
+    """Index key for a Pokemon name and form"""
+    return f"{name.casefold()}|{(form or 'Normal').casefold()}"
+
+
+def moves_files(data_dir: str) -> Dict[int, str]:
+    """Generation -> moves_data_genN.json path for every generation on disk"""
+    files = {}
+    try:
+        filenames = os.listdir(data_dir)
+    except FileNotFoundError:
+        return files
+    for filename in filenames:
+        match = _MOVES_FILE_PATTERN.match(filename)
+        if match:
+            files[int(match.group(1))] = os.path.join(data_dir, filename)
+    return files
+
+
+def moves_files_signature(data_dir: str) -> Tuple[Tuple[int, int, int], ...]:
+    """(generation, mtime_ns, size) for every moves file - changes when any file does"""
+    signature = []
+    for generation, path in sorted(moves_files(data_dir).items()):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        signature.append((generation, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def build_generation_learnsets(
+    moves: List[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Invert one generation's move list into Pokemon -> moves"""
+    learnsets: Dict[str, Dict[str, Any]] = {}
+    for move in moves:
+        move_name = move.get("name", "")
+        for learner in move.get("learned_by") or []:
+            name = learner.get("name")
+            if not name:
+                continue
+            form = learner.get("form") or "Normal"
+            key = learnset_key(name, form)
+            entry = learnsets.get(key)
+            if entry is None:
+                entry = learnsets[key] = {
+                    "name": name,
+                    "form": form,
+                    "dex_number": learner.get("dex_number"),
+                    "moves": [],
+                }
+            entry["moves"].append(
+                [move_name, learner.get("method", ""), learner.get("level")]
+            )
+
+    # Group by learn method, then level, then move name
+    for entry in learnsets.values():
+        entry["moves"].sort(
+            key=lambda m: (m[1], m[2] if m[2] is not None else -1, m[0])
+        )
+    return learnsets
+
+
+def _source_entry(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _read_index(index_file: str) -> Dict[str, Any]:
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("format") == LEARNSET_INDEX_FORMAT:
+            return index
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {"format": LEARNSET_INDEX_FORMAT, "sources": {}, "learnsets": {}}
+
+
+def _write_index(index: Dict[str, Any], index_file: str):
+    tmp_path = f"{index_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, index_file)
+
+
+def update_learnset_index(
+    data_dir: str, generation: int, moves: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Rebuild one generation's slice of the index. Pass the moves list when it
+    is already in memory (e.g. right after saving) to avoid re-reading the file.
+    """
+    index_file = os.path.join(data_dir, LEARNSET_INDEX_FILENAME)
+    moves_path = os.path.join(data_dir, f"moves_data_gen{generation}.json")
+
+    if moves is None:
+        data = load_dataset(moves_path)
+        moves = data.get("moves", []) if isinstance(data, dict) else []
+
+    index = _read_index(index_file)
+    index["learnsets"][str(generation)] = build_generation_learnsets(moves)
+    index["sources"][str(generation)] = _source_entry(moves_path)
+    _write_index(index, index_file)
+    return index
+
+
+def load_learnset_index(data_dir: str) -> Dict[str, Any]:
+    """
+    Load the persisted index, first rebuilding any generation whose moves
+    file changed, appeared or disappeared since the index was written.
+    """
+    index_file = os.path.join(data_dir, LEARNSET_INDEX_FILENAME)
+    index = _read_index(index_file)
+    files = moves_files(data_dir)
+    changed = False
+
+    for generation in list(index["learnsets"]):
+        if int(generation) not in files:
+            del index["learnsets"][generation]
+            index["sources"].pop(generation, None)
+            changed = True
+
+    for generation, path in sorted(files.items()):
+        source = _source_entry(path)
+        if index["sources"].get(str(generation)) == source:
+            continue
+        data = load_dataset(path)
+        moves = data.get("moves", []) if isinstance(data, dict) else []
+        index["learnsets"][str(generation)] = build_generation_learnsets(moves)
+        index["sources"][str(generation)] = source
+        changed = True
+
+    if changed:
+        _write_index(index, index_file)
+    return index
+
+
+def learnset_for(
+    index: Dict[str, Any],
+    name: str,
+    form: Optional[str] = "Normal",
+    generation: Optional[int] = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """Generation -> [{"move", "method", "level"}] for one Pokemon form"""
+    key = learnset_key(name, form)
+    generations = (
+        [str(generation)]
+        if generation is not None
+        else sorted(index["learnsets"], key=int)
+    )
+
+    result = {}
+    for gen in generations:
+        entry = index["learnsets"].get(gen, {}).get(key)
+        if entry is not None:
+            result[int(gen)] = [
+                {"move": move, "method": method, "level": level}
+                for move, method, level in entry["moves"]
+            ]
+    return result
+
+
+class MoveLearnerIndex:
+    """
+    Move -> bitmap of the Pokemon ids (positions in the Pokemon dataset) that
+    learn it, per generation. Move names are matched with normalize_name(),
+    so "Solar Beam" also finds the older "SolarBeam" spelling.
+    """
+
+    def __init__(self, index: Dict[str, Any], pokemon_ids: Dict[str, int]):
+        self.generations: Dict[int, Dict[str, int]] = {}
+        for generation, learnsets in index["learnsets"].items():
+            learners: Dict[str, int] = {}
+            for key, entry in learnsets.items():
+                pokemon_id = pokemon_ids.get(key)
+                if pokemon_id is None:
+                    continue
+                bit = 1 << pokemon_id
+                for move, _, _ in entry["moves"]:
+                    move_key = normalize_name(move)
+                    learners[move_key] = learners.get(move_key, 0) | bit
+            self.generations[int(generation)] = learners
+
+    def bits(self, move: str, generation: Optional[int] = None) -> int:
+        """Bitmap of Pokemon that learn a move (in any generation if none given)"""
+        move_key = normalize_name(move)
+        if generation is not None:
+            return self.generations.get(generation, {}).get(move_key, 0)
+        bits = 0
+        for learners in self.generations.values():
+            bits |= learners.get(move_key, 0)
+        return bits
+
+    def count(self, move: str, generation: Optional[int] = None) -> int:
+        """Number of Pokemon that learn a move"""
+        return self.bits(move, generation).bit_count()
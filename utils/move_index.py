@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Moves Offset Index
+Sidecar index mapping each move name to the byte offset and length of its
+record inside ``moves_data_genN.json``, so a single move can be decoded from
+an mmap of the file without parsing the rest of it.
+
+Sidecar layout (``data/moves_data_gen3.json`` -> ``data/moves_data_gen3.idx.json``):
+    {
+      "format": 1,
+      "source_size": 2914301,
+      "source_mtime_ns": 1731747600000000000,
+      "records": {"absorb": [812, 2311], ...}
+    }
+"""
+
+import json
+import mmap
+import os
+from typing import Dict, List, Any, Optional
+
+INDEX_FORMAT = 1
+INDEX_SUFFIX = ".idx.json"
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def index_path(json_path: str) -> str:
+    """Path of the offset index that belongs to a moves JSON file"""
+    return os.path.splitext(json_path)[0] + INDEX_SUFFIX
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _scan_records(text: str) -> Dict[str, List[int]]:
+    """Return {move name (lowercase): [char start, char end]} for the "moves" array"""
+    pos = _skip_ws(text, 0)
+    if text[pos : pos + 1] != "{":
+        raise ValueError("Moves file must contain a JSON object")
+    pos += 1
+
+    records = {}
+    while True:
+        pos = _skip_ws(text, pos)
+        if text[pos] == "}":
+            break
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _skip_ws(text, pos)
+        if text[pos] != ":":
+            raise ValueError(f"Expected ':' at offset {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+        if key == "moves" and text[pos] == "[":
+            pos = _skip_ws(text, pos + 1)
+            while text[pos] != "]":
+                start = pos
+                move, pos = _decoder.raw_decode(text, pos)
+                name = move.get("name", "").lower() if isinstance(move, dict) else ""
+                if name:
+                    records[name] = [start, pos]
+                pos = _skip_ws(text, pos)
+                if text[pos] == ",":
+                    pos = _skip_ws(text, pos + 1)
+            pos += 1
+        else:
+            _, pos = _decoder.raw_decode(text, pos)
+
+        pos = _skip_ws(text, pos)
+        if text[pos] == ",":
+            pos += 1
+
+    return records
+
+
+def build_move_index(json_path: str) -> Dict[str, Any]:
+    """Scan a moves JSON file and write its offset index sidecar"""
+    stat = os.stat(json_path)
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    text = raw.decode("utf-8")
+
+    char_spans = _scan_records(text)
+
+    # Convert character positions to byte offsets in a single forward pass
+    byte_records = {}
+    char_pos = 0
+    byte_pos = 0
+    for name, (start, end) in sorted(char_spans.items(), key=lambda item: item[1][0]):
+        byte_pos += len(text[char_pos:start].encode("utf-8"))
+        length = len(text[start:end].encode("utf-8"))
+        byte_records[name] = [byte_pos, length]
+        byte_pos += length
+        char_pos = end
+
+    index = {
+        "format": INDEX_FORMAT,
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "records": byte_records,
+    }
+
+    path = index_path(json_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return index
+
+
+def _load_index(json_path: str) -> Optional[Dict[str, Any]]:
+    """Load the sidecar index if it still describes the current file"""
+    try:
+        with open(index_path(json_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    stat = os.stat(json_path)
+    if (
+        index.get("format") != INDEX_FORMAT
+        or index.get("source_size") != stat.st_size
+        or index.get("source_mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+    return index
+
+
+class MoveIndexReader:
+    """Random-access reader for a single moves JSON file"""
+
+    def __init__(self, json_path: str):
+        self.json_path = json_path
+        index = _load_index(json_path)
+        if index is None:
+            index = build_move_index(json_path)
+        self.source_mtime_ns = index["source_mtime_ns"]
+        self.source_size = index["source_size"]
+        self.records = index["records"]
+
+        # The mapping keeps its own handle on the file. Saves replace the
+        # file atomically, so an open mapping keeps reading the old version.
+        with open(json_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def is_stale(self) -> bool:
+        """True if the JSON file changed since this reader was opened"""
+        try:
+            stat = os.stat(self.json_path)
+        except FileNotFoundError:
+            return True
+        return (
+            stat.st_size != self.source_size or stat.st_mtime_ns != self.source_mtime_ns
+        )
+
+    def names(self) -> List[str]:
+        """Lowercase names of every indexed move"""
+        return list(self.records.keys())
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self.records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Decode and return one move record, or None if it is not in the file"""
+        entry = self.records.get(name.lower())
+        if entry is None:
+            return None
+        offset, length = entry
+        return json.loads(self._mmap[offset : offset + length])
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
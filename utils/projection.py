@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Field Projection
+Selects a subset of fields from records, with dotted paths into nested
+sections:
+
+    project(pokemon, ["name", "types", "base_stats.speed"])
+    -> {"name": "Garchomp", "types": ["Dragon", "Ground"], "base_stats": {"speed": 102}}
+
+Only the requested keys are read - no deep copy, and unrelated sections are
+never touched, so lazily decoded records do not decode them. Selected values
+are shared with the source record, not copied; treat them as read-only.
+Fields missing from a record are left out of its projection.
+"""
+
+import functools
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+Fields = Union[str, Iterable[str]]
+
+# Field tree: key -> None (take the whole value) or a nested field tree
+_Tree = Dict[str, Optional["_Tree"]]
+
+
+def json_default(value: Any) -> Any:
+    """json.dumps default= hook: compact and lazy records are Mappings, not dicts"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def normalize_fields(fields: Fields) -> Tuple[str, ...]:
+    """Field paths as a tuple; a string is split on commas"""
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    paths = tuple(field.strip() for field in fields)
+    for path in paths:
+        if not path or "" in path.split("."):
+            raise ValueError(f"Invalid field path '{path}'")
+    return paths
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(paths: Tuple[str, ...]) -> _Tree:
+    tree: _Tree = {}
+    for path in paths:
+        node = tree
+        *parents, leaf = path.split(".")
+        for part in parents:
+            if part in node and node[part] is None:
+                break  # the whole parent is already selected
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+    return tree
+
+
+def _apply(record: Mapping, tree: _Tree) -> Dict[str, Any]:
+    result = {}
+    for key, subtree in tree.items():
+        if key not in record:
+            continue
+        value = record[key]
+        if subtree is None or not isinstance(value, Mapping):
+            result[key] = value
+        else:
+            result[key] = _apply(value, subtree)
+    return result
+
+
+def compile_projection(fields: Fields) -> Callable[[Mapping], Dict[str, Any]]:
+    """Reusable record -> projected dict function for a field list"""
+    tree = _compile(normalize_fields(fields))
+    return lambda record: _apply(record, tree)
+
+
+def project(value: Any, fields: Optional[Fields]) -> Any:
+    """
+    Project a record, or every record of a list (None entries are kept).
+    fields=None returns value unchanged.
+    """
+    if fields is None or value is None:
+        return value
+    tree = _compile(normalize_fields(fields))
+    if isinstance(value, Mapping):
+        return _apply(value, tree)
+    return [None if record is None else _apply(record, tree) for record in value]
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Query Builder
+Composable filters over the Pokemon dataset that run against the grab_info
+indexes instead of scanning records:
+
+    query().type("Dragon").in_game("Scarlet").stat("speed", ">", 100).learns("Dragon Dance")
+
+Planning: every indexed filter (inverted index, game bitmap, learnset index,
+stat matrix) reports its cardinality from the index without building its
+result - a stored bitmap's population count, or a binary search over a
+sorted stat column. Filters run most selective first, intersecting id
+bitmaps; a filter's bitmap is only built when its turn comes, and execution
+stops as soon as the candidate set is empty. Filters with no index (where()
+predicates, stat filters when numpy is missing) run last, on the surviving
+records only.
+
+explain() shows the chosen plan with estimated cardinalities;
+explain(analyze=True) also runs it and reports actual counts and timings.
+"""
+
+import abc
+import operator
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .indexes import IdSet
+    from .projection import Fields, project
+except ImportError:
+    from indexes import IdSet
+    from projection import Fields, project
+
+# Same names as stat_matrix.STAT_COLUMNS (not imported: numpy is optional)
+STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed", "total")
+
+# A stat condition as written on the command line or in a URL: "speed>100"
+STAT_CONDITION = re.compile(r"^([a-z_]+)\s*(>=|<=|==|!=|>|<)\s*(-?\d+)$")
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+class QuerySources:
+    """
+    Callables returning the structures a query runs against. matrix may be
+    None (numpy not installed); stat filters then fall back to record scans.
+    """
+
+    def __init__(
+        self,
+        inverted: Callable[[], Any],
+        games: Callable[[], Any],
+        learners: Callable[[], Any],
+        matrix: Optional[Callable[[], Any]] = None,
+    ):
+        self.inverted = inverted
+        self.games = games
+        self.learners = learners
+        self.matrix = matrix
+
+
+class _Context:
+    """
+    The structures a plan needs, resolved together once before planning, so
+    every filter of one execution sees the same dataset version
+    """
+
+    def __init__(self, sources: QuerySources, names: Iterable[str] = ()):
+        self.inverted = sources.inverted()
+        self.records = self.inverted.records
+        self.universe = self.inverted.universe
+        self._resolved: Dict[str, Any] = {"inverted": self.inverted}
+        for name in sorted(set(names) - {"inverted"}):
+            source = getattr(sources, name)
+            self._resolved[name] = source() if source is not None else None
+
+    def resolve(self, name: str) -> Any:
+        return self._resolved[name]
+
+
+class _Filter(abc.ABC):
+    """A single query condition"""
+
+    label = ""
+    access = ""
+    # Name of the QuerySources structure the filter reads (None: records only)
+    source: Optional[str] = None
+
+    @abc.abstractmethod
+    def estimate(self, context: _Context) -> Optional[int]:
+        """Cheap cardinality from the index, or None for unindexed filters"""
+
+    @abc.abstractmethod
+    def narrow(self, context: _Context, bits: int) -> int:
+        """The candidate bitmap restricted to Pokemon matching this filter"""
+
+
+class _IndexedFilter(_Filter):
+    """A filter answered by an id bitmap from an index"""
+
+    @abc.abstractmethod
+    def bits(self, context: _Context) -> int:
+        """Bitmap of matching Pokemon ids"""
+
+    def estimate(self, context: _Context) -> Optional[int]:
+        return self.bits(context).bit_count()
+
+    def narrow(self, context: _Context, bits: int) -> int:
+        return bits & self.bits(context)
+
+
+class _ScanFilter(_Filter):
+    """A filter checked record by record, on the surviving candidates only"""
+
+    access = "record scan"
+
+    @abc.abstractmethod
+    def matches(self, record: Dict[str, Any]) -> bool:
+        """Per-record check"""
+
+    def estimate(self, context: _Context) -> Optional[int]:
+        return None
+
+    def narrow(self, context: _Context, bits: int) -> int:
+        records = context.records
+        survivors = IdSet(bits, context.universe)
+        return IdSet.from_ids(
+            (i for i in survivors if self.matches(records[i])), context.universe
+        ).bits
+
+
+class _AttributeFilter(_IndexedFilter):
+    access = "inverted index"
+    source = "inverted"
+
+    def __init__(self, attribute: str, value: str):
+        self.attribute = attribute
+        self.value = value
+        self.label = f"{attribute} = {value!r}"
+
+    def bits(self, context: _Context) -> int:
+        # A stored posting bitmap: no work beyond the lookup
+        return context.inverted.lookup(self.attribute, self.value).bits
+
+
+class _GameFilter(_IndexedFilter):
+    access = "game bitmap"
+    source = "games"
+
+    def __init__(self, game: str):
+        self.game = game
+        self.label = f"in_game = {game!r}"
+
+    def bits(self, context: _Context) -> int:
+        return context.resolve("games").in_game(self.game).bits
+
+
+class _LearnsFilter(_IndexedFilter):
+    access = "learnset index"
+    source = "learners"
+
+    def __init__(self, move: str, generation: Optional[int]):
+        self.move = move
+        self.generation = generation
+        scope = f"gen {generation}" if generation is not None else "any gen"
+        self.label = f"learns {move!r} ({scope})"
+
+    def bits(self, context: _Context) -> int:
+        return context.resolve("learners").bits(self.move, self.generation)
+
+
+class _StatFilter(_IndexedFilter):
+    access = "stat matrix"
+    source = "matrix"
+
+    def __init__(self, stat: str, op: str, value: int):
+        self.stat = stat
+        self.op = op
+        self.value = value
+        self.compare = _COMPARISONS[op]
+        self.label = f"{stat} {op} {value}"
+
+    def estimate(self, context: _Context) -> Optional[int]:
+        # Binary search over the sorted column; the mask is built only if run
+        return context.resolve("matrix").count_compare(self.stat, self.op, self.value)
+
+    def bits(self, context: _Context) -> int:
+        matrix = context.resolve("matrix")
+        mask = self.compare(matrix.column(self.stat), self.value) & matrix.valid
+        return IdSet.from_ids(matrix.filter_ids(mask), context.universe).bits
+
+
+class _StatScanFilter(_ScanFilter):
+    """Stat comparison without numpy"""
+
+    def __init__(self, stat: str, op: str, value: int):
+        self.stat = stat
+        self.compare = _COMPARISONS[op]
+        self.value = value
+        self.label = f"{stat} {op} {value}"
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        value = (record.get("base_stats") or {}).get(self.stat)
+        return value is not None and bool(self.compare(value, self.value))
+
+
+class _PredicateFilter(_ScanFilter):
+    def __init__(self, predicate: Callable[[Dict[str, Any]], bool], label: str):
+        self.predicate = predicate
+        self.label = label
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        return bool(self.predicate(record))
+
+
+class Query:
+    """
+    Immutable query builder: every filter method returns a new Query, so a
+    partially built query can be reused as a base for several others.
+    """
+
+    def __init__(self, sources: QuerySources, filters: tuple = ()):
+        self._sources = sources
+        self._filters = filters
+
+    def _with(self, query_filter: _Filter) -> "Query":
+        return Query(self._sources, self._filters + (query_filter,))
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+
+    def type(self, type_name: str) -> "Query":
+        """Pokemon that have a type (chain twice for dual types)"""
+        return self._with(_AttributeFilter("type", type_name))
+
+    def ability(self, ability_name: str) -> "Query":
+        """Pokemon that can have an ability (regular or hidden)"""
+        return self._with(_AttributeFilter("ability", ability_name))
+
+    def egg_group(self, egg_group: str) -> "Query":
+        """Pokemon in an egg group"""
+        return self._with(_AttributeFilter("egg_group", egg_group))
+
+    def growth_rate(self, growth_rate: str) -> "Query":
+        """Pokemon with a growth rate"""
+        return self._with(_AttributeFilter("growth_rate", growth_rate))
+
+    def in_game(self, game_name: str) -> "Query":
+        """Pokemon available in a game"""
+        return self._with(_GameFilter(game_name))
+
+    def learns(self, move_name: str, generation: Optional[int] = None) -> "Query":
+        """Pokemon that learn a move, in one generation or in any"""
+        return self._with(_LearnsFilter(move_name, generation))
+
+    def stat(self, stat: str, op: str, value: int) -> "Query":
+        """Base stat comparison, e.g. stat("speed", ">", 100)"""
+        if stat not in STATS:
+            raise ValueError(f"Unknown stat '{stat}'. Supported stats: {list(STATS)}")
+        if op not in _COMPARISONS:
+            raise ValueError(
+                f"Unknown operator '{op}'. Supported operators: {list(_COMPARISONS)}"
+            )
+        if self._sources.matrix is None:
+            return self._with(_StatScanFilter(stat, op, value))
+        return self._with(_StatFilter(stat, op, value))
+
+    def where(
+        self, predicate: Callable[[Dict[str, Any]], bool], label: str = "where(...)"
+    ) -> "Query":
+        """Arbitrary per-record condition; runs last, on the surviving records"""
+        return self._with(_PredicateFilter(predicate, label))
+
+    # ------------------------------------------------------------------
+    # Planning and execution
+    # ------------------------------------------------------------------
+
+    def _context(self) -> _Context:
+        return _Context(
+            self._sources, (f.source for f in self._filters if f.source is not None)
+        )
+
+    def _plan(self, context: _Context) -> List[Dict[str, Any]]:
+        """Indexed filters by ascending estimated cardinality, then unindexed filters"""
+        steps = [
+            {
+                "filter": query_filter,
+                "position": position,
+                "estimate": query_filter.estimate(context),
+            }
+            for position, query_filter in enumerate(self._filters)
+        ]
+        steps.sort(
+            key=lambda step: (
+                step["estimate"] is None,
+                step["estimate"] or 0,
+                step["position"],
+            )
+        )
+        return steps
+
+    def _execute(self, context: _Context, steps: List[Dict[str, Any]]) -> IdSet:
+        bits = context.universe
+        for step in steps:
+            started = time.perf_counter()
+            if bits:
+                bits = step["filter"].narrow(context, bits)
+            step["actual"] = bits.bit_count()
+            step["seconds"] = time.perf_counter() - started
+        return IdSet(bits, context.universe)
+
+    def ids(self) -> IdSet:
+        """Matching Pokemon ids"""
+        context = self._context()
+        return self._execute(context, self._plan(context))
+
+    def all(self, fields: Optional[Fields] = None) -> List[Dict[str, Any]]:
+        """Matching Pokemon records, in dataset order (projected to fields if given)"""
+        context = self._context()
+        ids = self._execute(context, self._plan(context))
+        return project(context.inverted.records_for(ids), fields)
+
+    def first(self, fields: Optional[Fields] = None) -> Optional[Dict[str, Any]]:
+        """First matching Pokemon in dataset order, or None"""
+        records = self.all()
+        return project(records[0], fields) if records else None
+
+    def count(self) -> int:
+        """Number of matching Pokemon"""
+        return len(self.ids())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.all())
+
+    def explain(self, analyze: bool = False) -> str:
+        """
+        The chosen plan, one line per filter in execution order, with each
+        filter's estimated cardinality. With analyze=True the plan is also
+        run and the remaining candidate count and time per step are shown.
+        """
+        context = self._context()
+        steps = self._plan(context)
+        total = len(context.records)
+        if analyze:
+            self._execute(context, steps)
+
+        lines = [f"Query plan over {total} Pokemon:"]
+        if not steps:
+            lines.append("  (no filters - all Pokemon)")
+        for number, step in enumerate(steps, 1):
+            query_filter = step["filter"]
+            estimate = "?" if step["estimate"] is None else str(step["estimate"])
+            line = (
+                f"  {number}. {query_filter.label:<36} "
+                f"{query_filter.access:<15} est. {estimate:>5}"
+            )
+            if analyze:
+                line += (
+                    f"  -> {step['actual']:>5} remaining "
+                    f"({step['seconds'] * 1000:.3f} ms)"
+                )
+            lines.append(line)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        labels = ", ".join(query_filter.label for query_filter in self._filters)
+        return f"Query({labels})"
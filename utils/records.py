@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Compact Record Model
+Slotted classes for Pokemon records as an alternative to the nested dicts
+the JSON decoder produces. Known fields live in __slots__ (no per-record
+hash table), lists become tuples, and each per-game appearance is a small
+slotted object instead of a dict.
+
+Records are read-only Mappings, so code written against the dicts
+(record["name"], record.get("base_stats") or {}, ...) keeps working, and
+fields are also available as attributes (record.base_stats.speed).
+to_dict() gives back a dict equal to the one the record was built from,
+with the same key order; unknown keys are kept in a per-record overflow dict.
+
+    records = [PokemonRecord.from_dict(p) for p in pokemon_data]
+    memory_report(pokemon_data)   # bytes per record, dicts vs compact
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Key orders that differ from a class's field order, shared between records
+_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _pack(value: Any) -> Any:
+    """Lists (at any depth) to tuples; everything else as is"""
+    if type(value) is list:
+        return tuple(_pack(item) for item in value)
+    if type(value) is dict:
+        return {key: _pack(item) for key, item in value.items()}
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    """Inverse of _pack (and of the compact sections)"""
+    if type(value) is tuple:
+        return [_unpack(item) for item in value]
+    if type(value) is dict:
+        return {key: _unpack(item) for key, item in value.items()}
+    if isinstance(value, CompactSection):
+        return value.to_dict()
+    return value
+
+
+class CompactSection(Mapping):
+    """
+    Base class for slotted sections. Subclasses list their known keys in
+    __slots__ = FIELDS = (...); nested sections are declared in SECTIONS
+    (field -> class) and dicts of sections in SECTION_MAPS.
+    """
+
+    __slots__ = ("_extra", "_order")
+    FIELDS: Tuple[str, ...] = ()
+    SECTIONS: Dict[str, type] = {}
+    SECTION_MAPS: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactSection":
+        """Build from a JSON dict"""
+        section = cls.__new__(cls)
+        extra = None
+        for key, value in data.items():
+            if key in cls._field_set:
+                if key in cls.SECTIONS and type(value) is dict:
+                    value = cls.SECTIONS[key].from_dict(value)
+                elif key in cls.SECTION_MAPS and type(value) is dict:
+                    section_class = cls.SECTION_MAPS[key]
+                    value = {
+                        name: (
+                            section_class.from_dict(item)
+                            if type(item) is dict
+                            else _pack(item)
+                        )
+                        for name, item in value.items()
+                    }
+                else:
+                    value = _pack(value)
+                setattr(section, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = _pack(value)
+        section._extra = extra
+
+        # Remember the original key order only when it is not the natural one
+        keys = tuple(data)
+        natural = tuple(key for key in cls.FIELDS if key in data)
+        if extra:
+            natural += tuple(extra)
+        section._order = None if keys == natural else _ORDERS.setdefault(keys, keys)
+        return section
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The equivalent JSON dict (same keys, values and key order)"""
+        return {key: _unpack(self[key]) for key in self}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._order is not None:
+            return iter(self._order)
+        return self._natural_keys()
+
+    def _natural_keys(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        present = sum(1 for key in self.FIELDS if hasattr(self, key))
+        return present + (len(self._extra) if self._extra else 0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class BaseStats(CompactSection):
+    __slots__ = FIELDS = (
+        "hp",
+        "attack",
+        "defense",
+        "sp_attack",
+        "sp_defense",
+        "speed",
+        "total",
+    )
+
+
+class PhysicalInfo(CompactSection):
+    __slots__ = FIELDS = ("species", "height", "weight", "color", "shape", "footprint")
+
+
+class BreedingInfo(CompactSection):
+    __slots__ = FIELDS = (
+        "egg_groups",
+        "gender_ratio",
+        "egg_cycles",
+        "base_friendship",
+        "growth_rate",
+    )
+
+
+class GameMechanics(CompactSection):
+    __slots__ = FIELDS = ("catch_rate", "base_exp", "growth_rate", "ev_yield")
+
+
+class GameAppearance(CompactSection):
+    __slots__ = FIELDS = ("dex_number", "available", "location", "region", "dex_entry")
+
+
+class PokemonRecord(CompactSection):
+    """One Pokemon (form) with slotted sections"""
+
+    __slots__ = FIELDS = (
+        "ref_id",
+        "number",
+        "name",
+        "form",
+        "types",
+        "abilities",
+        "base_stats",
+        "physical_info",
+        "breeding_info",
+        "game_mechanics",
+        "evolution_info",
+        "game_appearances",
+        "dex_entries",
+    )
+    SECTIONS = {
+        "base_stats": BaseStats,
+        "physical_info": PhysicalInfo,
+        "breeding_info": BreedingInfo,
+        "game_mechanics": GameMechanics,
+    }
+    SECTION_MAPS = {"game_appearances": GameAppearance}
+
+    def __repr__(self) -> str:
+        return (
+            f"PokemonRecord(name={self.get('name')!r}, form={self.get('form')!r}, "
+            f"ref_id={self.get('ref_id')!r})"
+        )
+
+
+def compact_records(pokemon_data: List[Dict[str, Any]]) -> List[PokemonRecord]:
+    """Convert a loaded Pokemon list to PokemonRecords"""
+    return [PokemonRecord.from_dict(pokemon) for pokemon in pokemon_data]
+
+
+def to_dicts(records: List[PokemonRecord]) -> List[Dict[str, Any]]:
+    """Convert PokemonRecords back to JSON dicts (e.g. before saving)"""
+    return [record.to_dict() for record in records]
+
+
+def deep_size(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Bytes held by obj and everything it references (containers, slotted
+    sections, strings and numbers), counting shared objects once
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        total += sys.getsizeof(node)
+        if isinstance(node, dict):
+            stack.extend(node.keys())
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+        elif isinstance(node, CompactSection):
+            stack.extend(
+                getattr(node, key) for key in node.FIELDS if hasattr(node, key)
+            )
+            if node._extra is not None:
+                stack.append(node._extra)
+    return total
+
+
+def record_memory(pokemon: Dict[str, Any]) -> Dict[str, int]:
+    """Bytes used by one Pokemon as JSON dicts and as a PokemonRecord"""
+    return {
+        "dict_bytes": deep_size(pokemon),
+        "compact_bytes": deep_size(PokemonRecord.from_dict(pokemon)),
+    }
+
+
+def memory_report(pokemon_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Per-record memory of the dataset in both representations: mean and
+    largest record, plus the overall saving
+    """
+    sizes = [record_memory(pokemon) for pokemon in pokemon_data]
+    count = len(sizes)
+    if not count:
+        return {"records": 0}
+
+    dict_total = sum(size["dict_bytes"] for size in sizes)
+    compact_total = sum(size["compact_bytes"] for size in sizes)
+    return {
+        "records": count,
+        "dict_bytes_per_record": dict_total / count,
+        "compact_bytes_per_record": compact_total / count,
+        "dict_bytes_max": max(size["dict_bytes"] for size in sizes),
+        "compact_bytes_max": max(size["compact_bytes"] for size in sizes),
+        "saving": 1 - compact_total / dict_total if dict_total else 0.0,
+    }
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Interactive Query Shell
+A REPL over grab_info that loads every dataset and index once, then answers
+lookups, filters, learnset and availability queries from memory, printing
+how long each query took. Before each command the data files are checked
+and only the ones that changed are reloaded (outside the timed query).
+
+Start it with:
+    python main.py shell
+
+Type "help" for the commands; arguments with spaces can be quoted
+(pokemon "Mr. Mime"), options are key=value (learnset Pikachu 8 form=Normal).
+"""
+
+import cmd
+import json
+import shlex
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from . import grab_info
+    from .dataset_cache import assume_fresh
+    from .projection import json_default
+    from .query import STAT_CONDITION
+except ImportError:
+    import grab_info
+    from dataset_cache import assume_fresh
+    from projection import json_default
+    from query import STAT_CONDITION
+
+# Longest listing printed in full; longer ones are cut with "... N more"
+MAX_ROWS = 25
+
+
+def _parse(arg: str) -> Tuple[List[str], Dict[str, str]]:
+    """Positional arguments and key=value options of a command line"""
+    positional, options = [], {}
+    for token in shlex.split(arg):
+        key, sep, value = token.partition("=")
+        if sep and key and not STAT_CONDITION.match(token):
+            options[key] = value
+        else:
+            positional.append(token)
+    return positional, options
+
+
+def _int(value: Optional[str], what: str) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{what} must be an integer") from None
+
+
+def _pokemon_line(pokemon: Any) -> str:
+    form = pokemon.get("form")
+    form = f" ({form})" if form and form != "Normal" else ""
+    types = "/".join(pokemon.get("types") or [])
+    return f"{pokemon.get('number', ''):>6}  {pokemon.get('name', '')}{form}  {types}"
+
+
+class PokedexShell(cmd.Cmd):
+    """Interactive grab_info shell with per-query timing"""
+
+    intro = (
+        "Pokemon data shell - type 'help' for commands, 'quit' to leave.\n"
+        "Datasets are loaded once; changed files are reloaded automatically."
+    )
+    prompt = "pokedex> "
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.timing = True
+        self._query_end: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Loop plumbing
+    # ------------------------------------------------------------------
+
+    def preloop(self):
+        start = time.perf_counter()
+        loaded = grab_info.refresh_datasets()
+        print(
+            f"Loaded {', '.join(loaded) or 'nothing'} "
+            f"in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+
+    def precmd(self, line: str) -> str:
+        if line.strip() and line.split()[0] not in ("quit", "exit", "EOF", "help"):
+            start = time.perf_counter()
+            changed = grab_info.refresh_datasets()
+            if changed:
+                print(
+                    f"Reloaded {', '.join(changed)} "
+                    f"({(time.perf_counter() - start) * 1000:.0f} ms)"
+                )
+        return line
+
+    def onecmd(self, line: str) -> bool:
+        self._query_end = None
+        start = time.perf_counter()
+        try:
+            # Files were just checked in precmd; the query itself runs on memory
+            with assume_fresh():
+                stop = super().onecmd(line)
+        except Exception as e:
+            # A malformed query must not end the session
+            print(f"Error: {type(e).__name__}: {e}")
+            stop = False
+        end = self._query_end or time.perf_counter()
+        command = line.split()[0] if line.split() else ""
+        if self.timing and command and command not in ("quit", "exit", "EOF", "help"):
+            print(f"({(end - start) * 1000:.2f} ms)")
+        return stop
+
+    def _stop_timer(self):
+        """Marks the end of the query itself: printing its result is not timed"""
+        if self._query_end is None:
+            self._query_end = time.perf_counter()
+
+    def emptyline(self) -> bool:
+        return False
+
+    def default(self, line: str):
+        print(f"Unknown command '{line.split()[0]}' - type 'help'")
+
+    def _show(self, result: Any):
+        self._stop_timer()
+        if result is None:
+            print("Not found")
+        elif isinstance(result, list):
+            for row in result[:MAX_ROWS]:
+                if isinstance(row, Mapping) and "types" in row:
+                    print(_pokemon_line(row))
+                elif isinstance(row, Mapping):
+                    print("  " + ", ".join(f"{k}: {v}" for k, v in row.items()))
+                else:
+                    print(f"  {row}")
+            if len(result) > MAX_ROWS:
+                print(f"  ... {len(result) - MAX_ROWS} more")
+            print(f"{len(result)} result(s)")
+        elif isinstance(result, (Mapping, dict)):
+            print(
+                json.dumps(result, indent=2, ensure_ascii=False, default=json_default)
+            )
+        else:
+            print(result)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def do_pokemon(self, arg: str):
+        """pokemon <name|number|ref_id> [form=Alolan] [fields=name,types,base_stats.speed]"""
+        positional, options = _parse(arg)
+        if not positional:
+            raise ValueError("usage: pokemon <name|number|ref_id>")
+        fields = options.get("fields")
+        if "form" in options:
+            result = grab_info.get_pokemon_by_name(
+                positional[0], options["form"], fields=fields
+            )
+        else:
+            result = grab_info.get_many([positional[0]], fields=fields)[0]
+        self._show(result)
+
+    def do_search(self, arg: str):
+        """search <text> [kind=pokemon|move|ability|item] [limit=10]"""
+        positional, options = _parse(arg)
+        kinds = [options["kind"]] if "kind" in options else None
+        limit = _int(options.get("limit"), "limit") or 10
+        matches = grab_info.search_names(" ".join(positional), limit, kinds)
+        self._stop_timer()
+        for match in matches:
+            print(f"  {match['score']:.2f}  {match['kind']:<8} {match['name']}")
+
+    def do_move(self, arg: str):
+        """move <name> [generation] - defaults to the newest generation with moves"""
+        positional, _ = _parse(arg)
+        if not positional:
+            raise ValueError("usage: move <name> [generation]")
+        generation = _int(positional[1], "generation") if len(positional) > 1 else None
+        self._show(grab_info.get_move(positional[0], generation))
+
+    def do_abilityinfo(self, arg: str):
+        """abilityinfo <ability> - ability description and interactions"""
+        positional, _ = _parse(arg)
+        self._show(grab_info.get_ability(" ".join(positional)))
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+
+    def do_type(self, arg: str):
+        """type <type> [<type>] - Pokemon with every given type"""
+        positional, _ = _parse(arg)
+        self._show(grab_info.get_pokemon_by_type(*positional))
+
+    def do_ability(self, arg: str):
+        """ability <ability> - Pokemon that can have the ability"""
+        positional, _ = _parse(arg)
+        self._show(grab_info.get_pokemon_by_ability(" ".join(positional)))
+
+    def do_egg(self, arg: str):
+        """egg <egg group> - Pokemon in an egg group"""
+        positional, _ = _parse(arg)
+        self._show(grab_info.get_pokemon_by_egg_group(" ".join(positional)))
+
+    def do_top(self, arg: str):
+        """top <stat>[,<stat>...] [k=10] [type=Dragon] [generation=4] - best weighted stat totals"""
+        positional, options = _parse(arg)
+        if not positional:
+            raise ValueError("usage: top <stat>[,<stat>...]")
+        weights = {stat: 1 for stat in positional[0].split(",")}
+        self._show(
+            grab_info.get_top_pokemon(
+                weights,
+                k=_int(options.get("k"), "k") or 10,
+                type_name=options.get("type"),
+                generation=_int(options.get("generation"), "generation"),
+            )
+        )
+
+    def _build_query(self, arg: str):
+        positional, options = _parse(arg)
+        query = grab_info.query()
+        for attribute in ("type", "ability", "egg_group", "growth_rate", "in_game"):
+            if attribute in options:
+                query = getattr(query, attribute)(options[attribute])
+        if "learns" in options:
+            query = query.learns(
+                options["learns"], _int(options.get("generation"), "generation")
+            )
+        for condition in positional:
+            match = STAT_CONDITION.match(condition)
+            if not match:
+                raise ValueError(f"Invalid stat condition '{condition}'")
+            query = query.stat(match.group(1), match.group(2), int(match.group(3)))
+        return query
+
+    def do_query(self, arg: str):
+        """query [type=] [ability=] [egg_group=] [growth_rate=] [in_game=] [learns= [generation=]] [speed>100 ...]"""
+        self._show(self._build_query(arg).all())
+
+    def do_explain(self, arg: str):
+        """explain <query arguments> - show and run the query plan"""
+        plan = self._build_query(arg).explain(analyze=True)
+        self._stop_timer()
+        print(plan)
+
+    # ------------------------------------------------------------------
+    # Games, availability and learnsets
+    # ------------------------------------------------------------------
+
+    def do_game(self, arg: str):
+        """game <game> - regional dex listing"""
+        positional, _ = _parse(arg)
+        self._show(grab_info.get_pokemon_in_game(" ".join(positional)))
+
+    def do_count(self, arg: str):
+        """count <game> - number of Pokemon available in a game"""
+        positional, _ = _parse(arg)
+        self._show(grab_info.count_pokemon_in_game(" ".join(positional)))
+
+    def do_availability(self, arg: str):
+        """availability <pokemon> - games the Pokemon appears in"""
+        positional, _ = _parse(arg)
+        appearances = grab_info.get_pokemon_game_availability(" ".join(positional))
+        self._stop_timer()
+        if appearances is None:
+            print("Not found")
+            return
+        available = [
+            (game, (data or {}).get("dex_number"))
+            for game, data in appearances.items()
+            if (data or {}).get("available")
+        ]
+        for game, dex_number in available:
+            print(f"  {game:<28} #{dex_number}" if dex_number else f"  {game}")
+        print(f"{len(available)} game(s)")
+
+    def do_learnset(self, arg: str):
+        """learnset <pokemon> [generation] [form=Normal]"""
+        positional, options = _parse(arg)
+        if not positional:
+            raise ValueError("usage: learnset <pokemon> [generation]")
+        generation = _int(positional[1], "generation") if len(positional) > 1 else None
+        learnsets = grab_info.get_pokemon_learnset(
+            positional[0], generation, options.get("form", "Normal")
+        )
+        self._stop_timer()
+        if generation is not None:
+            learnsets = {generation: learnsets}
+        total = 0
+        for gen, moves in learnsets.items():
+            print(f"Generation {gen}: {len(moves)} moves")
+            for move in moves[:MAX_ROWS]:
+                level = f" (level {move['level']})" if move["level"] is not None else ""
+                print(f"  {move['method']:<12} {move['move']}{level}")
+            if len(moves) > MAX_ROWS:
+                print(f"  ... {len(moves) - MAX_ROWS} more")
+            total += len(moves)
+        if not total:
+            print("No learnset data")
+
+    # ------------------------------------------------------------------
+    # Session
+    # ------------------------------------------------------------------
+
+    def do_stats(self, arg: str):
+        """stats - dataset cache and result cache counters"""
+        self._show(grab_info.cache_stats())
+
+    def do_reload(self, arg: str):
+        """reload - check the data files now (also done before every command)"""
+        print("Data files checked")
+
+    def do_timing(self, arg: str):
+        """timing on|off - show per-query timing"""
+        self.timing = arg.strip().lower() != "off"
+
+    def do_quit(self, arg: str) -> bool:
+        """quit - leave the shell"""
+        return True
+
+    do_exit = do_quit
+
+    def do_EOF(self, arg: str) -> bool:
+        """Ctrl+D - leave the shell"""
+        print()
+        return True
+
+
+def run_shell():
+    """Start the interactive shell"""
+    try:
+        PokedexShell().cmdloop()
+    except KeyboardInterrupt:
+        print()
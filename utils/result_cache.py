@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Query Result Cache
+Bounded LRU cache for the results of repeated grab_info queries (per-game
+listings, learnsets, filtered stat scans, ...). Every key includes the
+version of the datasets the query reads, so saving a data file - or a
+background reload - makes the old entries unreachable without an explicit
+flush; they age out of the LRU.
+
+    _results = ResultCache(maxsize=512)
+
+    @_results.cached(_pokemon_cache)
+    def get_pokemon_by_type(*type_names): ...
+
+Returned lists and dicts are shallow copies, so callers may sort or extend
+them; the records inside are shared, as everywhere else in grab_info.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+try:
+    from .dataset_cache import CachedDataset
+except ImportError:
+    from dataset_cache import CachedDataset
+
+DEFAULT_MAXSIZE = 512
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable stand-in for an argument (dicts and lists become tuples)"""
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return ("__set__",) + tuple(sorted(value))
+    hash(value)
+    return value
+
+
+def _copy(result: Any) -> Any:
+    if isinstance(result, list):
+        return list(result)
+    if isinstance(result, dict):
+        return dict(result)
+    return result
+
+
+class ResultCache:
+    """Thread-safe LRU of function results keyed by dataset version and arguments"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._functions: Dict[str, Dict[str, int]] = {}
+
+    def cached(self, *datasets: CachedDataset) -> Callable:
+        """Decorator: cache a function whose result depends only on its
+        arguments and the given datasets."""
+
+        def decorator(func: Callable) -> Callable:
+            name = func.__name__
+            counters = self._functions.setdefault(name, {"hits": 0, "misses": 0})
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if self.maxsize <= 0:
+                    return func(*args, **kwargs)
+                try:
+                    key = (
+                        name,
+                        tuple(dataset.version() for dataset in datasets),
+                        _freeze(args),
+                        _freeze(kwargs),
+                    )
+                except TypeError:
+                    self.uncacheable += 1
+                    return func(*args, **kwargs)
+
+                with self._lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        counters["hits"] += 1
+                        return _copy(self._entries[key])
+
+                # Computed outside the lock: concurrent misses may both run
+                result = func(*args, **kwargs)
+                with self._lock:
+                    self.misses += 1
+                    counters["misses"] += 1
+                    self._entries[key] = result
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+                return _copy(result)
+
+            wrapper.uncached = func
+            return wrapper
+
+        return decorator
+
+    def clear(self):
+        """Drop every cached result (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, maxsize: int):
+        """Change the capacity, evicting least recently used entries; 0 disables caching"""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+                "functions": {
+                    name: dict(counters) for name, counters in self._functions.items()
+                },
+            }
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Lazy Section Store
+Splits a record dataset into a light part that is decoded at load time and
+heavy per-record sections (dex entries, game appearances, evolution info)
+that are decoded from a memory-mapped side file only when first accessed.
+
+Store layout (``data/pokemon_data.json`` -> ``data/pokemon_data.sections``):
+    6 bytes   magic  b"PKSECT"
+    2 bytes   format version (big-endian uint16)
+    8 bytes   size of the JSON source the store was built from (uint64)
+    8 bytes   length of the light block (uint64)
+    ...       light block: MessagePack {"records": [...], "offsets": [...]}
+    ...       heavy block: one MessagePack map of heavy sections per record
+
+In the light records each heavy value is replaced by a placeholder, so key
+order is preserved. offsets[i] is [start, length] of record i's heavy map
+within the heavy block (None when it has no heavy sections).
+
+Like snapshots, a store is used only while it is at least as new as its
+JSON source with a matching source size; otherwise it is rebuilt. Requires
+msgpack - without it load_lazy_dataset returns fully decoded records.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .interning import intern_strings
+    from .snapshot import load_dataset, msgpack
+except ImportError:
+    from interning import intern_strings
+    from snapshot import load_dataset, msgpack
+
+SECTION_STORE_MAGIC = b"PKSECT"
+SECTION_STORE_FORMAT = 1
+SECTION_STORE_SUFFIX = ".sections"
+
+# Large sections most callers never read
+HEAVY_SECTIONS = ("dex_entries", "game_appearances", "evolution_info")
+
+_HEADER = struct.Struct(">6sHQQ")
+_PLACEHOLDER_CODE = 1
+
+
+class _Deferred:
+    """Marks a heavy section that has not been decoded yet"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<deferred>"
+
+
+_DEFERRED = _Deferred()
+
+
+def section_store_path(json_path: str) -> str:
+    """Path of the section store that belongs to a JSON data file"""
+    return os.path.splitext(json_path)[0] + SECTION_STORE_SUFFIX
+
+
+def write_section_store(
+    records: List[Dict[str, Any]],
+    json_path: str,
+    heavy: Tuple[str, ...] = HEAVY_SECTIONS,
+) -> Optional[str]:
+    """Write the section store for already-decoded records. Returns its path."""
+    if msgpack is None:
+        return None
+
+    placeholder = msgpack.ExtType(_PLACEHOLDER_CODE, b"")
+    light_records = []
+    offsets = []
+    heavy_blobs = []
+    position = 0
+    for record in records:
+        sections = {key: record[key] for key in heavy if key in record}
+        light_records.append(
+            {
+                key: placeholder if key in sections else value
+                for key, value in record.items()
+            }
+        )
+        if sections:
+            blob = msgpack.packb(sections, use_bin_type=True)
+            offsets.append([position, len(blob)])
+            heavy_blobs.append(blob)
+            position += len(blob)
+        else:
+            offsets.append(None)
+
+    light = msgpack.packb(
+        {"records": light_records, "offsets": offsets}, use_bin_type=True
+    )
+    try:
+        source_size = os.path.getsize(json_path)
+        path = section_store_path(json_path)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    SECTION_STORE_MAGIC, SECTION_STORE_FORMAT, source_size, len(light)
+                )
+            )
+            f.write(light)
+            for blob in heavy_blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+        return path
+    except OSError as e:
+        print(f"Warning: Could not write section store for {json_path}: {e}")
+        return None
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _PLACEHOLDER_CODE:
+        return _DEFERRED
+    return msgpack.ExtType(code, data)
+
+
+class SectionStore:
+    """An open section store: light records in memory, heavy block mmapped"""
+
+    def __init__(self, path: str, source_size: int):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, stored_size, light_length = _HEADER.unpack_from(self._mm, 0)
+        if (
+            magic != SECTION_STORE_MAGIC
+            or version != SECTION_STORE_FORMAT
+            or stored_size != source_size
+        ):
+            self._mm.close()
+            raise ValueError(f"Section store {path} is stale or invalid")
+
+        light = msgpack.unpackb(
+            self._mm[_HEADER.size : _HEADER.size + light_length],
+            raw=False,
+            strict_map_key=False,
+            ext_hook=_ext_hook,
+        )
+        self.path = path
+        self.offsets: List[Optional[List[int]]] = light["offsets"]
+        self.light_records: List[Dict[str, Any]] = intern_strings(light["records"])
+        self._heavy_start = _HEADER.size + light_length
+        self.sections_loaded = 0
+
+    def load_sections(self, index: int) -> Dict[str, Any]:
+        """Decode the heavy sections of one record"""
+        entry = self.offsets[index]
+        if entry is None:
+            return {}
+        start = self._heavy_start + entry[0]
+        sections = msgpack.unpackb(
+            self._mm[start : start + entry[1]], raw=False, strict_map_key=False
+        )
+        self.sections_loaded += 1
+        return intern_strings(sections)
+
+    def records(self) -> List["LazyRecord"]:
+        """One LazyRecord per stored record, in dataset order"""
+        return [
+            LazyRecord(self, light, index)
+            for index, light in enumerate(self.light_records)
+        ]
+
+
+class LazyRecord(Mapping):
+    """
+    Read-only Mapping over one record whose heavy sections are decoded on
+    first access (all of that record's heavy sections at once).
+    """
+
+    __slots__ = ("_data", "_store", "_index")
+
+    def __init__(self, store: SectionStore, data: Dict[str, Any], index: int):
+        self._data = data
+        self._store = store
+        self._index = index
+
+    def _materialize(self):
+        # Two threads may both decode the same record; the results are equal
+        # and each assignment replaces a placeholder, so the race is benign
+        for key, value in self._store.load_sections(self._index).items():
+            self._data[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if value is _DEFERRED:
+            self._materialize()
+            value = self._data[key]
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the heavy sections have been decoded"""
+        return not any(value is _DEFERRED for value in self._data.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The full JSON dict (decodes the heavy sections if needed)"""
+        return {key: self[key] for key in self._data}
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyRecord(name={self._data.get('name')!r}, "
+            f"form={self._data.get('form')!r}, loaded={self.loaded})"
+        )
+
+
+def open_section_store(json_path: str) -> Optional[SectionStore]:
+    """
+    Open the section store for json_path if it is valid and not older than
+    the JSON source, else None. Raises FileNotFoundError if the JSON is missing.
+    """
+    source_stat = os.stat(json_path)
+    if msgpack is None:
+        return None
+
+    path = section_store_path(json_path)
+    try:
+        if os.stat(path).st_mtime_ns < source_stat.st_mtime_ns:
+            return None
+        return SectionStore(path, source_stat.st_size)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+
+def load_lazy_dataset(json_path: str) -> List[Any]:
+    """
+    Load a record list with heavy sections deferred. Builds the section
+    store from a full load the first time (or when the JSON changed).
+    """
+    store = open_section_store(json_path)
+    if store is None:
+        data = load_dataset(json_path)
+        if msgpack is None or not isinstance(data, list):
+            return data
+        write_section_store(data, json_path)
+        del data
+        store = open_section_store(json_path)
+        if store is None:
+            return load_dataset(json_path)
+    return store.records()
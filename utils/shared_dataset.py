@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Shared Columnar Dataset
+Publishes the numeric core of the Pokemon data (base stats, national
+numbers, type/ability relations, per-game availability bitmaps and regional
+dex numbers, the learnset relation) plus one deduplicated string table into
+a single flat buffer - a file to mmap or a multiprocessing.shared_memory
+segment. Worker processes attach without copying and read everything
+through read-only NumPy views, so N workers share one copy of the data.
+
+Buffer layout:
+    6 bytes   magic  b"PKSHAR"
+    2 bytes   format version (big-endian uint16)
+    4 bytes   header length (big-endian uint32)
+    ...       JSON header: {"arrays": {name: {dtype, shape, offset}}, ...}
+    ...       arrays, each 64-byte aligned
+
+Publisher (one process):
+    python utils/shared_dataset.py --file data/shared_dataset.bin
+    python utils/shared_dataset.py --shm pokedata      (stays up; Ctrl+C unlinks)
+
+Worker:
+    dataset = SharedDataset.open("data/shared_dataset.bin")   # or .attach("pokedata")
+    fast = dataset.column("speed") > 100
+"""
+
+import argparse
+import json
+import mmap
+import os
+import signal
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from . import grab_info
+    from .fuzzy_search import normalize_name
+    from .indexes import INVERTED_ATTRIBUTES
+    from .learnset_index import learnset_key
+    from .stat_matrix import STAT_COLUMNS, StatMatrix
+except ImportError:
+    import grab_info
+    from fuzzy_search import normalize_name
+    from indexes import INVERTED_ATTRIBUTES
+    from learnset_index import learnset_key
+    from stat_matrix import STAT_COLUMNS, StatMatrix
+
+SHARED_MAGIC = b"PKSHAR"
+SHARED_FORMAT = 1
+
+_PREFIX = struct.Struct(">6sHI")
+_ALIGNMENT = 64
+
+
+class _StringTable:
+    """Deduplicating string -> id table"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.ids)
+        return string_id
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        encoded = [value.encode("utf-8") for value in self.ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(data) for data in encoded])
+        return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _relation(strings: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR layout: ids of Pokemon i are values[offsets[i]:offsets[i + 1]]"""
+    offsets = np.zeros(len(strings) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(values) for values in strings])
+    values = np.array([v for values in strings for v in values], dtype=np.int32)
+    return offsets, values
+
+
+def build_arrays() -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Columnar arrays for the current grab_info datasets"""
+    data = grab_info.get_all_pokemon()
+    count = len(data)
+    strings = _StringTable()
+    matrix = StatMatrix(data)
+
+    names = np.array([strings.add(p.get("name")) for p in data], dtype=np.int32)
+    forms = np.array([strings.add(p.get("form")) for p in data], dtype=np.int32)
+    ref_ids = np.array([strings.add(p.get("ref_id")) for p in data], dtype=np.int32)
+
+    type_offsets, type_ids = _relation(
+        [[strings.add(t) for t in p.get("types") or []] for p in data]
+    )
+    ability_offsets, ability_ids = _relation(
+        [[strings.add(a) for a in INVERTED_ATTRIBUTES["ability"](p)] for p in data]
+    )
+
+    # Per-game availability (packed bits) and regional dex numbers (-1 = none)
+    games = grab_info.game_availability_index()
+    game_names = games.games()
+    game_ids = np.array([strings.add(game) for game in game_names], dtype=np.int32)
+    availability = np.zeros((len(game_names), (count + 7) // 8), dtype=np.uint8)
+    game_dex = np.full((len(game_names), count), -1, dtype=np.int16)
+    for row, game in enumerate(game_names):
+        mask = np.zeros(count, dtype=bool)
+        mask[list(games.in_game(game))] = True
+        availability[row] = np.packbits(mask, bitorder="little")
+        for pokemon_id in games.dex_order[game]:
+            dex_number = data[pokemon_id]["game_appearances"][game].get("dex_number")
+            if dex_number:
+                game_dex[row, pokemon_id] = dex_number
+
+    # Learnset relation sorted by Pokemon, generation, method, level
+    pokemon_ids = {}
+    for pokemon_id, pokemon in enumerate(data):
+        if pokemon.get("name"):
+            pokemon_ids.setdefault(
+                learnset_key(pokemon["name"], pokemon.get("form")), pokemon_id
+            )
+    learn_rows = []
+    for generation, learnsets in grab_info.learnset_index()["learnsets"].items():
+        for key, entry in learnsets.items():
+            pokemon_id = pokemon_ids.get(key)
+            if pokemon_id is None:
+                continue
+            for move, method, level in entry["moves"]:
+                learn_rows.append(
+                    (
+                        pokemon_id,
+                        int(generation),
+                        strings.add(method),
+                        level if isinstance(level, int) else -1,
+                        strings.add(move),
+                    )
+                )
+    learn_rows.sort()
+    learn = np.array(learn_rows, dtype=np.int64).reshape(-1, 5)
+    learn_offsets = np.searchsorted(learn[:, 0], np.arange(count + 1)).astype(np.int64)
+
+    string_offsets, string_data = strings.arrays()
+    arrays = {
+        "stats": matrix.stats,
+        "valid": matrix.valid,
+        "generation": matrix.generation,
+        "name": names,
+        "form": forms,
+        "ref_id": ref_ids,
+        "type_offsets": type_offsets,
+        "type_ids": type_ids,
+        "ability_offsets": ability_offsets,
+        "ability_ids": ability_ids,
+        "games": game_ids,
+        "availability": availability,
+        "game_dex": game_dex,
+        "learn_offsets": learn_offsets,
+        "learn_generation": learn[:, 1].astype(np.int8),
+        "learn_method": learn[:, 2].astype(np.int32),
+        "learn_level": learn[:, 3].astype(np.int16),
+        "learn_move": learn[:, 4].astype(np.int32),
+        "string_offsets": string_offsets,
+        "string_data": string_data,
+    }
+    metadata = {"count": count, "dataset_version": grab_info.dataset_version()}
+    return arrays, metadata
+
+
+def serialize(arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> bytes:
+    """Pack arrays into the shared buffer layout"""
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    header = json.dumps({**metadata, "format": SHARED_FORMAT, "arrays": layout}).encode(
+        "utf-8"
+    )
+    data_start = -(-(_PREFIX.size + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+    buffer = bytearray(data_start + offset)
+    _PREFIX.pack_into(buffer, 0, SHARED_MAGIC, SHARED_FORMAT, len(header))
+    buffer[_PREFIX.size : _PREFIX.size + len(header)] = header
+    for name, array in arrays.items():
+        start = data_start + layout[name]["offset"]
+        buffer[start : start + array.nbytes] = np.ascontiguousarray(array).tobytes()
+    return bytes(buffer)
+
+
+def publish_to_file(path: str) -> int:
+    """Write the shared buffer to a file for workers to mmap. Returns its size."""
+    blob = serialize(*build_arrays())
+    # Unique temp name: workers may rebuild a stale file concurrently
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(blob)
+
+
+def publish_to_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Copy the shared buffer into a new shared memory segment. The caller owns
+    the segment: keep the returned object alive while workers use it, then
+    close() and unlink() it.
+    """
+    blob = serialize(*build_arrays())
+    segment = shared_memory.SharedMemory(name=name, create=True, size=len(blob))
+    segment.buf[: len(blob)] = blob
+    return segment
+
+
+# Buffers whose close() had to wait for arrays a caller still holds
+_deferred_owners: List[Any] = []
+
+
+def _close_owner(owner: Any) -> bool:
+    try:
+        owner.close()
+    except BufferError:
+        return False
+    return True
+
+
+class SharedDataset:
+    """Read-only, zero-copy view of a published shared buffer"""
+
+    def __init__(self, buffer: Any, owner: Any = None):
+        self._owner = owner
+        magic, version, header_length = _PREFIX.unpack_from(buffer, 0)
+        if magic != SHARED_MAGIC or version != SHARED_FORMAT:
+            raise ValueError("Not a shared Pokemon dataset buffer")
+        header = json.loads(
+            bytes(buffer[_PREFIX.size : _PREFIX.size + header_length]).decode("utf-8")
+        )
+        data_start = -(-(_PREFIX.size + header_length) // _ALIGNMENT) * _ALIGNMENT
+
+        self.count: int = header["count"]
+        self.dataset_version: str = header["dataset_version"]
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            shape = tuple(spec["shape"])
+            array = np.frombuffer(
+                buffer,
+                dtype=dtype,
+                count=int(np.prod(shape)),
+                offset=data_start + spec["offset"],
+            ).reshape(shape)
+            array.flags.writeable = False
+            self.arrays[name] = array
+
+        self._string_offsets = self.arrays["string_offsets"]
+        self._string_data = self.arrays["string_data"]
+        self._string_ids: Optional[Dict[str, int]] = None
+        self._pokemon_ids: Optional[Dict[Tuple[str, str], int]] = None
+        self._move_ids: Optional[Dict[str, List[int]]] = None
+
+    @classmethod
+    def open(cls, path: str, rebuild: bool = True) -> "SharedDataset":
+        """
+        Attach to a published file (memory-mapped, shared page cache). A file
+        built from other data files than the current ones is republished
+        first (rebuild=False raises ValueError instead).
+        """
+        dataset = cls._map(path) if os.path.exists(path) else None
+        if dataset is not None and dataset.is_current():
+            return dataset
+        if dataset is not None:
+            dataset.close()
+        if not rebuild:
+            raise ValueError(f"{path} is stale or missing; republish it")
+        publish_to_file(path)
+        return cls._map(path)
+
+    @classmethod
+    def _map(cls, path: str) -> "SharedDataset":
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, mapped)
+
+    @classmethod
+    def attach(cls, name: str, check_version: bool = True) -> "SharedDataset":
+        """
+        Attach to a published shared memory segment. Raises ValueError if the
+        segment was built from other data files than the current ones (the
+        publisher owns it and must republish).
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers every attachment with the resource
+            # tracker, which would unlink the publisher's segment when this
+            # worker exits
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: (
+                None if rtype == "shared_memory" else register(name, rtype)
+            )
+            try:
+                segment = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        dataset = cls(segment.buf, segment)
+        if check_version and not dataset.is_current():
+            dataset.close()
+            raise ValueError(f"Shared segment '{name}' is stale; republish it")
+        return dataset
+
+    def is_current(self) -> bool:
+        """True if the buffer was built from the data files as they are now"""
+        return self.dataset_version == grab_info.dataset_version()
+
+    def close(self):
+        """
+        Release the views and detach from the buffer. Arrays obtained from
+        the dataset (column(), arrays[...]) keep pointing into the buffer, so
+        while a caller still holds one the buffer cannot be unmapped yet: it
+        is then released by a later close() once those arrays are gone.
+        """
+        self.arrays.clear()
+        self._string_offsets = self._string_data = None
+        _deferred_owners[:] = [o for o in _deferred_owners if not _close_owner(o)]
+        if self._owner is not None:
+            if not _close_owner(self._owner):
+                _deferred_owners.append(self._owner)
+            self._owner = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ------------------------------------------------------------------
+    # Strings
+    # ------------------------------------------------------------------
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode one entry of the string table (-1 is None)"""
+        if string_id < 0:
+            return None
+        start, end = self._string_offsets[string_id : string_id + 2]
+        return self._string_data[start:end].tobytes().decode("utf-8")
+
+    def string_id(self, value: str) -> int:
+        """Id of a string in the table, or -1"""
+        if self._string_ids is None:
+            self._string_ids = {
+                self.string(i): i for i in range(len(self._string_offsets) - 1)
+            }
+        return self._string_ids.get(value, -1)
+
+    def _strings(self, name: str, pokemon_id: int) -> List[str]:
+        offsets = self.arrays[f"{name}_offsets"]
+        ids = self.arrays[f"{name}_ids"][offsets[pokemon_id] : offsets[pokemon_id + 1]]
+        return [self.string(int(i)) for i in ids]
+
+    # ------------------------------------------------------------------
+    # Per-Pokemon access
+    # ------------------------------------------------------------------
+
+    def name(self, pokemon_id: int) -> Optional[str]:
+        return self.string(int(self.arrays["name"][pokemon_id]))
+
+    def form(self, pokemon_id: int) -> Optional[str]:
+        return self.string(int(self.arrays["form"][pokemon_id]))
+
+    def ref_id(self, pokemon_id: int) -> Optional[str]:
+        return self.string(int(self.arrays["ref_id"][pokemon_id]))
+
+    def types(self, pokemon_id: int) -> List[str]:
+        return self._strings("type", pokemon_id)
+
+    def abilities(self, pokemon_id: int) -> List[str]:
+        return self._strings("ability", pokemon_id)
+
+    def find(self, name: str, form: Optional[str] = None) -> Optional[int]:
+        """Pokemon id by name (case-insensitive) and optional form"""
+        if self._pokemon_ids is None:
+            ids: Dict[Tuple[str, str], int] = {}
+            for pokemon_id in range(self.count):
+                pokemon_name = self.name(pokemon_id)
+                if pokemon_name:
+                    key = pokemon_name.casefold()
+                    pokemon_form = (self.form(pokemon_id) or "Normal").casefold()
+                    ids.setdefault((key, pokemon_form), pokemon_id)
+                    ids.setdefault((key, ""), pokemon_id)
+            self._pokemon_ids = ids
+        return self._pokemon_ids.get((name.casefold(), (form or "").casefold()))
+
+    def learnset(
+        self, pokemon_id: int, generation: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """[{"generation", "move", "method", "level"}] for one Pokemon"""
+        offsets = self.arrays["learn_offsets"]
+        rows = slice(int(offsets[pokemon_id]), int(offsets[pokemon_id + 1]))
+        generations = self.arrays["learn_generation"][rows]
+        moves = self.arrays["learn_move"][rows]
+        methods = self.arrays["learn_method"][rows]
+        levels = self.arrays["learn_level"][rows]
+        return [
+            {
+                "generation": int(generations[i]),
+                "move": self.string(int(moves[i])),
+                "method": self.string(int(methods[i])),
+                "level": int(levels[i]) if levels[i] >= 0 else None,
+            }
+            for i in range(len(moves))
+            if generation is None or generations[i] == generation
+        ]
+
+    # ------------------------------------------------------------------
+    # Vectorized masks (one bool per Pokemon id)
+    # ------------------------------------------------------------------
+
+    def column(self, stat: str) -> np.ndarray:
+        """One base stat for every Pokemon (read-only view)"""
+        return self.arrays["stats"][:, STAT_COLUMNS.index(stat)]
+
+    def type_mask(self, type_name: str) -> np.ndarray:
+        return self._relation_mask("type", type_name)
+
+    def ability_mask(self, ability_name: str) -> np.ndarray:
+        return self._relation_mask("ability", ability_name)
+
+    def _relation_mask(self, name: str, value: str) -> np.ndarray:
+        string_id = self.string_id(value)
+        offsets = self.arrays[f"{name}_offsets"]
+        hits = np.flatnonzero(self.arrays[f"{name}_ids"] == string_id)
+        mask = np.zeros(self.count, dtype=bool)
+        mask[np.searchsorted(offsets, hits, side="right") - 1] = True
+        return mask
+
+    def game_mask(self, game: str) -> np.ndarray:
+        """Pokemon available in a game"""
+        rows = np.flatnonzero(self.arrays["games"] == self.string_id(game))
+        if rows.size == 0:
+            return np.zeros(self.count, dtype=bool)
+        bits = self.arrays["availability"][rows[0]]
+        return np.unpackbits(bits, count=self.count, bitorder="little").astype(bool)
+
+    def learners_mask(self, move: str, generation: Optional[int] = None) -> np.ndarray:
+        """Pokemon that learn a move (in one generation, or in any)"""
+        if self._move_ids is None:
+            move_ids: Dict[str, List[int]] = {}
+            for string_id in np.unique(self.arrays["learn_move"]).tolist():
+                move_key = normalize_name(self.string(string_id))
+                move_ids.setdefault(move_key, []).append(string_id)
+            self._move_ids = move_ids
+        # Spellings differ across generations ("SolarBeam" / "Solar Beam")
+        hits = np.isin(
+            self.arrays["learn_move"], self._move_ids.get(normalize_name(move), [])
+        )
+        if generation is not None:
+            hits &= self.arrays["learn_generation"] == generation
+        mask = np.zeros(self.count, dtype=bool)
+        rows = np.flatnonzero(hits)
+        mask[np.searchsorted(self.arrays["learn_offsets"], rows, side="right") - 1] = (
+            True
+        )
+        return mask
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish the shared Pokemon dataset")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--file", help="write the buffer to this file (mmap)")
+    target.add_argument("--shm", help="publish into this shared memory segment")
+    args = parser.parse_args()
+
+    if args.file:
+        size = publish_to_file(args.file)
+        print(f"Wrote {size / 1024 / 1024:.1f} MB to {args.file}")
+        return
+
+    segment = publish_to_shared_memory(args.shm)
+    print(
+        f"Published {segment.size / 1024 / 1024:.1f} MB as '{args.shm}' (Ctrl+C to stop)"
+    )
+    # Unlink on SIGTERM too, not only on Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        signal.pause()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        segment.close()
+        segment.unlink()
+        print(f"Unlinked '{args.shm}'")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
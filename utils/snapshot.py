@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Binary Dataset Snapshots
+Versioned MessagePack snapshots stored next to each JSON data file so loads
+can skip JSON decoding.
+
+Snapshot layout (``data/moves_data_gen1.json`` -> ``data/moves_data_gen1.msgpack``):
+    6 bytes   magic  b"PKSNAP"
+    2 bytes   schema version (big-endian uint16)
+    8 bytes   size of the JSON source the snapshot was built from (uint64)
+    ...       MessagePack payload
+
+A snapshot is only used while it is at least as new as its JSON source and the
+recorded source size still matches; otherwise the JSON file is decoded and the
+snapshot rebuilt. msgpack is optional - without it everything falls back to JSON.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Optional
+
+try:
+    from .interning import intern_strings
+except ImportError:
+    from interning import intern_strings
+
+try:
+    import msgpack
+except ImportError:  # Snapshots are an optional speed-up
+    msgpack = None
+
+SNAPSHOT_MAGIC = b"PKSNAP"
+SNAPSHOT_SCHEMA_VERSION = 1
+SNAPSHOT_SUFFIX = ".msgpack"
+
+_HEADER = struct.Struct(">6sHQ")
+
+
+def snapshot_path(json_path: str) -> str:
+    """Path of the binary snapshot that belongs to a JSON data file"""
+    return os.path.splitext(json_path)[0] + SNAPSHOT_SUFFIX
+
+
+def _json_keys_only(data: Any) -> bool:
+    """True if every dict key is a string, as in data decoded from JSON"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    return False
+                if isinstance(item, (dict, list, tuple)):
+                    stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(
+                item for item in value if isinstance(item, (dict, list, tuple))
+            )
+    return True
+
+
+def write_snapshot(data: Any, json_path: str) -> Optional[str]:
+    """
+    Write a snapshot of already-decoded data for json_path. Returns its path.
+    Data with non-string dict keys gets no snapshot: json.dump turns those
+    keys into strings, MessagePack would keep them, and the snapshot would
+    decode differently from its JSON source.
+    """
+    if msgpack is None:
+        return None
+
+    try:
+        if not _json_keys_only(data):
+            raise TypeError("non-string dict keys would not round-trip like JSON")
+        source_size = os.path.getsize(json_path)
+        path = snapshot_path(json_path)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA_VERSION, source_size))
+            f.write(msgpack.packb(data, use_bin_type=True))
+        os.replace(tmp_path, path)
+        return path
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write snapshot for {json_path}: {e}")
+        return None
+
+
+def read_snapshot(json_path: str) -> Optional[Any]:
+    """
+    Load the snapshot for json_path if it is valid and not older than the JSON
+    source. Returns None when the caller should fall back to the JSON file.
+    Raises FileNotFoundError if the JSON source itself does not exist.
+    """
+    source_stat = os.stat(json_path)
+    if msgpack is None:
+        return None
+
+    path = snapshot_path(json_path)
+    try:
+        if os.stat(path).st_mtime_ns < source_stat.st_mtime_ns:
+            return None
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, schema_version, source_size = _HEADER.unpack(header)
+            if (
+                magic != SNAPSHOT_MAGIC
+                or schema_version != SNAPSHOT_SCHEMA_VERSION
+                or source_size != source_stat.st_size
+            ):
+                return None
+            return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+    except (OSError, ValueError):
+        return None
+
+
+def load_dataset(json_path: str) -> Any:
+    """
+    Load a data file, preferring its binary snapshot. When the snapshot is
+    missing or stale the JSON is decoded and the snapshot rebuilt for next time.
+    Categorical strings in the result are interned.
+    """
+    data = read_snapshot(json_path)
+    if data is None:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        write_snapshot(data, json_path)
+    return intern_strings(data)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Base Stat Matrix
+Dense int16 matrix of base stats aligned with Pokemon ids (positions in the
+dataset), with vectorized range filters, weighted scores, top-k selection and
+per-generation / per-type grouping.
+
+Example - top 20 physical sweepers by Atk+Spe among Fire types:
+    matrix = StatMatrix(pokemon_data)
+    ids = matrix.top_k(matrix.score({"attack": 1, "speed": 1}), 20,
+                       mask=matrix.type_mask("Fire"))
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    from .indexes import normalize_number
+except ImportError:
+    from indexes import normalize_number
+
+STAT_COLUMNS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed", "total")
+
+# Last national dex number of each generation (generation 1 ends at #0151, ...)
+GENERATION_LAST_NUMBERS = (151, 251, 386, 493, 649, 721, 809, 905, 1025)
+
+
+class StatMatrix:
+    """Vectorized base-stat queries over the Pokemon dataset"""
+
+    def __init__(self, pokemon_data: List[Dict[str, Any]]):
+        count = len(pokemon_data)
+        self.stats = np.zeros((count, len(STAT_COLUMNS)), dtype=np.int16)
+        self.valid = np.zeros(count, dtype=bool)
+        numbers = np.zeros(count, dtype=np.int32)
+
+        type_names: Dict[str, int] = {}
+        self.type_labels: List[str] = []
+        type_rows: List[int] = []
+        type_cols: List[int] = []
+
+        for pokemon_id, pokemon in enumerate(pokemon_data):
+            numbers[pokemon_id] = normalize_number(pokemon.get("number")) or 0
+
+            base_stats = pokemon.get("base_stats") or {}
+            if base_stats:
+                row = [int(base_stats.get(stat) or 0) for stat in STAT_COLUMNS[:-1]]
+                row.append(int(base_stats.get("total") or sum(row)))
+                self.stats[pokemon_id] = row
+                self.valid[pokemon_id] = True
+
+            for type_name in pokemon.get("types") or []:
+                key = type_name.casefold()
+                if key not in type_names:
+                    type_names[key] = len(type_names)
+                    self.type_labels.append(type_name)
+                column = type_names[key]
+                type_rows.append(pokemon_id)
+                type_cols.append(column)
+
+        self.type_names = list(type_names)
+        self.type_matrix = np.zeros((count, len(type_names)), dtype=bool)
+        self.type_matrix[type_rows, type_cols] = True
+
+        self.generation = np.searchsorted(
+            np.array(GENERATION_LAST_NUMBERS), numbers, side="left"
+        ).astype(np.int8) + np.int8(1)
+        self.generation[numbers <= 0] = 0
+        self._sorted_columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.stats.shape[0]
+
+    @staticmethod
+    def _column_index(stat: str) -> int:
+        try:
+            return STAT_COLUMNS.index(stat)
+        except ValueError:
+            raise ValueError(
+                f"Unknown stat '{stat}'. Supported stats: {list(STAT_COLUMNS)}"
+            )
+
+    def column(self, stat: str) -> np.ndarray:
+        """One stat for every Pokemon (read-only view)"""
+        view = self.stats[:, self._column_index(stat)]
+        view.flags.writeable = False
+        return view
+
+    def count_compare(self, stat: str, op: str, value: int) -> int:
+        """
+        Number of valid Pokemon whose stat compares true against value, in
+        O(log n) from a sorted copy of the column (built once per stat)
+        """
+        sorted_values = self._sorted_columns.get(stat)
+        if sorted_values is None:
+            sorted_values = np.sort(self.column(stat)[self.valid])
+            self._sorted_columns[stat] = sorted_values
+        total = sorted_values.size
+        below = int(np.searchsorted(sorted_values, value, side="left"))
+        at_most = int(np.searchsorted(sorted_values, value, side="right"))
+        counts = {
+            ">": total - at_most,
+            ">=": total - below,
+            "<": below,
+            "<=": at_most,
+            "==": at_most - below,
+            "!=": total - (at_most - below),
+        }
+        if op not in counts:
+            raise ValueError(f"Unknown operator '{op}'")
+        return counts[op]
+
+    # ------------------------------------------------------------------
+    # Masks
+    # ------------------------------------------------------------------
+
+    def range_mask(
+        self, stat: str, minimum: Optional[int] = None, maximum: Optional[int] = None
+    ) -> np.ndarray:
+        """Pokemon whose stat lies in [minimum, maximum] (either bound optional)"""
+        values = self.stats[:, self._column_index(stat)]
+        mask = self.valid.copy()
+        if minimum is not None:
+            mask &= values >= minimum
+        if maximum is not None:
+            mask &= values <= maximum
+        return mask
+
+    def type_mask(self, type_name: str) -> np.ndarray:
+        """Pokemon that have a type"""
+        key = type_name.casefold()
+        if key not in self.type_names:
+            return np.zeros(len(self), dtype=bool)
+        return self.type_matrix[:, self.type_names.index(key)].copy()
+
+    def generation_mask(self, generation: int) -> np.ndarray:
+        """Pokemon introduced in a generation (by national dex number)"""
+        return self.generation == generation
+
+    def ids_mask(self, ids: Iterable[int]) -> np.ndarray:
+        """Boolean mask from Pokemon ids (e.g. an IdSet from grab_info)"""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[np.fromiter(ids, dtype=np.int64)] = True
+        return mask
+
+    # ------------------------------------------------------------------
+    # Scores and ranking
+    # ------------------------------------------------------------------
+
+    def score(self, weights: Dict[str, float]) -> np.ndarray:
+        """Weighted sum of stats, e.g. {"attack": 1, "speed": 1}"""
+        vector = np.zeros(len(STAT_COLUMNS), dtype=np.float32)
+        for stat, weight in weights.items():
+            vector[self._column_index(stat)] = weight
+        return self.stats @ vector
+
+    def top_k(
+        self, scores: np.ndarray, k: int, mask: Optional[np.ndarray] = None
+    ) -> List[int]:
+        """Ids of the k highest scores (optionally within mask), best first"""
+        candidates = self.valid if mask is None else mask & self.valid
+        candidate_ids = np.flatnonzero(candidates)
+        if k <= 0 or candidate_ids.size == 0:
+            return []
+
+        candidate_scores = scores[candidate_ids]
+        if k < candidate_ids.size:
+            top = np.argpartition(-candidate_scores, k - 1)[:k]
+        else:
+            top = np.arange(candidate_ids.size)
+        # Highest score first; ties keep dataset order
+        order = np.lexsort((candidate_ids[top], -candidate_scores[top]))
+        return candidate_ids[top][order].tolist()
+
+    def filter_ids(self, mask: np.ndarray) -> List[int]:
+        """Ids selected by a mask, ascending"""
+        return np.flatnonzero(mask & self.valid).tolist()
+
+    # ------------------------------------------------------------------
+    # Grouping
+    # ------------------------------------------------------------------
+
+    def _aggregate(self, membership: np.ndarray, values: np.ndarray, agg: str):
+        counts = membership.sum(axis=0)
+        if agg == "count":
+            return counts
+        if agg == "sum" or agg == "mean":
+            sums = membership.T.astype(np.int64) @ values.astype(np.int64)
+            if agg == "sum":
+                return sums
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return sums / counts
+        if agg in ("min", "max"):
+            fill = np.iinfo(np.int16).max if agg == "min" else np.iinfo(np.int16).min
+            grid = np.where(membership, values[:, None], fill)
+            result = grid.min(axis=0) if agg == "min" else grid.max(axis=0)
+            return np.where(counts > 0, result, 0)
+        raise ValueError(f"Unknown aggregate '{agg}'. Use count, sum, mean, min or max")
+
+    def group_by_generation(
+        self, stat: str = "total", agg: str = "mean"
+    ) -> Dict[int, float]:
+        """Aggregate a stat per generation"""
+        values = self.stats[:, self._column_index(stat)]
+        generations = sorted(int(g) for g in np.unique(self.generation[self.valid]))
+        membership = (
+            np.stack([(self.generation == g) & self.valid for g in generations], axis=1)
+            if generations
+            else np.zeros((len(self), 0), dtype=bool)
+        )
+        result = self._aggregate(membership, values, agg)
+        return {g: result[i].item() for i, g in enumerate(generations)}
+
+    def group_by_type(self, stat: str = "total", agg: str = "mean") -> Dict[str, float]:
+        """Aggregate a stat per type (dual-type Pokemon count towards both)"""
+        values = self.stats[:, self._column_index(stat)]
+        membership = self.type_matrix & self.valid[:, None]
+        result = self._aggregate(membership, values, agg)
+        return {label: result[i].item() for i, label in enumerate(self.type_labels)}
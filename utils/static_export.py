@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Static JSON API Export
+Writes the datasets as a tree of small, precompressed JSON files that any
+static file server can serve with no Python in the request path:
+
+    index.json                      dataset version, counts, entry points
+    pokemon/index.json              number, name, forms -> shard path
+    pokemon/{number}.json           every form of one national dex number
+    games/index.json                game, generation, region, Pokemon count
+    games/{game}.json               regional dex listing for one game
+    moves/index.json                generations with move counts
+    moves/gen{n}/index.json         move names -> shard path
+    moves/gen{n}/{move}.json        one move in one generation
+
+Every file has a gzip twin (file.json.gz, fixed mtime, so identical input
+gives identical bytes) for servers that send precompressed files (nginx
+gzip_static, Caddy precompressed). Re-exporting only rewrites shards whose
+content hash changed and removes shards that no longer exist; hashes are
+kept in _hashes.json at the root of the tree.
+
+Usage:
+    python utils/static_export.py [--out data/api]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List, Optional
+
+try:
+    from . import grab_info
+    from .projection import json_default
+except ImportError:
+    import grab_info
+    from projection import json_default
+
+EXPORT_FORMAT = 1
+DEFAULT_EXPORT_DIR = os.path.join(grab_info.data_dir(), "api")
+HASHES_FILENAME = "_hashes.json"
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", str(name).lower()).strip("-") or "unnamed"
+
+
+class _ShardWriter:
+    """Writes shards whose content changed, keeping a path -> hash manifest"""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self.hashes: Dict[str, str] = {}
+        self.written = 0
+        self.unchanged = 0
+        try:
+            with open(
+                os.path.join(out_dir, HASHES_FILENAME), "r", encoding="utf-8"
+            ) as f:
+                self.previous: Dict[str, str] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.previous = {}
+
+    def write(self, relative_path: str, payload: Any):
+        body = json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":"), default=json_default
+        ).encode("utf-8")
+        digest = hashlib.sha1(body).hexdigest()
+        self.hashes[relative_path] = digest
+
+        path = os.path.join(self.out_dir, relative_path)
+        if (
+            self.previous.get(relative_path) == digest
+            and os.path.exists(path)
+            and os.path.exists(f"{path}.gz")
+        ):
+            self.unchanged += 1
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        for target, data in (
+            (path, body),
+            (f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0)),
+        ):
+            tmp_path = f"{target}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, target)
+        self.written += 1
+
+    def finish(self) -> int:
+        """Remove shards from the previous export that were not written now"""
+        removed = 0
+        for relative_path in set(self.previous) - set(self.hashes):
+            for target in (relative_path, f"{relative_path}.gz"):
+                try:
+                    os.remove(os.path.join(self.out_dir, target))
+                except FileNotFoundError:
+                    continue
+            removed += 1
+
+        tmp_path = os.path.join(self.out_dir, f"{HASHES_FILENAME}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.hashes, f, indent=0, sort_keys=True)
+        os.replace(tmp_path, os.path.join(self.out_dir, HASHES_FILENAME))
+        return removed
+
+
+def _unique_slugs(names: List[str]) -> List[str]:
+    """One file-name slug per name, disambiguating slugs that collide"""
+    result = []
+    taken = set()
+    for name in names:
+        slug = base = _slug(name)
+        suffix = 2
+        while slug in taken:
+            slug = f"{base}-{suffix}"
+            suffix += 1
+        taken.add(slug)
+        result.append(slug)
+    return result
+
+
+def _export_pokemon(writer: _ShardWriter, pokemon_data: List[Any]) -> int:
+    by_number: Dict[str, List[Any]] = {}
+    for pokemon in pokemon_data:
+        digits = re.sub(r"\D", "", str(pokemon.get("number") or ""))
+        if digits:
+            by_number.setdefault(f"{int(digits):04d}", []).append(pokemon)
+
+    index = []
+    for number, forms in by_number.items():
+        path = f"pokemon/{number}.json"
+        writer.write(
+            path,
+            {
+                "number": forms[0].get("number"),
+                "name": forms[0].get("name"),
+                "forms": forms,
+            },
+        )
+        index.append(
+            {
+                "number": forms[0].get("number"),
+                "name": forms[0].get("name"),
+                "forms": [pokemon.get("form") for pokemon in forms],
+                "path": path,
+            }
+        )
+    writer.write("pokemon/index.json", index)
+    return len(index)
+
+
+def _export_games(writer: _ShardWriter, games_data: List[Dict[str, Any]]) -> int:
+    games = grab_info.game_availability_index()
+    generation_of = {}
+    for generation in games_data:
+        for game in generation.get("games") or []:
+            generation_of[game] = generation
+
+    names = list(generation_of) + [g for g in games.games() if g not in generation_of]
+    index = []
+    for game, slug in zip(names, _unique_slugs(names)):
+        generation = generation_of.get(game, {})
+        listing = games.listing(game)
+        path = f"games/{slug}.json"
+        writer.write(
+            path,
+            {
+                "game": game,
+                "generation": generation.get("generation"),
+                "region": generation.get("region"),
+                "platform": generation.get("platform"),
+                "release_year": generation.get("release_year"),
+                "pokemon": listing,
+            },
+        )
+        index.append(
+            {
+                "game": game,
+                "generation": generation.get("generation"),
+                "region": generation.get("region"),
+                "pokemon_count": len(listing),
+                "path": path,
+            }
+        )
+    writer.write("games/index.json", index)
+    return len(index)
+
+
+def _export_moves(writer: _ShardWriter) -> Dict[int, int]:
+    counts = {}
+    for generation in grab_info.get_move_generations():
+        moves = [
+            move for move in grab_info.get_all_moves(generation) if move.get("name")
+        ]
+        index = []
+        for move, slug in zip(moves, _unique_slugs([m["name"] for m in moves])):
+            shard = f"moves/gen{generation}/{slug}.json"
+            writer.write(shard, move)
+            index.append({"name": move["name"], "path": shard})
+        writer.write(f"moves/gen{generation}/index.json", index)
+        counts[generation] = len(index)
+
+    writer.write(
+        "moves/index.json",
+        [
+            {
+                "generation": gen,
+                "move_count": count,
+                "path": f"moves/gen{gen}/index.json",
+            }
+            for gen, count in counts.items()
+        ],
+    )
+    return counts
+
+
+def export_static_api(out_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Export the current datasets to out_dir (default data/api). Returns a
+    summary with the number of shards written, left unchanged and removed.
+    """
+    out_dir = out_dir or DEFAULT_EXPORT_DIR
+    os.makedirs(out_dir, exist_ok=True)
+    writer = _ShardWriter(out_dir)
+
+    counts = {
+        "pokemon": _export_pokemon(writer, grab_info.get_all_pokemon()),
+        "games": _export_games(writer, grab_info.get_all_generations()),
+        "moves": _export_moves(writer),
+    }
+    writer.write(
+        "index.json",
+        {
+            "format": EXPORT_FORMAT,
+            "version": grab_info.dataset_version(),
+            "counts": counts,
+            "indexes": {
+                "pokemon": "pokemon/index.json",
+                "games": "games/index.json",
+                "moves": "moves/index.json",
+            },
+        },
+    )
+    removed = writer.finish()
+    return {
+        "out_dir": out_dir,
+        "shards": len(writer.hashes),
+        "written": writer.written,
+        "unchanged": writer.unchanged,
+        "removed": removed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a static JSON API tree")
+    parser.add_argument("--out", default=DEFAULT_EXPORT_DIR, help="output directory")
+    args = parser.parse_args()
+
+    summary = export_static_api(args.out)
+    print(
+        f"Exported {summary['shards']} shards to {summary['out_dir']}: "
+        f"{summary['written']} written, {summary['unchanged']} unchanged, "
+        f"{summary['removed']} removed"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
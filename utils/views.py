@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Materialized Views
+Precomputed per-game dex listings, per-generation game lists and
+per-region rollups, written to data/views/ whenever pokemon_data.json or
+pokemon_games.json is saved, so readers can serve them without loading or
+indexing the full Pokemon dataset.
+
+Layout:
+    data/views/manifest.json      version stamp, source signatures,
+                                  game -> {file, count}
+    data/views/generations.json   per generation: region, platform, year,
+                                  games with Pokemon counts
+    data/views/regions.json       per region: generations, games,
+                                  platforms, distinct Pokemon available
+    data/views/games/<game>.json  regional dex listing as columns + rows
+
+Every file carries the same "version": a hash of the size and mtime of the
+two source files. Readers only trust views whose version matches the
+sources as they are now; anything else is treated as missing. Views are
+only written by save paths and explicit refreshes, never by a query.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from .indexes import GameAvailabilityIndex
+    from .snapshot import load_dataset
+except ImportError:
+    from indexes import GameAvailabilityIndex
+    from snapshot import load_dataset
+
+VIEWS_FORMAT = 1
+VIEWS_DIRNAME = "views"
+POKEMON_FILENAME = "pokemon_data.json"
+GAMES_FILENAME = "pokemon_games.json"
+
+# Source files whose saves trigger a rebuild
+VIEW_SOURCES = (POKEMON_FILENAME, GAMES_FILENAME)
+
+LISTING_COLUMNS = ("name", "national_number", "game_dex_number")
+
+
+def views_version(data_dir: str) -> Optional[str]:
+    """Version stamp for the current source files (None if one is missing)"""
+    signature = []
+    for filename in VIEW_SOURCES:
+        try:
+            stat = os.stat(os.path.join(data_dir, filename))
+        except FileNotFoundError:
+            return None
+        signature.append((filename, stat.st_size, stat.st_mtime_ns))
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:16]
+
+
+def _game_filename(game: str, taken: set) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "_", game.lower()).strip("_") or "game"
+    filename = f"{slug}.json"
+    suffix = 2
+    while filename in taken:
+        filename = f"{slug}_{suffix}.json"
+        suffix += 1
+    taken.add(filename)
+    return filename
+
+
+def _write_json(payload: Any, path: str):
+    # Unique temp name: concurrent builders must not rename each other's files
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _materialize(
+    pokemon_data: List[Dict[str, Any]], games_data: Any
+) -> Tuple[Dict[str, List[List[Any]]], List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Per-game listing rows, generation summaries and region rollups"""
+    index = GameAvailabilityIndex(pokemon_data)
+    listings = {
+        game: [
+            [entry[column] for column in LISTING_COLUMNS]
+            for entry in index.listing(game)
+        ]
+        for game in index.games()
+    }
+
+    generations = []
+    regions: Dict[str, Dict[str, Any]] = {}
+    for generation in games_data if isinstance(games_data, list) else []:
+        games = generation.get("games") or []
+        generations.append(
+            {
+                "generation": generation.get("generation"),
+                "region": generation.get("region"),
+                "platform": generation.get("platform"),
+                "release_year": generation.get("release_year"),
+                "games": [
+                    {"game": game, "pokemon_count": index.count(game)} for game in games
+                ],
+            }
+        )
+
+        region = regions.setdefault(
+            generation.get("region") or "Unknown",
+            {"generations": [], "games": [], "platforms": [], "_bits": 0},
+        )
+        region["generations"].append(generation.get("generation"))
+        region["games"].extend(games)
+        if generation.get("platform") not in region["platforms"]:
+            region["platforms"].append(generation.get("platform"))
+        for game in games:
+            region["_bits"] |= index.in_game(game).bits
+
+    for region in regions.values():
+        region["pokemon_available"] = region.pop("_bits").bit_count()
+    return listings, generations, regions
+
+
+def build_views(
+    data_dir: str,
+    pokemon_data: Optional[List[Dict[str, Any]]] = None,
+    games_data: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Materialize every view from the current sources. Pass already-loaded
+    data to skip re-reading it. Returns the manifest, or None when a source
+    file does not exist yet.
+    """
+    version = views_version(data_dir)
+    if version is None:
+        return None
+    if pokemon_data is None:
+        pokemon_data = load_dataset(os.path.join(data_dir, POKEMON_FILENAME))
+    if games_data is None:
+        games_data = load_dataset(os.path.join(data_dir, GAMES_FILENAME))
+
+    views_dir = os.path.join(data_dir, VIEWS_DIRNAME)
+    games_dir = os.path.join(views_dir, "games")
+    os.makedirs(games_dir, exist_ok=True)
+
+    listings, generations, regions = _materialize(pokemon_data, games_data)
+    manifest_games = {}
+    taken = set()
+    for game, rows in listings.items():
+        filename = _game_filename(game, taken)
+        _write_json(
+            {
+                "version": version,
+                "game": game,
+                "columns": list(LISTING_COLUMNS),
+                "rows": rows,
+            },
+            os.path.join(games_dir, filename),
+        )
+        manifest_games[game] = {"file": filename, "count": len(rows)}
+
+    # Listings of games that no longer have any Pokemon
+    for filename in os.listdir(games_dir):
+        if filename.endswith(".json") and filename not in taken:
+            os.remove(os.path.join(games_dir, filename))
+
+    _write_json(
+        {"version": version, "generations": generations},
+        os.path.join(views_dir, "generations.json"),
+    )
+    _write_json(
+        {"version": version, "regions": regions},
+        os.path.join(views_dir, "regions.json"),
+    )
+
+    # Manifest last: readers treat it as the commit point
+    manifest = {
+        "format": VIEWS_FORMAT,
+        "version": version,
+        "sources": list(VIEW_SOURCES),
+        "games": manifest_games,
+    }
+    _write_json(manifest, os.path.join(views_dir, "manifest.json"))
+    return manifest
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _current_manifest(data_dir: str) -> Optional[Dict[str, Any]]:
+    version = views_version(data_dir)
+    if version is None:
+        return None
+    manifest = _read_json(os.path.join(data_dir, VIEWS_DIRNAME, "manifest.json"))
+    if (
+        manifest is None
+        or manifest.get("format") != VIEWS_FORMAT
+        or manifest.get("version") != version
+    ):
+        return None
+    return manifest
+
+
+def views_are_current(data_dir: str) -> bool:
+    """True if data/views was built from the source files as they are now"""
+    return _current_manifest(data_dir) is not None
+
+
+def refresh_views_after_save(file_path: str, data: Any = None):
+    """
+    Save hook: rebuild the views if file_path is one of their sources.
+    data is the content just written (reused instead of re-reading it).
+    """
+    filename = os.path.basename(file_path)
+    if filename not in VIEW_SOURCES:
+        return
+    data_dir = os.path.dirname(os.path.abspath(file_path))
+    try:
+        if filename == POKEMON_FILENAME:
+            build_views(data_dir, pokemon_data=data)
+        else:
+            build_views(data_dir, games_data=data)
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        print(f"Warning: Could not rebuild materialized views: {e}")
+
+
+class MaterializedViews:
+    """
+    The views held in memory. load() reads data/views once (None when the
+    files are missing or were built from different sources); from_data()
+    computes the same views from loaded datasets without writing anything.
+    """
+
+    def __init__(
+        self,
+        listings: Dict[str, List[List[Any]]],
+        generations: List[Dict[str, Any]],
+        regions: Dict[str, Dict[str, Any]],
+        columns: Tuple[str, ...] = LISTING_COLUMNS,
+    ):
+        self._listings = listings
+        self._generations = generations
+        self._regions = regions
+        self._columns = tuple(columns)
+
+    @classmethod
+    def load(cls, data_dir: str) -> Optional["MaterializedViews"]:
+        manifest = _current_manifest(data_dir)
+        if manifest is None:
+            return None
+        version = manifest["version"]
+        views_dir = os.path.join(data_dir, VIEWS_DIRNAME)
+
+        payloads = [
+            _read_json(os.path.join(views_dir, "generations.json")),
+            _read_json(os.path.join(views_dir, "regions.json")),
+        ]
+        listings = {}
+        columns = LISTING_COLUMNS
+        for game, entry in manifest["games"].items():
+            payload = _read_json(os.path.join(views_dir, "games", entry["file"]))
+            payloads.append(payload)
+            if payload is not None:
+                listings[game] = payload["rows"]
+                columns = payload["columns"]
+        # A rebuild may have replaced some files while they were being read
+        if any(p is None or p.get("version") != version for p in payloads):
+            return None
+        return cls(
+            listings, payloads[0]["generations"], payloads[1]["regions"], columns
+        )
+
+    @classmethod
+    def from_data(
+        cls, pokemon_data: List[Dict[str, Any]], games_data: Any
+    ) -> "MaterializedViews":
+        return cls(*_materialize(pokemon_data, games_data))
+
+    def listing(self, game: str) -> List[Dict[str, Any]]:
+        """Regional dex listing for a game ([] if no Pokemon are available)"""
+        columns = self._columns
+        return [dict(zip(columns, row)) for row in self._listings.get(game, ())]
+
+    def count(self, game: str) -> int:
+        """Number of Pokemon available in a game"""
+        return len(self._listings.get(game, ()))
+
+    def generations(self) -> List[Dict[str, Any]]:
+        """Per-generation game lists with Pokemon counts"""
+        return self._generations
+
+    def regions(self) -> Dict[str, Dict[str, Any]]:
+        """Per-region rollups"""
+        return self._regions